@@ -9,6 +9,27 @@ from ..entry import BibliographyEntry
 class BibliographyAdapter(abc.ABC):
     """Abstract class representing the backend to a bibliography."""
 
+    def get_version(self) -> t.Optional[t.Hashable]:
+        """Return a token that identifies the current version of the bibliography source.
+
+        The token should change whenever the source is modified. It is used to determine whether a previously parsed
+        bibliography is still up to date. The base implementation returns ``None`` which signifies that the version
+        cannot be determined and so the bibliography will always be parsed anew.
+
+        :return: a hashable token identifying the current version of the source, or ``None`` if it cannot be determined.
+        """
+        return None
+
+    def get_content_hash(self) -> t.Optional[str]:
+        """Return a hash of the current content of the bibliography source.
+
+        The hash can be used as a validator for responses that are derived from the bibliography. The base
+        implementation returns ``None`` which signifies that the hash cannot be determined.
+
+        :return: the hexadecimal hash of the content of the source, or ``None`` if it cannot be determined.
+        """
+        return None
+
     @abc.abstractmethod
     def get_entries(self) -> t.List[BibliographyEntry]:
         """Return the list of bibliography entries."""
@@ -31,6 +52,32 @@ class BibliographyAdapter(abc.ABC):
         :param entry: bibliographic entry to write formatted to stream.
         """
 
+    def get_entry_source(self, identifier: str) -> t.Optional[str]:
+        """Return a single bibliographic entry formatted as text, as written by :meth:`write_entry`.
+
+        This allows to retrieve a single entry without having to parse all entries of the bibliography. The base
+        implementation raises ``NotImplementedError``, in which case the entry should be retrieved from the parsed
+        bibliography instead.
+
+        :param identifier: the identifier of the entry.
+        :return: the formatted entry or ``None`` if the bibliography does not contain an entry with that identifier.
+        :raises ``NotImplementedError``: if the adapter does not support retrieving a single entry.
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def save_entries(self, entries: t.List[BibliographyEntry]) -> None:
         """Save the list of entries to the bibliography."""
+
+    def append_entries(self, entries: t.List[BibliographyEntry]) -> None:
+        """Append the list of entries to the bibliography without rewriting the entries that it already contains.
+
+        The base implementation raises ``NotImplementedError``, in which case the entire bibliography is rewritten
+        through :meth:`save_entries` instead.
+
+        :param entries: list of new bibliographic entries to append.
+        :raises :class:`bibliography.exceptions.DuplicateEntryError`: if the bibliography already contains any of the
+            entries, for example because they were appended concurrently through another instance.
+        :raises ``NotImplementedError``: if the adapter does not support appending entries.
+        """
+        raise NotImplementedError
@@ -1,31 +1,229 @@
 # -*- coding: utf-8 -*-
 """Implementation of :class:`biblary.bibliography.adapter.BibliographyAdapter` that builds from a Bibtex file."""
+import collections
+from concurrent.futures import ProcessPoolExecutor
 import dataclasses
+import functools
+import hashlib
 import io
+import itertools
+import os
 import pathlib
 import shutil
 import tempfile
+import threading
 import typing as t
+import unicodedata
 
-from bibtexparser import customization, load
-from bibtexparser.bibdatabase import BibDatabase
+from bibtexparser import customization, latexenc, load
+from bibtexparser.bibdatabase import COMMON_STRINGS, STANDARD_TYPES, BibDatabase
 from bibtexparser.bparser import BibTexParser
 from bibtexparser.bwriter import BibTexWriter
 
-from ..entry import BibliographyEntry
-from ..exceptions import BibliographicEntryParsingError
+from ..entry import BibliographyEntry, LazyBibliographyEntry
+from ..exceptions import BibliographicEntryParsingError, DuplicateEntryError
+from ..locks import file_lock
 from .abstract import BibliographyAdapter
+from .scanner import EntrySpan, scan_entries
+from .snapshot import read_snapshot, write_snapshot
+from .tokenizer import iter_records
+
+_LATEX_REPLACEMENTS = [
+    (latex.rstrip(), character)
+    for character, latex in itertools.chain(latexenc.unicode_to_crappy_latex1, latexenc.unicode_to_latex)
+]
+_LATEX_REPLACEMENTS_CRAPPY = [(latex.rstrip(), character) for character, latex in latexenc.unicode_to_crappy_latex2]
+
+_REPLACE_LATEX = getattr(latexenc, '_replace_latex', None)
+"""Private function of ``bibtexparser`` that replaces a single LaTeX command, or ``None`` if it no longer exists."""
+
+_WRITER = BibTexWriter()
+_WRITER.indent = '    '
+
+
+def _replace_all_latex(string: str, replacements: t.List[t.Tuple[str, str]]) -> str:
+    """Apply all replacements of LaTeX commands whose command occurs in the given string, in order."""
+    for latex, character in replacements:
+        if latex in string:
+            string = _REPLACE_LATEX(string, latex, character)
+    return string
+
+
+def _latex_to_unicode(string: str) -> str:
+    """Convert a LaTeX string to its unicode equivalent.
+
+    This is equivalent to :func:`bibtexparser.latexenc.latex_to_unicode` except that the list of replacements is
+    prepared once and only the replacements whose command occurs in the string are applied, which is more than an order
+    of magnitude faster. Since it relies on a private function of :mod:`bibtexparser.latexenc`, the version of
+    ``bibtexparser`` is pinned and the equivalence is guarded by the tests. If the private function does not exist, the
+    string is converted by :func:`bibtexparser.latexenc.latex_to_unicode` instead.
+    """
+    if _REPLACE_LATEX is None:
+        return latexenc.latex_to_unicode(string)
+
+    if '\\' in string or '{' in string:
+        string = _replace_all_latex(string, _LATEX_REPLACEMENTS)
+
+    string = string.replace('{', '').replace('}', '')
+
+    if '\\' in string or '{' in string:
+        string = _replace_all_latex(string, _LATEX_REPLACEMENTS_CRAPPY)
+
+    return unicodedata.normalize('NFC', string)
+
+
+def _parse_chunk(content: str, engine: str) -> t.List[BibliographyEntry]:
+    """Parse the bibliographic entries from a chunk of the content of a Bibtex file.
+
+    This is defined at the module level, such that it can be submitted to a :class:`ProcessPoolExecutor`.
+
+    :param content: the chunk of content to parse.
+    :param engine: the engine to use to parse the content.
+    :return: list of parsed bibliographic entries.
+    """
+    return BibtexBibliography._parse_records(io.StringIO(content), engine)  # pylint: disable=protected-access
+
+
+class _LazyDecoder:
+    """Decoder of the fields of a :class:`biblary.bibliography.entry.LazyBibliographyEntry` from its raw content.
+
+    The raw content is tokenized when the first field is decoded, after which each field is transformed individually
+    in the same way as the fields of an entry that is parsed by :class:`BibtexBibliography`.
+    """
+
+    __slots__ = ('content', 'macros', 'record')
+
+    def __init__(self, content: bytes, macros: t.Dict[str, str]):
+        """Construct a new instance.
+
+        :param content: the raw content of the entry.
+        :param macros: the ``@string`` macros that can be referenced by the entry, keyed by their lowercase name.
+        """
+        self.content = content
+        self.macros = macros
+        self.record: t.Optional[t.Dict[str, str]] = None
+
+    def __call__(self, name: str) -> t.Any:
+        """Return the value of the field with the given name or ``None`` if the entry does not define it.
+
+        If the raw content of the entry is invalid, for example because it references an undefined ``@string`` macro,
+        all of its fields are ``None``.
+        """
+        if self.record is None:
+            try:
+                records = list(iter_records(self.content.decode('utf-8'), self.macros))
+            except BibliographicEntryParsingError:
+                records = []
+            self.record = records[0] if records else {}
+
+        value = self.record.get(name, None)
+
+        if value is None:
+            return None
+
+        return BibtexBibliography._customize_record({name: value}).get(name, None)  # pylint: disable=protected-access
 
 
 class BibtexBibliography(BibliographyAdapter):
     """Implementation of :class:`biblary.bibliography.adapter.BibliographyAdapter` that builds from a Bibtex file."""
 
-    def __init__(self, filepath: pathlib.Path, *_, **__):
+    ENGINES = ('bibtexparser', 'native')
+    """Engines that can be used to parse the Bibtex file.
+
+    The ``bibtexparser`` engine uses the ``BibTexParser`` of the ``bibtexparser`` library. The ``native`` engine uses
+    the streaming tokenizer of :mod:`biblary.bibliography.adapter.tokenizer`, which yields identical entries but is
+    significantly faster.
+    """
+
+    def __init__(
+        self,
+        filepath: pathlib.Path,
+        *_,
+        snapshot: bool = False,
+        engine: str = 'bibtexparser',
+        lazy: bool = False,
+        workers: int = 1,
+        parallel_threshold: int = 4 * 1024 * 1024,
+        **__
+    ):
         """Construct a new instance.
 
         :param filepath: absolute filepath to a Bibtex file containing the bibliographic entries.
+        :param engine: the engine to use to parse the Bibtex file, should be one of :attr:`ENGINES`.
+        :param snapshot: boolean, when ``True``, a snapshot of the parsed entries is written next to the Bibtex file. As
+            long as the content of the Bibtex file does not change, the entries are loaded from the snapshot instead of
+            being parsed from the Bibtex file, which is significantly faster.
+        :param lazy: boolean, when ``True``, the Bibtex file is only scanned for the type and identifier of its entries
+            and :class:`biblary.bibliography.entry.LazyBibliographyEntry` instances are returned, whose other fields are
+            decoded from the raw content of the entry when first accessed. The ``engine`` and ``snapshot`` options are
+            ignored in this mode.
+        :param workers: the number of processes to use to parse the Bibtex file. If larger than one, the content is
+            split into chunks at the boundaries of the entries, which are parsed in parallel by a process pool.
+        :param parallel_threshold: the minimum size in bytes of the content that has to be parsed for it to be parsed in
+            parallel, since for smaller content the overhead of starting the processes outweighs the gain.
         """
+        if engine not in self.ENGINES:
+            raise ValueError(f'invalid engine `{engine}`, should be one of: {", ".join(self.ENGINES)}.')
+
         self.filepath = filepath
+        self.snapshot = snapshot
+        self.engine = engine
+        self.lazy = lazy
+        self.workers = workers
+        self.parallel_threshold = parallel_threshold
+        self._lock = threading.Lock()
+        self._macros_digest: t.Optional[bytes] = None
+        self._parsed: t.Dict[bytes, t.Optional[BibliographyEntry]] = {}
+        self._macros: t.Dict[str, str] = {}
+        self._index: t.Dict[str, EntrySpan] = {}
+        self._index_macros: t.Tuple[bytes, bytes] = (b'', b'')
+        self._index_version: t.Optional[t.Tuple[int, int, int]] = None
+        self._rendered: t.Dict[bytes, t.Optional[str]] = {}
+        self._content_hash: t.Tuple[t.Optional[t.Tuple[int, int, int]], t.Optional[str]] = (None, None)
+
+    @property
+    def filepath_snapshot(self) -> pathlib.Path:
+        """Return the filepath of the snapshot of the parsed entries, which is written next to the Bibtex file."""
+        return self.filepath.with_name(f'{self.filepath.name}.snapshot')
+
+    @property
+    def filepath_lock(self) -> pathlib.Path:
+        """Return the filepath of the lock that serializes writes to the Bibtex file, which is created next to it."""
+        return self.filepath.with_name(f'{self.filepath.name}.lock')
+
+    def get_version(self) -> t.Optional[t.Tuple[int, int, int]]:
+        """Return a token that identifies the current version of the Bibtex file.
+
+        The token consists of the inode, size and modification time in nanoseconds of the file, which means that it can
+        be determined without having to read the content of the file.
+
+        :return: tuple of the inode, size and modification time of the file, or ``None`` if it does not exist.
+        """
+        try:
+            stat = self.filepath.stat()
+        except OSError:
+            return None
+
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def get_content_hash(self) -> t.Optional[str]:
+        """Return the SHA-256 hash of the current content of the Bibtex file.
+
+        The hash is memoized for the current version of the Bibtex file, as returned by :meth:`get_version`, so the file
+        is only read again when it changes.
+
+        :return: the hexadecimal hash of the content, or ``None`` if the file does not exist.
+        """
+        version = self.get_version()
+
+        if version is None:
+            return None
+
+        with self._lock:
+            if self._content_hash[0] != version:
+                self._content_hash = (version, hashlib.sha256(self.filepath.read_bytes()).hexdigest())
+
+            return self._content_hash[1]
 
     @staticmethod
     def _transform_authors(record):
@@ -33,14 +231,31 @@ class BibtexBibliography(BibliographyAdapter):
 
         This will essentially transform "Oppenheimer, Robert" into "Robert Oppenheimer".
         """
-        record['author'] = [' '.join(author.split(',')[::-1]).strip() for author in record['author']]
+        if 'author' in record:
+            record['author'] = [' '.join(author.split(',')[::-1]).strip() for author in record['author']]
+        return record
+
+    @staticmethod
+    def _convert_to_unicode(record):
+        """Convert LaTeX accents in all values of the record to unicode.
+
+        This is equivalent to :func:`bibtexparser.customization.convert_to_unicode` but significantly faster.
+        """
+        for key, value in record.items():
+            if isinstance(value, list):
+                record[key] = [_latex_to_unicode(element) for element in value]
+            elif isinstance(value, dict):
+                record[key] = {name: _latex_to_unicode(element) for name, element in value.items()}
+            else:
+                record[key] = _latex_to_unicode(value)
+
         return record
 
     @classmethod
     def _customize_record(cls, record):
         """Apply a set of transformations on the provided record."""
         transformers = (
-            customization.convert_to_unicode,
+            cls._convert_to_unicode,
             customization.keyword,
             customization.page_double_hyphen,
             customization.type,
@@ -78,22 +293,51 @@ class BibtexBibliography(BibliographyAdapter):
         )
 
     @classmethod
-    def _parse_bibliography(cls, filelike: t.TextIO) -> t.List[BibliographyEntry]:
+    def _iter_entries(cls, content: str) -> t.Iterator[BibliographyEntry]:
+        """Yield the bibliographic entries parsed from a string containing a ``.bib`` bibliography.
+
+        The content is parsed in a single pass by the streaming tokenizer and the entries are yielded as soon as they
+        are parsed. The records are transformed in exactly the same way as those that are parsed by ``bibtexparser``.
+
+        :param content: the content to parse.
+        :raises :class:`bibliography.exceptions.BibliographicEntryParsingError`: if an entry references an undefined
+            string macro.
+        """
+        for record in iter_records(content):
+            yield cls._convert_entry(cls._customize_record(record))
+
+    @classmethod
+    def _parse_records(cls, filelike: t.TextIO, engine: str = 'bibtexparser') -> t.List[BibliographyEntry]:
         """Parse bibliographic entries from a text stream that should contain a ``.bib`` bibliography.
 
         :param filelike: a filelike object containing the content to parse.
-        :return: list of parsed bibliographic entries.
-        :raises :class:`bibliography.exceptions.BibliographicEntryParsingError`: if parsing fails.
+        :param engine: the engine to use to parse the content, should be one of :attr:`ENGINES`.
+        :return: list of parsed bibliographic entries, which can be empty if the content contains no valid entries.
         """
+        if engine == 'native':
+            return list(cls._iter_entries(filelike.read()))
+
         parser = BibTexParser()
         parser.customization = cls._customize_record
 
         database = load(filelike, parser=parser)
 
-        if not database.entries or not database.entries[0]:
+        return [cls._convert_entry(entry) for entry in database.entries if entry]
+
+    @classmethod
+    def _parse_bibliography(cls, filelike: t.TextIO) -> t.List[BibliographyEntry]:
+        """Parse bibliographic entries from a text stream that should contain a ``.bib`` bibliography.
+
+        :param filelike: a filelike object containing the content to parse.
+        :return: list of parsed bibliographic entries.
+        :raises :class:`bibliography.exceptions.BibliographicEntryParsingError`: if parsing fails.
+        """
+        entries = cls._parse_records(filelike)
+
+        if not entries:
             raise BibliographicEntryParsingError('failed to parse entries from bibliography.')
 
-        return [cls._convert_entry(entry) for entry in database.entries]
+        return entries
 
     @classmethod
     def parse_entry(cls, content: str) -> BibliographyEntry:
@@ -105,14 +349,307 @@ class BibtexBibliography(BibliographyAdapter):
         """
         return cls._parse_bibliography(io.StringIO(content))[0]
 
+    @staticmethod
+    def _match_entries(
+        spans: t.List[EntrySpan],
+        entries: t.List[BibliographyEntry],
+    ) -> t.Dict[bytes, t.Optional[BibliographyEntry]]:
+        """Match the entries that were parsed from the given spans to those spans.
+
+        If an entry was parsed for each span, they are matched by order. Otherwise, some spans did not produce an entry,
+        for example because they are not valid, and the entries are matched by their identifier instead.
+
+        :param spans: the spans from which the entries were parsed.
+        :param entries: the entries parsed from the spans, in the same order.
+        :returns: mapping of the digest of each span onto its parsed entry, or ``None`` if it did not produce one.
+        """
+        if len(spans) == len(entries):
+            return {span.digest: entry for span, entry in zip(spans, entries)}
+
+        entries_by_identifier: t.Dict[str, t.Deque[BibliographyEntry]] = collections.defaultdict(collections.deque)
+
+        for entry in entries:
+            entries_by_identifier[entry.identifier].append(entry)
+
+        matched = {}
+
+        for span in spans:
+            candidates = entries_by_identifier.get(span.identifier, None)
+            matched[span.digest] = candidates.popleft() if candidates else None
+
+        return matched
+
+    @staticmethod
+    def _get_spans_hash(spans: t.List[EntrySpan]) -> str:
+        """Return the hash of the given spans, which identifies the entries that are parsed from them.
+
+        The hash is derived from the digests of the raw content of the spans, which are computed when the content is
+        scanned, so the content does not have to be hashed again. Content outside of the spans, such as whitespace
+        between entries, does not affect the hash.
+
+        :param spans: the spans of all entries in the content of the Bibtex file.
+        """
+        return hashlib.sha256(b''.join(span.digest for span in spans)).hexdigest()
+
+    @staticmethod
+    def _get_macros(content: bytes, spans: t.List[EntrySpan]) -> t.Tuple[bytes, bytes]:
+        """Return the raw content of all ``@string`` macro definitions and its digest.
+
+        :param content: the content of the Bibtex file.
+        :param spans: the spans of all entries in the content.
+        :return: tuple of the concatenated macro definitions and its digest.
+        """
+        macros = b'\n'.join(content[span.start:span.end] for span in spans if span.entry_type == 'string')
+        return macros, hashlib.blake2b(macros, digest_size=16).digest()
+
+    def _split_chunks(self, spans: t.List[EntrySpan]) -> t.List[t.List[EntrySpan]]:
+        """Split the given spans into consecutive chunks of roughly equal size that can be parsed in parallel.
+
+        The spans are split into as many chunks as there are :attr:`workers`, but only if their total size exceeds the
+        :attr:`parallel_threshold`. Otherwise, a single chunk with all spans is returned.
+
+        :param spans: the spans to split.
+        :return: list of chunks of spans, in the order of the spans.
+        """
+        size = sum(span.end - span.start for span in spans)
+
+        if self.workers <= 1 or size < self.parallel_threshold or len(spans) < 2:
+            return [spans]
+
+        chunk_size = size / min(self.workers, len(spans))
+        chunks: t.List[t.List[EntrySpan]] = [[]]
+        chunk_total = 0
+
+        for span in spans:
+            if chunks[-1] and chunk_total >= chunk_size * len(chunks):
+                chunks.append([])
+            chunks[-1].append(span)
+            chunk_total += span.end - span.start
+
+        return chunks
+
+    def _parse_spans(self, content: bytes, spans: t.List[EntrySpan]) -> t.List[BibliographyEntry]:
+        """Return the entries of the given spans, parsing only those spans that changed since the last time.
+
+        The entries parsed for each span are kept in an index keyed on the digest of the span. Only spans whose digest
+        is not yet in the index are parsed, so the cost of parsing scales with the number of entries that changed, were
+        added or were deleted. Since ``@string`` macros may be referenced by any entry, all spans are parsed again if
+        any of the macro definitions has changed.
+
+        If the changed spans are split into multiple chunks by :meth:`_split_chunks`, the chunks are parsed in parallel
+        in a process pool. Each chunk is prefixed with all macro definitions, such that they are shared across chunks.
+
+        :param content: the content of the Bibtex file.
+        :param spans: the spans of all entries in the content.
+        :return: list of bibliographic entries in the order of the spans.
+        """
+        macros, macros_digest = self._get_macros(content, spans)
+        spans = [span for span in spans if span.identifier is not None]
+
+        if macros_digest != self._macros_digest:
+            self._parsed = {}
+            self._macros_digest = macros_digest
+
+        changed = [span for span in spans if span.digest not in self._parsed]
+
+        if changed:
+            chunks = self._split_chunks(changed)
+            texts = []
+
+            for chunk in chunks:
+                texts.append(b'\n'.join([macros] + [content[span.start:span.end] for span in chunk]).decode('utf-8'))
+
+            if len(texts) > 1:
+                with ProcessPoolExecutor(max_workers=len(texts)) as executor:
+                    results = list(executor.map(_parse_chunk, texts, itertools.repeat(self.engine)))
+            else:
+                results = [_parse_chunk(texts[0], self.engine)]
+
+            for chunk, entries in zip(chunks, results):
+                self._parsed.update(self._match_entries(chunk, entries))
+
+        self._parsed = {span.digest: self._parsed[span.digest] for span in spans}
+
+        return [entry for entry in (self._parsed[span.digest] for span in spans) if entry is not None]
+
+    def _scan_spans(self, content: bytes, spans: t.List[EntrySpan]) -> t.List[BibliographyEntry]:
+        """Return lazy entries for the given spans, whose fields are only decoded when first accessed.
+
+        Just like :meth:`_parse_spans`, the entries are kept in an index keyed on the digest of the span, such that the
+        entries, including the fields that they already decoded, are reused as long as the span does not change.
+
+        :param content: the content of the Bibtex file.
+        :param spans: the spans of all entries in the content.
+        :return: list of lazy bibliographic entries in the order of the spans.
+        """
+        macros, macros_digest = self._get_macros(content, spans)
+        spans = [
+            span for span in spans if span.entry_type in STANDARD_TYPES and span.identifier and
+            not any(character.isspace() for character in span.identifier)
+        ]
+
+        if macros_digest != self._macros_digest:
+            self._parsed = {}
+            self._macros = dict(COMMON_STRINGS)
+            self._macros_digest = macros_digest
+            collections.deque(iter_records(macros.decode('utf-8'), self._macros), maxlen=0)
+
+        parsed = {}
+
+        for span in spans:
+            entry = self._parsed.get(span.digest, None)
+
+            if entry is None:
+                decoder = _LazyDecoder(content[span.start:span.end], self._macros)
+                entry = LazyBibliographyEntry(span.entry_type, span.identifier, decoder)
+
+            parsed[span.digest] = entry
+
+        self._parsed = parsed
+
+        return [self._parsed[span.digest] for span in spans]
+
     def get_entries(self) -> t.List[BibliographyEntry]:
         """Return the list of bibliography entries.
 
+        The adapter keeps an index of the entries it parsed, keyed on the digest of their raw content in the Bibtex
+        file. When called again, only the entries whose raw content changed are parsed again.
+
+        If snapshots are enabled, the entries are loaded from the snapshot if it is still valid for the current entries
+        of the Bibtex file, see :meth:`_get_spans_hash`. Otherwise, the entries are parsed from the Bibtex file and the
+        snapshot is rewritten. Changes to the content between entries therefore do not cause the snapshot to be
+        rewritten.
+
+        In lazy mode, the Bibtex file is only scanned and the fields of the entries are decoded when first accessed.
+        Entries that are invalid are therefore not detected until their fields are accessed, at which point all of their
+        fields are ``None``.
+
         :return: list of bibliographic entries.
         :raises :class:`bibliography.exceptions.BibliographicEntryParsingError`: if parsing fails.
         """
-        with self.filepath.open() as handle:
-            return self._parse_bibliography(handle)
+        with self._lock:
+            content = self.filepath.read_bytes()
+            spans = list(scan_entries(content))
+            entries = None
+
+            if self.lazy:
+                entries = self._scan_spans(content, spans)
+
+                if not entries:
+                    raise BibliographicEntryParsingError('failed to parse entries from bibliography.')
+
+                return entries
+
+            if self.snapshot:
+                content_hash = self._get_spans_hash(spans)
+                entries = read_snapshot(self.filepath_snapshot, content_hash)
+
+            if entries is not None:
+                _, self._macros_digest = self._get_macros(content, spans)
+                self._parsed = self._match_entries([span for span in spans if span.identifier is not None], entries)
+                return entries
+
+            entries = self._parse_spans(content, spans)
+
+            if not entries:
+                raise BibliographicEntryParsingError('failed to parse entries from bibliography.')
+
+            if self.snapshot:
+                write_snapshot(self.filepath_snapshot, content_hash, entries)
+
+            return entries
+
+    def _build_index(self) -> None:
+        """Build the index of the spans of the entries in the Bibtex file keyed on their identifier.
+
+        The index is only rebuilt if the version of the Bibtex file changed since it was last built. Rendered entries
+        whose span no longer occurs in the Bibtex file or whose macros changed are discarded.
+        """
+        version = self.get_version()
+
+        if version is not None and version == self._index_version:
+            return
+
+        content = self.filepath.read_bytes() if version is not None else b''
+        spans = list(scan_entries(content))
+        index: t.Dict[str, EntrySpan] = {}
+
+        for span in spans:
+            if span.identifier is not None:
+                index.setdefault(span.identifier, span)
+
+        macros = self._get_macros(content, spans)
+
+        if macros[1] != self._index_macros[1]:
+            self._rendered = {}
+
+        digests = {span.digest for span in index.values()}
+
+        self._index = index
+        self._index_macros = macros
+        self._index_version = version
+        self._rendered = {digest: text for digest, text in self._rendered.items() if digest in digests}
+
+    def _render_span(self, span: EntrySpan) -> t.Optional[str]:
+        """Return the formatted entry of the given span, reading its raw content from the Bibtex file.
+
+        :param span: the span of the entry.
+        :return: the formatted entry or ``None`` if the span does not contain a valid entry.
+        :raises ValueError: if the raw content no longer matches the span, because the Bibtex file was modified.
+        """
+        with self.filepath.open('rb') as handle:
+            handle.seek(span.start)
+            raw = handle.read(span.end - span.start)
+
+        if hashlib.blake2b(raw, digest_size=16).digest() != span.digest:
+            raise ValueError('the Bibtex file was modified since the index was built.')
+
+        macros, macros_digest = self._index_macros
+        entry = self._parsed.get(span.digest, None) if macros_digest == self._macros_digest else None
+
+        if entry is None:
+            entries = _parse_chunk(b'\n'.join((macros, raw)).decode('utf-8'), self.engine)
+            entry = next((entry for entry in entries if entry.identifier == span.identifier), None)
+
+        if entry is None:
+            return None
+
+        stream = io.StringIO()
+        self.write_entry(entry, stream)
+        return stream.getvalue()
+
+    def get_entry_source(self, identifier: str) -> t.Optional[str]:
+        """Return a single bibliographic entry formatted as text, as written by :meth:`write_entry`.
+
+        The adapter maintains an index of the byte span of each entry in the Bibtex file, which is only rebuilt when the
+        Bibtex file changes. The raw content of the requested entry is read directly from its span and only that entry
+        is parsed and formatted. The formatted entry is cached for as long as its raw content does not change.
+
+        :param identifier: the identifier of the entry.
+        :return: the formatted entry or ``None`` if the Bibtex file does not contain a valid entry with that identifier.
+        """
+        with self._lock:
+            for _ in range(2):
+                self._build_index()
+                span = self._index.get(identifier, None)
+
+                if span is None:
+                    return None
+
+                if span.digest in self._rendered:
+                    return self._rendered[span.digest]
+
+                try:
+                    rendered = self._render_span(span)
+                except ValueError:
+                    # The file was modified while its version remained the same, so force the index to be rebuilt.
+                    self._index_version = None
+                    continue
+
+                self._rendered[span.digest] = rendered
+                return rendered
+
+        return None
 
     @staticmethod
     def _entry_to_dict(entry: BibliographyEntry) -> dict:
@@ -136,37 +673,145 @@ class BibtexBibliography(BibliographyAdapter):
                 if field.name == 'author':
                     authors = ' and '.join([author.strip() for author in value])
                     dictionary[field.name] = authors
+                elif field.name == 'keyword' and isinstance(value, list):
+                    dictionary[field.name] = ', '.join(value)
                 else:
                     dictionary[field.name] = value
 
         return dictionary
 
+    @staticmethod
+    def _get_entry_key(entry: BibliographyEntry) -> t.Tuple[t.Any, ...]:
+        """Return a hashable key of the values of all fields of the given entry.
+
+        :param entry: bibliographic entry.
+        :returns: tuple of the values of the fields, where list values are converted to tuples.
+        """
+        return tuple(
+            tuple(value) if isinstance(value, list) else value
+            for value in (getattr(entry, field.name) for field in dataclasses.fields(BibliographyEntry))
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2**16)
+    def _serialize_entry(key: t.Tuple[t.Any, ...]) -> str:
+        """Return the entry with the given field values in bibtex format.
+
+        The result is cached on the values of the fields, such that an entry is only formatted again if it changes.
+
+        :param key: the values of the fields of the entry as returned by :meth:`_get_entry_key`.
+        :returns: the entry formatted in bibtex format.
+        """
+        entry = BibliographyEntry(*[list(value) if isinstance(value, tuple) else value for value in key])
+        database = BibDatabase()
+        database.entries.append(BibtexBibliography._entry_to_dict(entry))  # pylint: disable=protected-access
+        return _WRITER.write(database)
+
     @classmethod
     def write_entry(cls, entry: BibliographyEntry, stream: t.TextIO) -> None:
         """Write an entry in bibtex format to the given stream.
 
         :param entry: bibliographic entry to write formatted to stream.
         """
-        writer = BibTexWriter()
-        writer.indent = '    '
+        stream.write(cls._serialize_entry(cls._get_entry_key(entry)))
 
-        database = BibDatabase()
-        database.entries.append(cls._entry_to_dict(entry))
-        stream.write(writer.write(database))
+    @classmethod
+    def iter_entries(cls, entries: t.Iterable[BibliographyEntry], chunk_size: int = 100) -> t.Iterator[str]:
+        """Yield the given entries in bibtex format in chunks.
+
+        The entries are separated exactly as ``BibTexWriter`` would separate them, such that the concatenated chunks are
+        equal to the formatted list of entries. Only the entries of a single chunk are joined at a time, such that the
+        formatted list of entries is never held in memory in its entirety.
+
+        :param entries: bibliographic entries to format.
+        :param chunk_size: the number of entries per chunk.
+        """
+        chunk = []
+        separator = ''
+
+        for entry in entries:
+            chunk.append(cls._serialize_entry(cls._get_entry_key(entry)))
+
+            if len(chunk) >= chunk_size:
+                yield separator + _WRITER.entry_separator.join(chunk)
+                separator = _WRITER.entry_separator
+                chunk = []
+
+        if chunk:
+            yield separator + _WRITER.entry_separator.join(chunk)
 
     def save_entries(self, entries: t.List[BibliographyEntry]) -> None:
         """Save the list of entries to the bibliography.
 
+        The entries are sorted by their identifier and formatted exactly as ``BibTexWriter`` would for the entire list
+        of entries. However, the formatted text of each entry is cached, so only entries that changed since they were
+        last written are formatted again.
+
         :param entries: list of bibliographic entries to write to the original bibliographic file.
         """
-        database = BibDatabase()
-        writer = BibTexWriter()
-        writer.indent = '    '
-
-        for entry in entries:
-            database.entries.append(self._entry_to_dict(entry))
+        entries = sorted(entries, key=lambda entry: str(entry.identifier).lower())
 
         with tempfile.NamedTemporaryFile('w') as handle:
-            handle.write(writer.write(database))
+            handle.writelines(self.iter_entries(entries))
             handle.flush()
-            shutil.copy(handle.name, self.filepath)
+
+            with file_lock(self.filepath_lock):
+                shutil.copy(handle.name, self.filepath)
+
+    def append_entries(self, entries: t.List[BibliographyEntry]) -> None:
+        """Append the list of entries to the end of the Bibtex file.
+
+        The entries are written in a single write that is synced to disk before returning. The existing content of the
+        file is not rewritten.
+
+        Since the file may have been modified since the entries were added to a bibliography, for example by another
+        process that appended an entry with the same identifier, the file is locked and the identifiers of the entries
+        are checked against the index of the spans of the entries in the file, see :meth:`get_entry_source`. The index
+        is only rebuilt, which requires scanning the entire file, if the file was modified by anything other than this
+        method since it was last built. The appended entries are added to the index directly, so the cost of repeatedly
+        appending entries through the same adapter is independent of the size of the bibliography.
+
+        :param entries: list of new bibliographic entries to append.
+        :raises :class:`bibliography.exceptions.DuplicateEntryError`: if the file already contains any of the entries.
+        """
+        if not entries:
+            return
+
+        stream = io.StringIO()
+
+        for entry in entries:
+            stream.write('\n')
+            self.write_entry(entry, stream)
+
+        content = stream.getvalue().encode('utf-8')
+
+        with file_lock(self.filepath_lock), self._lock:
+            self._build_index()
+
+            for entry in entries:
+                if entry.identifier in self._index:
+                    raise DuplicateEntryError(
+                        f'the bibliography already contains an entry with identifier `{entry.identifier}`.'
+                    )
+
+            with self.filepath.open('a+b') as handle:
+                size = handle.seek(0, os.SEEK_END)
+
+                if size:
+                    handle.seek(size - 1)
+                    if handle.read(1) != b'\n':
+                        content = b'\n' + content
+                else:
+                    content = content[1:]
+
+                handle.write(content)
+                handle.flush()
+                os.fsync(handle.fileno())
+
+            if self._index_version is not None:
+                for span in scan_entries(content):
+                    if span.identifier is not None:
+                        self._index.setdefault(
+                            span.identifier, span._replace(start=span.start + size, end=span.end + size)
+                        )
+                self._index_version = self.get_version()
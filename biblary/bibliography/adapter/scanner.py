@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""Scanner that determines the location of the top-level entries in the content of a Bibtex file.
+
+The scanner does not parse the fields of the entries, it merely determines the byte span, type and identifier of each
+entry by matching the braces that delimit it. This is significantly faster than a full parse and allows to determine
+which entries have changed between two versions of a Bibtex file, such that only those have to be parsed again.
+"""
+import hashlib
+import re
+import typing as t
+
+__all__ = ('EntrySpan', 'SPECIAL_ENTRY_TYPES', 'scan_entries')
+
+SPECIAL_ENTRY_TYPES = ('comment', 'preamble', 'string')
+"""Entry types that do not represent a bibliographic entry and so do not have an identifier."""
+
+_REGEX_WHITESPACE = re.compile(rb'[ \t\r\n]*')
+_REGEX_NEXT_DECLARATION = re.compile(rb'\n[ \t\r\n]*@')
+_REGEX_HEADER = re.compile(rb'@[ \t\r\n]*([A-Za-z]+)[ \t\r\n]*([{(])')
+_REGEX_DELIMITERS_BRACE = re.compile(rb'[{}]')
+_REGEX_DELIMITERS_PARENTHESIS = re.compile(rb'[{})]')
+
+
+class EntrySpan(t.NamedTuple):
+    """Location and identity of an entry in the content of a Bibtex file."""
+
+    start: int
+    """Byte offset of the ``@`` that starts the entry."""
+
+    end: int
+    """Byte offset directly after the delimiter that closes the entry."""
+
+    entry_type: str
+    """The type of the entry in lowercase."""
+
+    identifier: t.Optional[str]
+    """The identifier of the entry, or ``None`` for one of the :data:`SPECIAL_ENTRY_TYPES`."""
+
+    digest: bytes
+    """Digest of the raw bytes of the entry."""
+
+
+def _find_end(content: bytes, position: int, opening: bytes) -> int:
+    """Return the byte offset directly after the delimiter that closes the entry opened just before ``position``.
+
+    :param content: the content of the Bibtex file.
+    :param position: the byte offset directly after the delimiter that opens the entry.
+    :param opening: the delimiter that opens the entry, either ``{`` or ``(``.
+    :returns: the byte offset after the closing delimiter. If the entry is not closed, the entry ends just before the
+        next line that starts with ``@``, just like ``bibtexparser`` recovers from an unclosed entry, or at the end of
+        the content if there is no such line.
+    """
+    if opening == b'{':
+        depth = 1
+        regex = _REGEX_DELIMITERS_BRACE
+    else:
+        depth = 0
+        regex = _REGEX_DELIMITERS_PARENTHESIS
+
+    for match in regex.finditer(content, position):
+        delimiter = match.group()
+
+        if delimiter == b'{':
+            depth += 1
+        elif delimiter == b'}':
+            depth -= 1
+            if depth == 0 and opening == b'{':
+                return match.end()
+        elif depth <= 0:
+            return match.end()
+
+    following = _REGEX_NEXT_DECLARATION.search(content, position)
+    return following.start() if following is not None else len(content)
+
+
+def scan_entries(content: bytes) -> t.Iterator[EntrySpan]:
+    """Yield the span of each top-level entry in the given content of a Bibtex file in order of appearance.
+
+    Any text outside of entries is considered a comment and is skipped. Just like ``bibtexparser``, a declaration is
+    only recognized if it directly follows the previous declaration or starts on a new line, and an ``@comment``
+    declaration extends up to the next line that starts with ``@``.
+
+    :param content: the content of a Bibtex file.
+    """
+    position = 0
+
+    while True:
+        start = _REGEX_WHITESPACE.match(content, position).end()
+
+        if start >= len(content):
+            return
+
+        match = _REGEX_HEADER.match(content, start)
+
+        if match is None:
+            following = _REGEX_NEXT_DECLARATION.search(content, start)
+            if following is None:
+                return
+            position = following.end() - 1
+            continue
+
+        entry_type = match.group(1).decode('utf-8').lower()
+
+        if entry_type == 'comment':
+            following = _REGEX_NEXT_DECLARATION.search(content, start)
+            end = following.start() if following is not None else len(content)
+        else:
+            end = _find_end(content, match.end(), match.group(2))
+
+        if entry_type in SPECIAL_ENTRY_TYPES:
+            identifier = None
+        else:
+            comma = content.find(b',', match.end(), end)
+            identifier = content[match.end():end - 1 if comma == -1 else comma].strip().decode('utf-8')
+
+        digest = hashlib.blake2b(content[start:end], digest_size=16).digest()
+        yield EntrySpan(start, end, entry_type, identifier, digest)
+        position = end
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""Compact snapshot of parsed bibliographic entries that can be loaded without having to parse the source again.
+
+A snapshot consists of a single line header followed by a zlib-compressed JSON document with the values of the fields of
+each entry. The header contains the format version, a digest of the list of field names of the
+:class:`biblary.bibliography.entry.BibliographyEntry` and the hash of the source from which the entries were parsed. A
+snapshot is only valid as long as all of these match, such that it is automatically invalidated if the format, the entry
+class or the source changes. Since the header is not compressed, it is validated before the body is decompressed and
+decoded, which makes checking a stale snapshot cheap regardless of the size of the bibliography.
+"""
+import contextlib
+import dataclasses
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+import typing as t
+import zlib
+
+from ..entry import BibliographyEntry
+
+__all__ = ('SNAPSHOT_VERSION', 'read_snapshot', 'write_snapshot')
+
+SNAPSHOT_VERSION = 2
+
+
+def get_field_names() -> t.List[str]:
+    """Return the names of the fields of the :class:`biblary.bibliography.entry.BibliographyEntry` in order."""
+    return [field.name for field in dataclasses.fields(BibliographyEntry)]
+
+
+def get_header(content_hash: str) -> bytes:
+    """Return the header of a snapshot of entries parsed from a source with the given hash.
+
+    :param content_hash: the hash of the content of the source of the bibliography.
+    """
+    fields_hash = hashlib.sha256(','.join(get_field_names()).encode('utf-8')).hexdigest()
+    return f'biblary-snapshot {SNAPSHOT_VERSION} {fields_hash} {content_hash}\n'.encode('utf-8')
+
+
+def read_snapshot(filepath: pathlib.Path, content_hash: str) -> t.Optional[t.List[BibliographyEntry]]:
+    """Return the entries stored in the snapshot at the given filepath if it is valid for the given content hash.
+
+    Only the header of the snapshot is read if it is no longer valid.
+
+    :param filepath: the filepath of the snapshot.
+    :param content_hash: the hash of the current content of the source of the bibliography.
+    :returns: the list of entries or ``None`` if the snapshot does not exist, cannot be read or is no longer valid.
+    """
+    header = get_header(content_hash)
+
+    try:
+        with filepath.open('rb') as handle:
+            if handle.readline(len(header)) != header:
+                return None
+            body = handle.read()
+        values = json.loads(zlib.decompress(body))
+    except (OSError, ValueError, zlib.error):
+        return None
+
+    try:
+        return [BibliographyEntry(*entry) for entry in values]
+    except TypeError:
+        return None
+
+
+def write_snapshot(filepath: pathlib.Path, content_hash: str, entries: t.List[BibliographyEntry]) -> None:
+    """Write a snapshot of the given entries to the given filepath.
+
+    The snapshot is first written to a temporary file in the same directory, which is then moved in place, such that a
+    concurrent reader can never read a partially written snapshot. Failure to write the snapshot, for example because
+    the directory is not writable, is silently ignored, since the snapshot is merely an optimization.
+
+    :param filepath: the filepath of the snapshot.
+    :param content_hash: the hash of the content of the source from which the entries were parsed.
+    :param entries: the list of entries.
+    """
+    field_names = get_field_names()
+    values = [[getattr(entry, name) for name in field_names] for entry in entries]
+
+    try:
+        content = get_header(content_hash) + zlib.compress(json.dumps(values, separators=(',', ':')).encode('utf-8'))
+    except (TypeError, ValueError):
+        return
+
+    try:
+        # pylint: disable=consider-using-with
+        handle = tempfile.NamedTemporaryFile('wb', dir=filepath.parent, prefix=f'.{filepath.name}.', delete=False)
+    except OSError:
+        return
+
+    try:
+        with handle:
+            handle.write(content)
+        os.replace(handle.name, filepath)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(handle.name)
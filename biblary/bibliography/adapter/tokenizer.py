@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""Streaming tokenizer that parses the content of a Bibtex file in a single pass.
+
+The tokenizer is an alternative to the parser of ``bibtexparser`` that is significantly faster, since it is based on
+regular expressions instead of ``pyparsing``. It yields the same records as the ``BibTexParser`` of ``bibtexparser``
+with its default settings, i.e., a dictionary of the lowercased field names onto their values, with the additional
+``ENTRYTYPE`` and ``ID`` keys. This means it:
+
+* ignores entries whose type is not one of the standard Bibtex types;
+* resolves references to ``@string`` macros, including the predefined month abbreviations;
+* concatenates values joined by ``#``;
+* strips the leading whitespace of each line but the first of a value;
+* keeps only the first occurrence of a field that is defined more than once;
+* treats all text outside of entries, including ``@comment`` and ``@preamble`` declarations, as comments.
+
+Entries that cannot be parsed are skipped until the next line that starts with ``@``, just like ``bibtexparser`` does.
+"""
+import re
+import typing as t
+
+from bibtexparser.bibdatabase import COMMON_STRINGS, STANDARD_TYPES
+
+from ..exceptions import BibliographicEntryParsingError
+
+__all__ = ('iter_records',)
+
+_REGEX_WHITESPACE = re.compile(r'[ \t\r\n]*')
+_REGEX_NEXT_DECLARATION = re.compile(r'\n[ \t\r\n]*@')
+_REGEX_HEADER = re.compile(r'@[ \t\r\n]*([A-Za-z]+)[ \t\r\n]*([{(])')
+_REGEX_KEY = re.compile(r'[^,]*')
+_REGEX_FIELD_NAME = re.compile(r'[A-Za-z0-9_\-().+]+')
+_REGEX_STRING_NAME = re.compile(r'[A-Za-z0-9_\-:]+')
+_REGEX_INTEGER = re.compile(r'[0-9]+')
+_REGEX_BRACES = re.compile(r'[{}]')
+_REGEX_PARENTHESES = re.compile(r'[{})]')
+_REGEX_QUOTED = re.compile(r'[{}"]')
+
+
+class _InvalidDeclaration(Exception):
+    """Raised when a declaration cannot be parsed and should be skipped as a comment."""
+
+
+def _strip_after_new_lines(value: str) -> str:
+    """Strip the leading whitespace of all lines but the first of the given value."""
+    lines = value.splitlines()
+    if len(lines) > 1:
+        lines = [lines[0]] + [line.lstrip() for line in lines[1:]]
+    return '\n'.join(lines)
+
+
+class _Tokenizer:
+    """Tokenizer for the content of a Bibtex file."""
+
+    def __init__(self, content: str, macros: t.Dict[str, str]):
+        """Construct a new instance.
+
+        :param content: the content to tokenize.
+        :param macros: the ``@string`` macros that are defined, keyed by their lowercase name. Macros that are defined
+            by the content are added to this dictionary.
+        """
+        self.content = content
+        self.macros = macros
+        self.position = 0
+
+    def skip_whitespace(self) -> None:
+        """Move the position past any whitespace."""
+        self.position = _REGEX_WHITESPACE.match(self.content, self.position).end()
+
+    def expect(self, regex: t.Pattern) -> str:
+        """Match the given regex at the current position after whitespace and return the matched text.
+
+        :raises _InvalidDeclaration: if the regex does not match.
+        """
+        self.skip_whitespace()
+        match = regex.match(self.content, self.position)
+
+        if match is None or match.end() == self.position:
+            raise _InvalidDeclaration()
+
+        self.position = match.end()
+        return match.group()
+
+    def expect_character(self, characters: str) -> str:
+        """Return the character at the current position after whitespace if it is one of the given characters.
+
+        :raises _InvalidDeclaration: if the character is not one of the given characters.
+        """
+        self.skip_whitespace()
+        character = self.content[self.position:self.position + 1]
+
+        if not character or character not in characters:
+            raise _InvalidDeclaration()
+
+        self.position += 1
+        return character
+
+    def read_delimited(self, regex: t.Pattern, closing: str) -> str:
+        """Read a value delimited by braces or quotes from the current position, which should be the opening delimiter.
+
+        :param regex: regex that matches the opening and closing braces and the closing delimiter.
+        :param closing: the closing delimiter.
+        :returns: the content between the delimiters.
+        :raises _InvalidDeclaration: if the value is not closed or its braces are unbalanced.
+        """
+        start = self.position + 1
+        depth = 0
+
+        for match in regex.finditer(self.content, start):
+            delimiter = match.group()
+
+            if delimiter == closing and depth == 0:
+                self.position = match.end()
+                return self.content[start:match.start()]
+
+            if delimiter == '{':
+                depth += 1
+            elif delimiter == '}':
+                depth -= 1
+                if depth < 0:
+                    break
+
+        raise _InvalidDeclaration()
+
+    def read_value(self, is_field: bool) -> str:
+        """Read a value, which is either an integer or a concatenation of quoted, braced and macro parts.
+
+        :param is_field: boolean, when ``True`` the value is that of a field, which can be an integer and whose literal
+            parts have the leading whitespace stripped of all lines but the first.
+        :returns: the value with all macros resolved.
+        :raises BibliographicEntryParsingError: if the value references an undefined macro.
+        """
+        self.skip_whitespace()
+
+        if is_field:
+            match = _REGEX_INTEGER.match(self.content, self.position)
+            if match is not None:
+                self.position = match.end()
+                return match.group()
+
+        parts: t.List[t.Tuple[bool, str]] = []
+
+        while True:
+            self.skip_whitespace()
+            character = self.content[self.position:self.position + 1]
+
+            if character == '{':
+                part = self.read_delimited(_REGEX_BRACES, '}')
+                parts.append((False, part))
+            elif character == '"':
+                part = self.read_delimited(_REGEX_QUOTED, '"')
+                parts.append((False, part))
+            else:
+                name = self.expect(_REGEX_STRING_NAME).lower()
+                try:
+                    parts.append((True, self.macros[name]))
+                except KeyError as exception:
+                    raise BibliographicEntryParsingError(f'reference to undefined string `{name}`.') from exception
+
+            self.skip_whitespace()
+
+            if self.content[self.position:self.position + 1] != '#':
+                break
+
+            self.position += 1
+
+        if is_field:
+            parts = [(is_macro, value if is_macro else _strip_after_new_lines(value)) for is_macro, value in parts]
+
+        if len(parts) == 1 and not parts[0][0]:
+            value = parts[0][1]
+            return '' if not value or value == '{}' else value
+
+        return ''.join(value for _, value in parts)
+
+    def read_entry(self, entry_type: str, closing: str) -> t.Dict[str, str]:
+        """Read the key and fields of an entry whose opening delimiter has just been read.
+
+        :param entry_type: the lowercase type of the entry.
+        :param closing: the delimiter that closes the entry.
+        :returns: the record of the entry.
+        """
+        key = self.expect(_REGEX_KEY).strip()
+
+        if not key or any(character.isspace() for character in key):
+            raise _InvalidDeclaration()
+
+        self.expect_character(',')
+        fields: t.Dict[str, str] = {}
+
+        while True:
+            name = self.expect(_REGEX_FIELD_NAME).lower()
+            self.expect_character('=')
+            value = self.read_value(is_field=True)
+            fields.setdefault(name, value)
+
+            if self.expect_character(',' + closing) == closing:
+                break
+
+            self.skip_whitespace()
+
+            if self.content[self.position:self.position + 1] == closing:
+                self.position += 1
+                break
+
+        fields['ENTRYTYPE'] = entry_type
+        fields['ID'] = key
+
+        return fields
+
+    def read_string(self, closing: str) -> None:
+        """Read the name and value of a ``@string`` macro whose opening delimiter has just been read."""
+        name = self.expect(_REGEX_STRING_NAME).lower()
+        self.expect_character('=')
+        value = self.read_value(is_field=False)
+        self.expect_character(closing)
+        self.macros[name] = value
+
+    def skip_to_next_declaration(self, start: int) -> None:
+        """Skip to the next line that starts with ``@`` after the given position, or to the end of the content."""
+        match = _REGEX_NEXT_DECLARATION.search(self.content, start)
+        self.position = match.end() - 1 if match is not None else len(self.content)
+
+    def __iter__(self) -> t.Iterator[t.Dict[str, str]]:
+        """Yield the records of the entries in the content in order of appearance."""
+        if self.content.startswith('\ufeff'):
+            self.position = 1
+
+        while True:
+            self.skip_whitespace()
+            start = self.position
+
+            if start >= len(self.content):
+                return
+
+            match = _REGEX_HEADER.match(self.content, start)
+
+            if match is None:
+                self.skip_to_next_declaration(start)
+                continue
+
+            declaration = match.group(1).lower()
+            closing = '}' if match.group(2) == '{' else ')'
+            self.position = match.end()
+
+            if declaration == 'comment':
+                self.skip_to_next_declaration(start)
+                continue
+
+            try:
+                if declaration == 'string':
+                    self.read_string(closing)
+                elif declaration == 'preamble':
+                    self.position = match.end() - 1
+                    self.read_delimited(_REGEX_BRACES if closing == '}' else _REGEX_PARENTHESES, closing)
+                else:
+                    record = self.read_entry(declaration, closing)
+                    if declaration in STANDARD_TYPES:
+                        yield record
+            except _InvalidDeclaration:
+                self.skip_to_next_declaration(start)
+
+
+def iter_records(content: str, macros: t.Optional[t.Dict[str, str]] = None) -> t.Iterator[t.Dict[str, str]]:
+    """Yield the record of each entry in the given content of a Bibtex file in order of appearance.
+
+    :param content: the content of a Bibtex file.
+    :param macros: optional dictionary of ``@string`` macros that are already defined, keyed by their lowercase name.
+        Macros that are defined by the content are added to it, which allows to share them between multiple calls. If
+        not specified, only the predefined month abbreviations are defined.
+    :raises :class:`bibliography.exceptions.BibliographicEntryParsingError`: if a value references an undefined macro.
+    """
+    if macros is None:
+        macros = dict(COMMON_STRINGS)
+
+    return iter(_Tokenizer(content, macros))
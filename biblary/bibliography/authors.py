@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""Index of the bibliographic entries of each author, keyed on a normalized representation of the name of the author.
+
+The same person is often spelled differently across entries, for example ``Schrödinger`` and ``Schrodinger`` or
+``Erwin Schrödinger`` and ``E. Schrödinger``. The key of an author therefore consists of the folded words of the last
+name followed by the initial of the first name, such that these variants map onto the same key.
+"""
+from collections.abc import Mapping
+import typing as t
+
+from .entry import BibliographyEntry
+from .search import tokenize
+
+__all__ = ('AuthorIndex', 'get_author_key', 'split_author_name')
+
+
+def split_author_name(author: str) -> t.Tuple[t.List[str], t.List[str]]:
+    """Return the words of the first name and the last name of the given author.
+
+    The author is expected in the form ``First von Last``, which is the form produced by the Bibtex adapter, or
+    ``von Last, First``. The last name starts at the first word after the first name that starts with a lowercase
+    letter, such as ``van`` or ``von``, or otherwise consists of the last word.
+
+    :param author: the name of the author.
+    :returns: tuple of the words of the first name and the words of the last name.
+    """
+    if ',' in author:
+        last, _, first = author.partition(',')
+        return first.split(), last.split()
+
+    words = author.split()
+
+    for index, word in enumerate(words[1:], 1):
+        if word[:1].islower():
+            return words[:index], words[index:]
+
+    return words[:-1], words[-1:]
+
+
+def get_author_key(author: str) -> str:
+    """Return the normalized key of the given author.
+
+    The author is split in a first and last name by :func:`split_author_name`. The words of the last name are folded to
+    lowercase ASCII where possible and joined by dashes, followed by the initial of the first name. For example,
+    ``Erwin Schrödinger``, ``E. Schrodinger`` and ``Schrödinger, Erwin`` all map onto ``schrodinger-e``.
+
+    :param author: the name of the author.
+    :returns: the key, which is suitable for use in a URL, or an empty string if the name does not contain any words.
+    """
+    first, last = split_author_name(author)
+    key = '-'.join(token for word in last for token in tokenize(word))
+    first_names = [token for word in first for token in tokenize(word)]
+
+    if first_names:
+        key = f'{key}-{first_names[0][0]}' if key else first_names[0]
+
+    return key
+
+
+class AuthorIndex(Mapping):
+    """Mapping of the key of each author onto the bibliographic entries of that author.
+
+    The keys are determined by :func:`get_author_key`. The entries of each author retain the order in which they are
+    passed to the constructor.
+    """
+
+    def __init__(self, entries: t.Iterable[BibliographyEntry]):
+        """Construct a new instance.
+
+        :param entries: the bibliographic entries.
+        """
+        self._entries: t.Dict[str, t.List[BibliographyEntry]] = {}
+        self._names: t.Dict[str, t.Dict[str, int]] = {}
+
+        for entry in entries:
+            authors = entry.author or ()
+
+            if isinstance(authors, str):
+                authors = (authors,)
+
+            for key, author in {get_author_key(str(author)): str(author).strip() for author in authors}.items():
+                if not key:
+                    continue
+
+                self._entries.setdefault(key, []).append(entry)
+                names = self._names.setdefault(key, {})
+                names[author] = names.get(author, 0) + 1
+
+    def __getitem__(self, key: str) -> t.List[BibliographyEntry]:
+        """Return the entries of the author with the given key."""
+        return self._entries[key]
+
+    def __iter__(self) -> t.Iterator[str]:
+        """Return an iterator over the keys of the authors."""
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        """Return the number of authors."""
+        return len(self._entries)
+
+    def get_name(self, key: str) -> str:
+        """Return the name of the author with the given key.
+
+        If the author is spelled differently across entries, the most common spelling is returned and in case of a tie
+        the spelling that occurs first.
+
+        :param key: the key of the author.
+        :raises ``KeyError``: if the index does not contain the author.
+        """
+        names = self._names[key]
+        return max(names, key=names.__getitem__)
@@ -4,8 +4,12 @@ from collections.abc import Mapping
 import typing as t
 
 from .adapter import BibliographyAdapter
+from .authors import AuthorIndex
+from .cache import bibliography_cache
 from .entry import BibliographyEntry
 from .exceptions import DuplicateEntryError, InvalidBibliographyError
+from .facets import FacetIndex, get_facet_values
+from .search import SearchIndex
 from .storage import AbstractStorage
 
 
@@ -32,6 +36,11 @@ class Bibliography(Mapping):
         self.adapter: BibliographyAdapter = adapter
         self.storage: t.Optional[AbstractStorage] = storage
         self._entries: t.Dict[str, BibliographyEntry] = self._initialize_entries()
+        self._added: t.List[str] = []
+        self._by_year: t.Optional[t.Tuple[t.List[BibliographyEntry], t.Dict[t.Optional[int], int]]] = None
+        self._search_index: t.Optional[SearchIndex] = None
+        self._facets: t.Optional[FacetIndex] = None
+        self._authors: t.Optional[AuthorIndex] = None
 
     def __getitem__(self, key) -> BibliographyEntry:
         """Return a bibliographic entry for the given key which should correspond to the entry's identifier."""
@@ -56,6 +65,11 @@ class Bibliography(Mapping):
         instance. When the modification is done through the same instance, it is not necessary to refresh.
         """
         self._entries = self._initialize_entries()
+        self._added = []
+        self._by_year = None
+        self._search_index = None
+        self._facets = None
+        self._authors = None
 
     def _initialize_entries(self) -> t.Dict[str, BibliographyEntry]:
         """Initialize the internal mapping of bibliographic entries obtained through the adapter.
@@ -90,6 +104,123 @@ class Bibliography(Mapping):
 
         return list(self._entries.values())
 
+    @staticmethod
+    def _get_year(entry: BibliographyEntry) -> t.Optional[int]:
+        """Return the year of the given entry as an integer, or ``None`` if it does not define a valid year."""
+        years = get_facet_values(entry, 'year')
+        return years[0] if years else None
+
+    def _get_by_year(self) -> t.Tuple[t.List[BibliographyEntry], t.Dict[t.Optional[int], int]]:
+        """Return the entries sorted by descending year and the number of entries per year.
+
+        Both are computed once and reused until the entries change. Entries without a valid year are sorted last and
+        counted under ``None``.
+        """
+        if self._by_year is None:
+            entries = sorted(
+                self._entries.values(),
+                key=lambda entry: (self._get_year(entry) is not None, self._get_year(entry) or 0),
+                reverse=True,
+            )
+            counts: t.Dict[t.Optional[int], int] = {}
+
+            for entry in entries:
+                year = self._get_year(entry)
+                counts[year] = counts.get(year, 0) + 1
+
+            self._by_year = (entries, counts)
+
+        return self._by_year
+
+    def get_year_counts(self) -> t.Dict[t.Optional[int], int]:
+        """Return the number of entries per year ordered by descending year.
+
+        Entries without a valid year are counted under the key ``None``, which comes last.
+        """
+        return dict(self._get_by_year()[1])
+
+    def get_facets(self) -> FacetIndex:
+        """Return the index of the facets of the entries.
+
+        The index refers to the entries by their position in the order of :meth:`get_entries_by_year`. It is built when
+        it is first requested and is built again when the entries change.
+        """
+        if self._facets is None:
+            self._facets = FacetIndex(self._get_by_year()[0])
+
+        return self._facets
+
+    def get_entries_by_year(
+        self,
+        year_from: t.Optional[int] = None,
+        year_to: t.Optional[int] = None,
+        selection: t.Optional[t.Mapping[str, t.Iterable[t.Hashable]]] = None,
+    ) -> t.List[BibliographyEntry]:
+        """Return the entries sorted by descending year, optionally limited to an inclusive range of years.
+
+        Entries with the same year retain their original order. Since the entries are sorted once and the number of
+        entries per year is known, the entries in the range are obtained by slicing instead of filtering. If a selection
+        of facet values is specified, the matching entries are determined through the :meth:`get_facets` index.
+
+        :param year_from: optional first year of the range.
+        :param year_to: optional last year of the range.
+        :param selection: optional mapping of the name of a facet onto the selected values, see
+            :meth:`biblary.bibliography.facets.FacetIndex.filter`.
+        :returns: the entries in the range. If no range is specified, this includes entries without a valid year.
+        :raises ``ValueError``: if the selection contains an invalid facet.
+        """
+        entries, counts = self._get_by_year()
+        start = 0
+        end = len(entries)
+
+        if year_from is not None or year_to is not None:
+            end = 0
+
+            for year, count in counts.items():
+                if year is None or (year_from is not None and year < year_from):
+                    break
+                if year_to is not None and year > year_to:
+                    start += count
+                end += count
+
+        positions = self.get_facets().filter(selection) if selection else None
+
+        if positions is None:
+            return entries[start:end]
+
+        return [entries[position] for position in sorted(positions) if start <= position < end]
+
+    def get_authors(self) -> AuthorIndex:
+        """Return the index of the entries of each author.
+
+        The entries of each author are sorted by descending year, see :meth:`get_entries_by_year`. The index is built
+        when it is first requested and is built again when the entries change.
+        """
+        if self._authors is None:
+            self._authors = AuthorIndex(self._get_by_year()[0])
+
+        return self._authors
+
+    def get_search_index(self) -> SearchIndex:
+        """Return the full-text search index of the entries.
+
+        The index is built when it is first requested and is subsequently updated incrementally when entries are added.
+        """
+        if self._search_index is None:
+            self._search_index = SearchIndex(self._entries.values())
+
+        return self._search_index
+
+    def search(self, query: str, limit: t.Optional[int] = None) -> t.List[BibliographyEntry]:
+        """Return the entries that match the given query ordered by descending relevance.
+
+        See :meth:`biblary.bibliography.search.SearchIndex.search` for details on how the query is matched.
+
+        :param query: the query.
+        :param limit: optional maximum number of entries to return.
+        """
+        return [self._entries[identifier] for identifier in self.get_search_index().search(query, limit)]
+
     def add_entry(self, entry: t.Union[BibliographyEntry, str]) -> BibliographyEntry:
         """Add a new entry.
 
@@ -108,9 +239,39 @@ class Bibliography(Mapping):
             )
 
         self._entries[entry.identifier] = entry
+        self._added.append(entry.identifier)
+        self._by_year = None
+        self._facets = None
+        self._authors = None
+
+        if self._search_index is not None:
+            self._search_index.add(entry)
 
         return entry
 
-    def save(self):
-        """Persist the current state of the bibliography to the original source through the adapter."""
-        self.adapter.save_entries(self.get_entries())
+    def save(self, rewrite: bool = False):
+        """Persist the current state of the bibliography to the original source through the adapter.
+
+        The entries that were added since the bibliography was loaded or last saved are appended to the source through
+        :meth:`biblary.bibliography.adapter.BibliographyAdapter.append_entries`, such that the cost of saving does not
+        depend on the size of the bibliography. If the adapter does not support appending entries, all entries are
+        rewritten through :meth:`biblary.bibliography.adapter.BibliographyAdapter.save_entries` instead.
+
+        Since the source is modified, all bibliographies cached in the
+        :data:`biblary.bibliography.cache.bibliography_cache` are invalidated.
+
+        :param rewrite: boolean, when ``True``, all entries are rewritten even if the adapter supports appending.
+        :raises :class:`bibliography.exceptions.DuplicateEntryError`: if the source already contains an added entry,
+            because it was added concurrently through another instance since this bibliography was loaded.
+        """
+        if not rewrite:
+            try:
+                self.adapter.append_entries([self._entries[identifier] for identifier in self._added])
+            except NotImplementedError:
+                rewrite = True
+
+        if rewrite:
+            self.adapter.save_entries(self.get_entries())
+
+        self._added = []
+        bibliography_cache.invalidate()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""Module with a process-wide cache of constructed bibliographies."""
+import threading
+import typing as t
+
+if t.TYPE_CHECKING:
+    from .bibliography import Bibliography
+
+__all__ = ('BibliographyCache', 'bibliography_cache')
+
+
+class BibliographyCache:
+    """Cache of :class:`biblary.bibliography.bibliography.Bibliography` instances.
+
+    Each bibliography is stored under a key together with the version of its source, as returned by the
+    :meth:`biblary.bibliography.adapter.abstract.BibliographyAdapter.get_version` method of its adapter. A cached
+    bibliography is only returned as long as the current version of its source still matches the stored version. If
+    the adapter cannot determine a version of its source, the bibliography is never cached.
+    """
+
+    def __init__(self):
+        """Construct a new empty cache."""
+        self._lock = threading.Lock()
+        self._items: t.Dict[t.Hashable, t.Tuple[t.Optional[t.Hashable], 'Bibliography']] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        """Return the number of bibliographies that are currently cached."""
+        return len(self._items)
+
+    def get(self, key: t.Hashable) -> t.Optional['Bibliography']:
+        """Return the bibliography cached under the given key if its source has not changed since it was cached.
+
+        :param key: the key under which the bibliography was cached.
+        :returns: the cached bibliography or ``None`` if it was not cached or its source has since changed.
+        """
+        with self._lock:
+            item = self._items.get(key, None)
+
+        if item is not None:
+            version, bibliography = item
+            current = bibliography.adapter.get_version()
+
+            if version is not None and current == version:
+                with self._lock:
+                    self.hits += 1
+                return bibliography
+
+        with self._lock:
+            self.misses += 1
+
+        return None
+
+    def peek(self, key: t.Hashable) -> t.Optional['Bibliography']:
+        """Return the bibliography cached under the given key regardless of whether its source has since changed.
+
+        This can be used to reuse the adapter of a stale bibliography to construct an up to date bibliography, which
+        allows the adapter to only parse the part of the source that has changed.
+
+        :param key: the key under which the bibliography was cached.
+        :returns: the cached bibliography or ``None`` if it was not cached.
+        """
+        with self._lock:
+            item = self._items.get(key, None)
+
+        return item[1] if item is not None else None
+
+    def set(self, key: t.Hashable, version: t.Optional[t.Hashable], bibliography: 'Bibliography') -> None:
+        """Cache the bibliography under the given key.
+
+        :param key: the key under which to cache the bibliography.
+        :param version: the version of the bibliography source from which the bibliography was constructed. This
+            should be determined *before* the bibliography is constructed, such that a change of the source during the
+            construction invalidates the cached bibliography. If ``None`` the bibliography is not cached.
+        :param bibliography: the bibliography to cache.
+        """
+        if version is None:
+            return
+
+        with self._lock:
+            self._items[key] = (version, bibliography)
+
+    def invalidate(self) -> None:
+        """Mark all cached bibliographies as stale such that they are reconstructed the next time they are requested.
+
+        This should be called whenever a bibliography source is modified, since the version of a source may not
+        necessarily change for every modification, for example, when the resolution of its modification time is coarse.
+        Stale bibliographies can still be retrieved through :meth:`peek`.
+        """
+        with self._lock:
+            self._items = {key: (None, bibliography) for key, (_, bibliography) in self._items.items()}
+
+    def reset(self) -> None:
+        """Remove all cached bibliographies and reset the hit and miss counters."""
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+bibliography_cache: BibliographyCache = BibliographyCache()
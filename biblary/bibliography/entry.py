@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 """Module with data class that represents an entry in a bibliography."""
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 import typing as t
 
-__all__ = ('BibliographyEntry',)
+__all__ = ('BibliographyEntry', 'LazyBibliographyEntry')
 
 
 @dataclass
@@ -24,3 +24,62 @@ class BibliographyEntry:
     keyword: t.Optional[str] = None
     url: t.Optional[str] = None
     doi: t.Optional[str] = None
+
+
+class _LazyField:
+    """Descriptor that decodes the value of a field of a :class:`LazyBibliographyEntry` when first accessed.
+
+    The decoded value is stored in the ``__dict__`` of the instance, which takes precedence over this descriptor for all
+    subsequent lookups, such that each field is decoded at most once.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name  # pylint: disable=attribute-defined-outside-init
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        value = instance._decoder(self.name)  # pylint: disable=protected-access
+        instance.__dict__[self.name] = value
+        return value
+
+
+class LazyBibliographyEntry(BibliographyEntry):
+    """Entry in a bibliography whose fields, other than its type and identifier, are decoded on first access.
+
+    The entry is constructed with a decoder, which is called with the name of a field and should return its value. It
+    typically decodes the field from the raw source of the entry. Lazy entries compare equal to any other entry whose
+    fields all have the same value, regardless of whether those have been decoded yet.
+    """
+
+    author = _LazyField()
+    title = _LazyField()
+    publisher = _LazyField()
+    journal = _LazyField()
+    volume = _LazyField()
+    issue = _LazyField()
+    pages = _LazyField()
+    month = _LazyField()
+    year = _LazyField()
+    keyword = _LazyField()
+    url = _LazyField()
+    doi = _LazyField()
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, entry_type: str, identifier: str, decoder: t.Callable[[str], t.Any]):
+        """Construct a new instance.
+
+        :param entry_type: the type of the entry.
+        :param identifier: the identifier of the entry.
+        :param decoder: callable that takes the name of a field and returns its value.
+        """
+        self.entry_type = entry_type
+        self.identifier = identifier
+        self._decoder = decoder
+
+    def __eq__(self, other):
+        """Return whether the other entry has the same values for all fields, decoding the fields of this entry."""
+        if not isinstance(other, BibliographyEntry):
+            return NotImplemented
+        return all(getattr(self, field.name) == getattr(other, field.name) for field in fields(BibliographyEntry))
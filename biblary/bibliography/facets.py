@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""Index of the values of the facets of bibliographic entries, used to filter entries and count them per value.
+
+For each facet, the index maps each value onto the set of positions of the entries that have that value. A selection of
+values is resolved by intersecting these precomputed sets, instead of scanning all entries.
+"""
+import re
+import typing as t
+
+from .entry import BibliographyEntry
+
+__all__ = ('FACETS', 'FacetIndex', 'get_facet_values')
+
+FACETS = ('year', 'entry_type', 'venue', 'keyword')
+"""Names of the facets of an entry."""
+
+_REGEX_KEYWORD_SEPARATOR = re.compile(r'[,;]')
+
+
+def get_facet_values(entry: BibliographyEntry, facet: str) -> t.Tuple[t.Hashable, ...]:
+    """Return the values of the given facet for the given entry.
+
+    The facets are:
+
+    * ``year``: the year as an integer, if it is valid;
+    * ``entry_type``: the type of the entry;
+    * ``venue``: the journal or, if it does not define one, the publisher;
+    * ``keyword``: each of the keywords, which can be a list or a string where they are separated by commas or
+      semicolons.
+
+    :param entry: the bibliographic entry.
+    :param facet: the name of the facet, which should be one of :data:`FACETS`.
+    :returns: the values, which is empty if the entry does not define the facet.
+    :raises ``ValueError``: if the facet is invalid.
+    """
+    if facet == 'year':
+        try:
+            return (int(str(entry.year).strip()),)
+        except ValueError:
+            return ()
+
+    if facet == 'entry_type':
+        return (entry.entry_type,) if entry.entry_type else ()
+
+    if facet == 'venue':
+        venue = entry.journal or entry.publisher
+        return (str(venue).strip(),) if venue else ()
+
+    if facet == 'keyword':
+        keywords = entry.keyword or ()
+
+        if isinstance(keywords, str):
+            keywords = _REGEX_KEYWORD_SEPARATOR.split(keywords)
+
+        return tuple(dict.fromkeys(str(keyword).strip() for keyword in keywords if str(keyword).strip()))
+
+    raise ValueError(f'invalid facet `{facet}`, should be one of: {", ".join(FACETS)}.')
+
+
+class FacetIndex:
+    """Index of the values of the facets of a sequence of bibliographic entries."""
+
+    def __init__(self, entries: t.Sequence[BibliographyEntry]):
+        """Construct a new instance.
+
+        :param entries: the bibliographic entries. Entries are referred to by their position in this sequence.
+        """
+        self._values: t.List[t.Dict[str, t.Tuple[t.Hashable, ...]]] = []
+        self._postings: t.Dict[str, t.Dict[t.Hashable, t.Set[int]]] = {facet: {} for facet in FACETS}
+
+        for position, entry in enumerate(entries):
+            values = {facet: get_facet_values(entry, facet) for facet in FACETS}
+            self._values.append(values)
+
+            for facet, facet_values in values.items():
+                for value in facet_values:
+                    self._postings[facet].setdefault(value, set()).add(position)
+
+    def contains(self, facet: str, value: t.Hashable) -> bool:
+        """Return whether any entry has the given value for the given facet.
+
+        :param facet: the name of the facet.
+        :param value: the value.
+        :raises ``ValueError``: if the facet is invalid.
+        """
+        if facet not in self._postings:
+            raise ValueError(f'invalid facet `{facet}`, should be one of: {", ".join(FACETS)}.')
+
+        return value in self._postings[facet]
+
+    def filter(self, selection: t.Mapping[str, t.Iterable[t.Hashable]]) -> t.Optional[t.Set[int]]:
+        """Return the positions of the entries that match the given selection.
+
+        An entry matches if, for each facet in the selection, it has at least one of the selected values.
+
+        :param selection: mapping of the name of a facet onto the selected values. Facets without values are ignored.
+        :returns: the positions of the matching entries, or ``None`` if nothing is selected, i.e., all entries match.
+        :raises ``ValueError``: if the selection contains an invalid facet.
+        """
+        result: t.Optional[t.Set[int]] = None
+
+        # Resolve the most selective facets first, such that the intersections are as small as possible.
+        matches = []
+
+        for facet, values in selection.items():
+            if facet not in self._postings:
+                raise ValueError(f'invalid facet `{facet}`, should be one of: {", ".join(FACETS)}.')
+
+            values = list(values)
+
+            if values:
+                postings = self._postings[facet]
+                matches.append(set().union(*(postings.get(value, set()) for value in values)))
+
+        for positions in sorted(matches, key=len):
+            result = positions if result is None else result & positions
+
+            if not result:
+                break
+
+        return result
+
+    def get_counts(
+        self,
+        selection: t.Optional[t.Mapping[str, t.Iterable[t.Hashable]]] = None,
+    ) -> t.Dict[str, t.Dict[t.Hashable, int]]:
+        """Return for each facet the number of entries per value that match the given selection.
+
+        The counts of a facet are determined for the selection of all other facets, such that they are the number of
+        entries that would match if that value were selected as well, or instead for the same facet.
+
+        :param selection: optional mapping of the name of a facet onto the selected values.
+        :returns: mapping of the name of each facet onto a mapping of each value onto its count, ordered by descending
+            year for the ``year`` facet and by descending count and value for all other facets.
+        """
+        selection = {facet: list(values) for facet, values in (selection or {}).items()}
+        counts = {}
+
+        for facet in FACETS:
+            positions = self.filter({key: values for key, values in selection.items() if key != facet})
+
+            if positions is None:
+                facet_counts = {value: len(matching) for value, matching in self._postings[facet].items()}
+            else:
+                facet_counts = {}
+
+                for position in positions:
+                    for value in self._values[position][facet]:
+                        facet_counts[value] = facet_counts.get(value, 0) + 1
+
+            if facet == 'year':
+                ordered = sorted(facet_counts.items(), reverse=True)
+            else:
+                ordered = sorted(facet_counts.items(), key=lambda item: (-item[1], str(item[0])))
+
+            counts[facet] = dict(ordered)
+
+        return counts
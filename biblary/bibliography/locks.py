@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Module with a lock on a file that serializes modifications across threads and processes."""
+import contextlib
+import pathlib
+import threading
+import typing as t
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+__all__ = ('file_lock',)
+
+_THREAD_LOCKS: t.Dict[str, threading.Lock] = {}
+_THREAD_LOCKS_LOCK = threading.Lock()
+
+
+@contextlib.contextmanager
+def file_lock(filepath: pathlib.Path) -> t.Iterator[None]:
+    """Hold an exclusive lock on the given lock file for the duration of the context.
+
+    The lock is an advisory ``flock`` on the file, which is created if it does not exist, such that it serializes all
+    threads and processes that use this function with the same filepath. On platforms that do not support ``flock``, the
+    lock only serializes the threads of the current process.
+
+    :param filepath: the filepath of the lock file.
+    """
+    filepath = pathlib.Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    if fcntl is None:  # pragma: no cover
+        with _THREAD_LOCKS_LOCK:
+            lock = _THREAD_LOCKS.setdefault(str(filepath.resolve()), threading.Lock())
+        with lock:
+            yield
+        return
+
+    with filepath.open('ab') as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""Inverted index to search the bibliographic entries of a bibliography by the words in their fields.
+
+The index maps each word onto the identifiers of the entries that contain it, together with a score that reflects in
+which fields the word occurs. A query is answered by looking up its words in the index, instead of scanning all entries.
+Each word of the query also matches words in the index of which it is a prefix, which are found through a binary search
+in the sorted vocabulary.
+"""
+import bisect
+import heapq
+import itertools
+import re
+import typing as t
+import unicodedata
+
+from .entry import BibliographyEntry
+
+__all__ = ('SearchIndex', 'tokenize')
+
+_REGEX_WORD = re.compile(r'\w+')
+
+
+def tokenize(value: t.Any) -> t.List[str]:
+    """Return the normalized words of the given value.
+
+    The value is folded to lowercase ASCII where possible, such that for example ``Schrödinger`` matches
+    ``schrodinger``, and LaTeX markup such as braces is ignored.
+
+    :param value: the value of a field, which can be a string, a list of strings or ``None``.
+    :returns: the list of words in order of appearance.
+    """
+    if value is None:
+        return []
+
+    if isinstance(value, (list, tuple)):
+        value = ' '.join(str(element) for element in value)
+
+    value = unicodedata.normalize('NFKD', str(value))
+    value = ''.join(character for character in value if not unicodedata.combining(character))
+
+    return _REGEX_WORD.findall(value.casefold())
+
+
+class SearchIndex:
+    """Inverted index of the words in the fields of bibliographic entries."""
+
+    FIELDS = {
+        'title': 3.0,
+        'author': 2.0,
+        'keyword': 1.5,
+        'journal': 1.0,
+    }
+    """Fields of the entries that are indexed and the score that a word contributes if it occurs in that field."""
+
+    PREFIX_FACTOR = 0.5
+    """Factor with which the score of a word is multiplied if it is matched by prefix instead of exactly."""
+
+    PREFIX_EXPANSIONS = 64
+    """Maximum number of words that a word of a query matches by prefix, which bounds the cost of short words."""
+
+    def __init__(self, entries: t.Iterable[BibliographyEntry] = ()):
+        """Construct a new instance.
+
+        :param entries: the bibliographic entries to index.
+        """
+        self._postings: t.Dict[str, t.Dict[str, float]] = {}
+        self._order: t.Dict[str, int] = {}
+
+        for entry in entries:
+            self._index(entry)
+
+        self._vocabulary: t.List[str] = sorted(self._postings)
+
+    def __len__(self) -> int:
+        """Return the number of entries in the index."""
+        return len(self._order)
+
+    def _index(self, entry: BibliographyEntry) -> t.List[str]:
+        """Add the words of the given entry to the postings.
+
+        :returns: the words that were not yet contained in the index.
+        """
+        identifier = entry.identifier
+        new_words = []
+
+        if identifier in self._order:
+            raise ValueError(f'the index already contains an entry with identifier `{identifier}`.')
+
+        self._order[identifier] = len(self._order)
+
+        for field, score in self.FIELDS.items():
+            for word in set(tokenize(getattr(entry, field, None))):
+                postings = self._postings.get(word, None)
+
+                if postings is None:
+                    postings = self._postings[word] = {}
+                    new_words.append(word)
+
+                postings[identifier] = postings.get(identifier, 0) + score
+
+        return new_words
+
+    def add(self, entry: BibliographyEntry) -> None:
+        """Add the given entry to the index.
+
+        :param entry: the bibliographic entry to add.
+        :raises ``ValueError``: if the index already contains an entry with the same identifier.
+        """
+        for word in self._index(entry):
+            bisect.insort(self._vocabulary, word)
+
+    def _get_scores(self, word: str) -> t.Dict[str, float]:
+        """Return the score of each entry that contains the given word or a word of which it is a prefix."""
+        scores = dict(self._postings.get(word, {}))
+        start = bisect.bisect_right(self._vocabulary, word)
+        expansions = itertools.islice(self._vocabulary, start, start + self.PREFIX_EXPANSIONS)
+
+        for expansion in itertools.takewhile(lambda candidate: candidate.startswith(word), expansions):
+            for identifier, score in self._postings[expansion].items():
+                scores[identifier] = max(scores.get(identifier, 0), score * self.PREFIX_FACTOR)
+
+        return scores
+
+    def search(self, query: str, limit: t.Optional[int] = None) -> t.List[str]:
+        """Return the identifiers of the entries that match the given query ordered by descending relevance.
+
+        An entry matches if it contains each word of the query, or one of the first :attr:`PREFIX_EXPANSIONS` words in
+        alphabetical order of which it is a prefix, in any of the indexed fields. The relevance of an entry is the sum
+        of the scores of the words it matches. Entries that are equally relevant are returned in the order in which they
+        were added to the index.
+
+        :param query: the query.
+        :param limit: optional maximum number of identifiers to return.
+        :returns: the identifiers of the matching entries.
+        """
+        words = sorted(set(tokenize(query)), key=len, reverse=True)
+
+        if not words:
+            return []
+
+        # Start with the longest word, which is likely the most selective, and only keep entries that match all words.
+        scores = self._get_scores(words[0])
+
+        for word in words[1:]:
+            if not scores:
+                break
+
+            other = self._get_scores(word)
+            scores = {
+                identifier: score + other[identifier] for identifier, score in scores.items() if identifier in other
+            }
+
+        def key(identifier):
+            return -scores[identifier], self._order[identifier]
+
+        if limit is not None:
+            return heapq.nsmallest(limit, scores, key=key)
+
+        return sorted(scores, key=key)
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""Serializers that convert bibliographic entries to JSON, either plain or in the CSL-JSON format.
+
+The serializers encode a sequence of entries incrementally as a JSON array, such that the encoded entries can be
+streamed to a client without the entire document ever being held in memory.
+"""
+from dataclasses import fields
+import json
+import typing as t
+
+from .authors import split_author_name
+from .entry import BibliographyEntry
+from .facets import get_facet_values
+
+__all__ = ('FIELDS', 'FORMATS', 'Serializer', 'iter_json', 'to_csl_json', 'to_json')
+
+FIELDS = tuple(field.name for field in fields(BibliographyEntry))
+"""Names of the fields of an entry that can be selected for serialization."""
+
+CSL_TYPES = {
+    'article': 'article-journal',
+    'book': 'book',
+    'booklet': 'pamphlet',
+    'inbook': 'chapter',
+    'incollection': 'chapter',
+    'inproceedings': 'paper-conference',
+    'conference': 'paper-conference',
+    'manual': 'report',
+    'mastersthesis': 'thesis',
+    'phdthesis': 'thesis',
+    'proceedings': 'book',
+    'techreport': 'report',
+    'unpublished': 'manuscript',
+}
+"""Mapping of Bibtex entry types onto CSL item types. Other entry types are mapped onto ``document``."""
+
+MONTHS = (
+    'january', 'february', 'march', 'april', 'may', 'june', 'july', 'august', 'september', 'october', 'november',
+    'december'
+)
+"""Names of the months in order, of which the first three letters are the Bibtex month macros."""
+
+Serializer = t.Callable[[BibliographyEntry, t.Optional[t.Iterable[str]]], t.Dict[str, t.Any]]
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, default=str)
+
+
+def _get_list(value: t.Any) -> t.List[str]:
+    """Return the given value of a field that can contain multiple values as a list of strings."""
+    if value is None:
+        return []
+
+    if isinstance(value, (list, tuple)):
+        return [str(element) for element in value]
+
+    return [str(value)]
+
+
+def _get_month(value: t.Any) -> t.Optional[int]:
+    """Return the number of the month of the given value of the ``month`` field.
+
+    The value can be a number or the name of a month, either in full, such as ``June`` to which ``bibtexparser`` expands
+    the ``jun`` macro, or abbreviated.
+
+    :param value: the value of the ``month`` field.
+    :returns: the number of the month from 1 to 12 or ``None`` if the value does not represent a valid month.
+    """
+    if value is None:
+        return None
+
+    value = str(value).strip().rstrip('.').lower()
+
+    try:
+        month = int(value)
+    except ValueError:
+        if len(value) < 3:
+            return None
+
+        return next((number for number, name in enumerate(MONTHS, 1) if name.startswith(value)), None)
+
+    return month if 1 <= month <= 12 else None
+
+
+def _to_csl_name(author: str) -> t.Dict[str, str]:
+    """Return the CSL name variable of the given author, see :func:`biblary.bibliography.authors.split_author_name`.
+
+    :param author: the name of the author.
+    """
+    first, last = split_author_name(author)
+    name = {'family': ' '.join(last)}
+
+    if first:
+        name['given'] = ' '.join(first)
+
+    return name
+
+
+def to_json(entry: BibliographyEntry, selected: t.Optional[t.Iterable[str]] = None) -> t.Dict[str, t.Any]:
+    """Return the given entry as a dictionary that can be encoded as JSON.
+
+    :param entry: the bibliographic entry.
+    :param selected: optional names of the fields to include, which should be in :data:`FIELDS`. By default all fields
+        are included. The identifier is always included.
+    :returns: mapping of the name of each field onto its value, omitting fields that are not defined.
+    """
+    names = FIELDS if selected is None else ('identifier',) + tuple(name for name in selected if name != 'identifier')
+    result = {}
+
+    for name in names:
+        value = getattr(entry, name)
+
+        if value is not None:
+            result[name] = value
+
+    return result
+
+
+def to_csl_json(entry: BibliographyEntry, selected: t.Optional[t.Iterable[str]] = None) -> t.Dict[str, t.Any]:
+    """Return the given entry as a CSL-JSON item.
+
+    :param entry: the bibliographic entry.
+    :param selected: optional names of the fields of the entry to include, which should be in :data:`FIELDS`. By
+        default all fields are included. The identifier is always included as the ``id`` of the item.
+    :returns: the CSL-JSON item, omitting variables whose field is not defined.
+    """
+    selected = set(FIELDS if selected is None else selected)
+    item: t.Dict[str, t.Any] = {'id': entry.identifier}
+
+    if 'entry_type' in selected:
+        item['type'] = CSL_TYPES.get(str(entry.entry_type).lower(), 'document')
+
+    if 'author' in selected and entry.author:
+        item['author'] = [_to_csl_name(author) for author in _get_list(entry.author) if author.strip()]
+
+    variables = (
+        ('title', 'title'),
+        ('journal', 'container-title'),
+        ('publisher', 'publisher'),
+        ('volume', 'volume'),
+        ('issue', 'issue'),
+        ('pages', 'page'),
+        ('url', 'URL'),
+        ('doi', 'DOI'),
+    )
+
+    for name, variable in variables:
+        value = getattr(entry, name) if name in selected else None
+
+        if value is not None:
+            item[variable] = str(value)
+
+    if 'keyword' in selected:
+        keywords = get_facet_values(entry, 'keyword')
+
+        if keywords:
+            item['keyword'] = ', '.join(keywords)
+
+    if 'year' in selected:
+        years = get_facet_values(entry, 'year')
+
+        if years:
+            date_parts = [years[0]]
+
+            month = _get_month(entry.month) if 'month' in selected else None
+
+            if month is not None:
+                date_parts.append(month)
+
+            item['issued'] = {'date-parts': [date_parts]}
+
+    return item
+
+
+FORMATS: t.Dict[str, Serializer] = {
+    'json': to_json,
+    'csl-json': to_csl_json,
+}
+"""Mapping of the name of each supported format onto the function that serializes an entry in that format."""
+
+
+def iter_json(
+    entries: t.Iterable[BibliographyEntry],
+    serializer: Serializer = to_json,
+    selected: t.Optional[t.Iterable[str]] = None,
+    chunk_size: int = 100,
+) -> t.Iterator[str]:
+    """Yield the given entries encoded as a JSON array in chunks.
+
+    Only the entries of a single chunk are encoded at a time, such that the memory usage does not depend on the number
+    of entries.
+
+    :param entries: the bibliographic entries.
+    :param serializer: the function that converts an entry into a dictionary, for example one of :data:`FORMATS`.
+    :param selected: optional names of the fields to include, which is passed to the serializer.
+    :param chunk_size: the number of entries that are encoded per chunk.
+    """
+    selected = None if selected is None else tuple(selected)
+    chunk = []
+    separator = '['
+
+    for entry in entries:
+        chunk.append(_ENCODER.encode(serializer(entry, selected)))
+
+        if len(chunk) >= chunk_size:
+            yield separator + ','.join(chunk)
+            separator = ','
+            chunk = []
+
+    if chunk:
+        yield separator + ','.join(chunk)
+        separator = ','
+
+    yield '[]' if separator == '[' else ']'
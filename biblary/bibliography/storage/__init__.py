@@ -3,7 +3,9 @@
 
 For example, this can be used to store the PDF of an article associated with a certain bibliography entry.
 """
-from .abstract import AbstractStorage, FileType
+from .abstract import AbstractAsyncStorage, AbstractStorage, AsyncFile, AsyncStorageAdapter, FileType
 from .file_system import FileSystemStorage
 
-__all__ = ('AbstractStorage', 'FileType', 'FileSystemStorage')
+__all__ = (
+    'AbstractAsyncStorage', 'AbstractStorage', 'AsyncFile', 'AsyncStorageAdapter', 'FileType', 'FileSystemStorage'
+)
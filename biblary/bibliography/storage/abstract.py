@@ -3,11 +3,14 @@
 import abc
 import enum
 import io
+import os
 import typing as t
 
+from asgiref.sync import sync_to_async
+
 from ..entry import BibliographyEntry
 
-__all__ = ('AbstractStorage', 'FileType')
+__all__ = ('AbstractAsyncStorage', 'AbstractStorage', 'AsyncFile', 'AsyncStorageAdapter', 'FileType')
 
 
 class FileType(enum.Enum):
@@ -33,10 +36,76 @@ class AbstractStorage(abc.ABC):
         :raises ``FileNotFoundError``: if the file of the given type does not exist for the given entry.
         """
 
+    def open_file(self, entry: BibliographyEntry, file_type: FileType) -> t.BinaryIO:
+        """Return a binary stream of the content of a file with the given type for the given bibliographic entry.
+
+        The caller is responsible for closing the stream. The base implementation wraps the content returned by
+        :meth:`get_file` in a stream. Implementations should override it if they can stream the content without having
+        to load it in memory entirely.
+
+        :param entry: the :class:`biblary.bibliographic.entry.BibliographicEntry` for which to retrieve the file.
+        :param file_type: the file type to retrieve for the given entry.
+        :raises ``FileNotFoundError``: if the file of the given type does not exist for the given entry.
+        """
+        return io.BytesIO(self.get_file(entry, file_type))
+
+    def get_file_encoding(self, entry: BibliographyEntry, file_type: FileType) -> t.Optional[str]:
+        """Return the compression with which a file with the given type for the given bibliographic entry is stored.
+
+        The base implementation returns ``None`` which signifies that the file is stored as is.
+
+        :param entry: the :class:`biblary.bibliographic.entry.BibliographicEntry` for which to retrieve the file.
+        :param file_type: the file type to retrieve for the given entry.
+        :returns: the compression, for example ``gzip``, or ``None`` if the file is not compressed.
+        :raises ``FileNotFoundError``: if the file of the given type does not exist for the given entry.
+        """
+        # pylint: disable=unused-argument
+        return None
+
+    def open_raw_file(self, entry: BibliographyEntry, file_type: FileType) -> t.BinaryIO:
+        """Return a binary stream of the content of a file with the given type as it is stored.
+
+        If the file is stored compressed, as indicated by :meth:`get_file_encoding`, the content is not decompressed,
+        such that it can be served as is to clients that accept the compression. The base implementation returns the
+        stream of :meth:`open_file`.
+
+        :param entry: the :class:`biblary.bibliographic.entry.BibliographicEntry` for which to retrieve the file.
+        :param file_type: the file type to retrieve for the given entry.
+        :raises ``FileNotFoundError``: if the file of the given type does not exist for the given entry.
+        """
+        return self.open_file(entry, file_type)
+
+    def stat_file(self, entry: BibliographyEntry, file_type: FileType) -> t.Optional[t.Tuple[int, int]]:
+        """Return the size and modification time of a file with the given type for the given bibliographic entry.
+
+        The base implementation returns ``None`` which signifies that this information is not available.
+
+        :param entry: the :class:`biblary.bibliographic.entry.BibliographicEntry` for which to retrieve the file.
+        :param file_type: the file type to retrieve for the given entry.
+        :returns: tuple of the size in bytes and the modification time in nanoseconds since the epoch, or ``None``.
+        :raises ``FileNotFoundError``: if the file of the given type does not exist for the given entry.
+        """
+        # pylint: disable=unused-argument
+        return None
+
+    def get_version(self) -> t.Optional[t.Hashable]:
+        """Return a token that identifies the current version of the storage.
+
+        The token should change whenever a file is added to or changed in the storage. The base implementation returns
+        ``None`` which signifies that the version cannot be determined.
+
+        :return: a hashable token identifying the current version of the storage, or ``None`` if it is unknown.
+        """
+        return None
+
     @abc.abstractmethod
-    def put_file(self, content: t.Union[io.BytesIO, bytes], entry: BibliographyEntry, file_type: FileType) -> None:
+    def put_file(
+        self, content: t.Union[bytes, t.BinaryIO, t.Iterable[bytes]], entry: BibliographyEntry, file_type: FileType
+    ) -> None:
         """Write the given byte content for the given bibliographic entry and file type.
 
+        :param content: the content as bytes, as an object with a ``chunks`` method such as a Django ``UploadedFile``,
+            as a binary stream or as an iterable of bytes.
         :param entry: the :class:`biblary.bibliographic.entry.BibliographicEntry` for which to retrieve the file.
         :param file_type: the file type to retrieve for the given entry.
         :raises ``TypeError``: if the ``content`` is not a byte-stream or pure bytes.
@@ -50,3 +119,157 @@ class AbstractStorage(abc.ABC):
         :param file_type: the file type to retrieve for the given entry.
         :returns: True if the file exists and False otherwise.
         """
+
+    def exists_many(self, entries: t.Iterable[BibliographyEntry]) -> t.Dict[str, t.Dict[FileType, bool]]:
+        """Return for each of the given bibliographic entries which files exist.
+
+        The base implementation calls :meth:`exists` for each entry and file type. Implementations should override it
+        if they can determine the existence of the files of many entries more efficiently.
+
+        :param entries: the bibliographic entries for which to determine which files exist.
+        :returns: dictionary mapping the identifier of each entry onto a dictionary that maps each file type onto
+            whether the file exists.
+        """
+        return {
+            entry.identifier: {file_type: self.exists(entry, file_type) for file_type in FileType} for entry in entries
+        }
+
+
+class AsyncFile:
+    """Binary stream whose blocking operations are awaitable.
+
+    The operations of the wrapped stream are run through the given callable, which should run them outside of the event
+    loop, for example in a thread pool.
+    """
+
+    def __init__(self, raw: t.BinaryIO, run: t.Callable[..., t.Awaitable]):
+        """Construct a new instance.
+
+        :param raw: the binary stream to wrap.
+        :param run: coroutine function that is called with a function and its arguments and returns its result.
+        """
+        self.raw = raw
+        self._run = run
+
+    async def read(self, size: int = -1) -> bytes:
+        """Read and return up to ``size`` bytes, or all remaining bytes if ``size`` is negative."""
+        return await self._run(self.raw.read, size)
+
+    async def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """Change the position of the stream and return the new absolute position."""
+        return await self._run(self.raw.seek, offset, whence)
+
+    async def close(self) -> None:
+        """Close the stream."""
+        await self._run(self.raw.close)
+
+    async def __aenter__(self) -> 'AsyncFile':
+        """Return the stream itself."""
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        """Close the stream."""
+        await self.close()
+
+
+class AbstractAsyncStorage(abc.ABC):
+    """Abstract class that represents the asynchronous interface to a file store.
+
+    This is the counterpart of :class:`AbstractStorage` for use in asynchronous views. An implementation should run the
+    blocking operations outside of the event loop, such that a single event loop can serve many concurrent requests.
+    """
+
+    @abc.abstractmethod
+    async def aget_file(self, entry: BibliographyEntry, file_type: FileType) -> bytes:
+        """Return the byte content of a file with the given type for the given bibliographic entry.
+
+        :param entry: the :class:`biblary.bibliographic.entry.BibliographicEntry` for which to retrieve the file.
+        :param file_type: the file type to retrieve for the given entry.
+        :raises ``FileNotFoundError``: if the file of the given type does not exist for the given entry.
+        """
+
+    @abc.abstractmethod
+    async def aopen_file(self, entry: BibliographyEntry, file_type: FileType) -> AsyncFile:
+        """Return an asynchronous binary stream of the content of a file with the given type for the given entry.
+
+        The caller is responsible for closing the stream.
+
+        :param entry: the :class:`biblary.bibliographic.entry.BibliographicEntry` for which to retrieve the file.
+        :param file_type: the file type to retrieve for the given entry.
+        :raises ``FileNotFoundError``: if the file of the given type does not exist for the given entry.
+        """
+
+    @abc.abstractmethod
+    async def aexists_many(self, entries: t.Iterable[BibliographyEntry]) -> t.Dict[str, t.Dict[FileType, bool]]:
+        """Return for each of the given bibliographic entries which files exist.
+
+        :param entries: the bibliographic entries for which to determine which files exist.
+        :returns: dictionary mapping the identifier of each entry onto a dictionary that maps each file type onto
+            whether the file exists.
+        """
+
+    async def astat_file(self, entry: BibliographyEntry, file_type: FileType) -> t.Optional[t.Tuple[int, int]]:
+        """Return the size and modification time of a file with the given type for the given bibliographic entry.
+
+        See :meth:`AbstractStorage.stat_file` for details. The base implementation returns ``None``.
+        """
+        # pylint: disable=unused-argument
+        return None
+
+    async def aget_file_encoding(self, entry: BibliographyEntry, file_type: FileType) -> t.Optional[str]:
+        """Return the compression with which a file with the given type for the given bibliographic entry is stored.
+
+        See :meth:`AbstractStorage.get_file_encoding` for details. The base implementation returns ``None``.
+        """
+        # pylint: disable=unused-argument
+        return None
+
+    async def aopen_raw_file(self, entry: BibliographyEntry, file_type: FileType) -> AsyncFile:
+        """Return an asynchronous binary stream of the content of a file with the given type as it is stored.
+
+        See :meth:`AbstractStorage.open_raw_file` for details. The base implementation returns :meth:`aopen_file`.
+        """
+        return await self.aopen_file(entry, file_type)
+
+
+class AsyncStorageAdapter(AbstractAsyncStorage):
+    """Asynchronous interface to a storage that only implements :class:`AbstractStorage`.
+
+    Each operation is run in a thread through :func:`asgiref.sync.sync_to_async`.
+    """
+
+    def __init__(self, storage: AbstractStorage):
+        """Construct a new instance.
+
+        :param storage: the storage to wrap.
+        """
+        self.storage = storage
+
+    @staticmethod
+    async def _run(func: t.Callable, *args: t.Any) -> t.Any:
+        """Run the given function with the given arguments in a thread and return its result."""
+        return await sync_to_async(func, thread_sensitive=False)(*args)
+
+    async def aget_file(self, entry: BibliographyEntry, file_type: FileType) -> bytes:
+        """Return the byte content of a file with the given type for the given bibliographic entry."""
+        return await self._run(self.storage.get_file, entry, file_type)
+
+    async def aopen_file(self, entry: BibliographyEntry, file_type: FileType) -> AsyncFile:
+        """Return an asynchronous binary stream of the content of a file with the given type for the given entry."""
+        return AsyncFile(await self._run(self.storage.open_file, entry, file_type), self._run)
+
+    async def aexists_many(self, entries: t.Iterable[BibliographyEntry]) -> t.Dict[str, t.Dict[FileType, bool]]:
+        """Return for each of the given bibliographic entries which files exist."""
+        return await self._run(self.storage.exists_many, entries)
+
+    async def astat_file(self, entry: BibliographyEntry, file_type: FileType) -> t.Optional[t.Tuple[int, int]]:
+        """Return the size and modification time of a file with the given type for the given bibliographic entry."""
+        return await self._run(self.storage.stat_file, entry, file_type)
+
+    async def aget_file_encoding(self, entry: BibliographyEntry, file_type: FileType) -> t.Optional[str]:
+        """Return the compression with which a file with the given type for the given bibliographic entry is stored."""
+        return await self._run(self.storage.get_file_encoding, entry, file_type)
+
+    async def aopen_raw_file(self, entry: BibliographyEntry, file_type: FileType) -> AsyncFile:
+        """Return an asynchronous binary stream of the content of a file with the given type as it is stored."""
+        return AsyncFile(await self._run(self.storage.open_raw_file, entry, file_type), self._run)
@@ -1,25 +1,193 @@
 # -*- coding: utf-8 -*-
 """Implementation of :class:`biblary.bibliography.storage.AbstractStorage` that stores on the local file system."""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import gzip
 import hashlib
-import io
+import lzma
+import os
 import pathlib
+import shutil
+import tempfile
+import threading
 import typing as t
+import uuid
+import zlib
 
 from ..entry import BibliographyEntry
-from .abstract import AbstractStorage, FileType
+from ..locks import file_lock
+from .abstract import AbstractAsyncStorage, AbstractStorage, AsyncFile, FileType
 
 __all__ = ('FileSystemStorage',)
 
 
-class FileSystemStorage(AbstractStorage):
+@functools.lru_cache(maxsize=2**16)
+def _hash_identifier(identifier: str) -> str:
+    """Return the hash of the given identifier of a bibliographic entry, which is the name of its directory."""
+    return hashlib.sha256(identifier.encode('utf-8')).hexdigest()
+
+
+def _iter_chunks(content: t.Union[bytes, t.BinaryIO, t.Iterable[bytes]], chunk_size: int) -> t.Iterator[bytes]:
+    """Yield the given content in chunks of bytes.
+
+    :param content: the content as bytes, as an object with a ``chunks`` method such as a Django ``UploadedFile``, as a
+        binary stream or as an iterable of bytes.
+    :param chunk_size: the number of bytes to read at a time from a binary stream.
+    :raises ``TypeError``: if the ``content`` is not of one of the supported types or does not yield bytes.
+    """
+    message = f'invalid type for ``content``, should be bytes or byte-stream but got: `{content}`.'
+
+    if isinstance(content, bytes):
+        chunks: t.Iterable[t.Any] = (content,)
+    elif hasattr(content, 'chunks'):
+        chunks = content.chunks()
+    elif hasattr(content, 'read'):
+        chunks = iter(functools.partial(content.read, chunk_size), b'')
+    else:
+        try:
+            chunks = iter(content)
+        except TypeError as exc:
+            raise TypeError(message) from exc
+
+    for chunk in chunks:
+        if not isinstance(chunk, bytes):
+            raise TypeError(message)
+        yield chunk
+
+
+def _compress_chunks(chunks: t.Iterable[bytes], compression: str) -> t.Iterator[bytes]:
+    """Yield the given chunks of bytes compressed with the given compression.
+
+    The ``gzip`` compression writes a header without a modification time, such that the same content always results in
+    the same compressed content, which allows it to be deduplicated.
+
+    :param chunks: the chunks of bytes to compress.
+    :param compression: the compression to use, either ``gzip`` or ``lzma``.
+    """
+    if compression == 'gzip':
+        compressor = zlib.compressobj(9, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    else:
+        compressor = lzma.LZMACompressor()
+
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+
+    yield compressor.flush()
+
+
+def _replace(source: pathlib.Path, destination: pathlib.Path) -> None:
+    """Atomically move the source file to the destination and sync the folder of the destination to disk.
+
+    Without syncing the folder, the rename itself can be lost in a crash even though the content of the file was synced.
+
+    :param source: the filepath of the file to move.
+    :param destination: the filepath to move the file to, which is replaced if it exists.
+    """
+    os.replace(source, destination)
+
+    try:
+        descriptor = os.open(pathlib.Path(destination).parent, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+    except OSError:  # pragma: no cover
+        # Some platforms, such as Windows, do not support opening a folder.
+        return
+
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+class FileSystemStorage(AbstractStorage, AbstractAsyncStorage):
     """Implementation of :class:`biblary.bibliography.storage.AbstractStorage` that builds from a Bibtex file."""
 
-    def __init__(self, filepath: pathlib.Path, *_, **__):
+    VERSION_FILENAME = '.version'
+    """Name of the file in the base folder whose content identifies the version of the storage."""
+
+    CHUNK_SIZE = 2**16
+    """Number of bytes that are read at a time from a binary stream that is written to the storage."""
+
+    BLOBS_DIRNAME = 'blobs'
+    """Name of the folder in the base folder where the content of files is stored when deduplication is enabled."""
+
+    BLOBS_LOCK_FILENAME = '.lock'
+    """Name of the lock file in the blobs folder that serializes linking blobs with pruning them."""
+
+    COMPRESSION_SUFFIXES = {
+        'gzip': '.gz',
+        'lzma': '.xz',
+    }
+    """Supported compressions and the suffix that is appended to the filename of files stored with that compression."""
+
+    def __init__(
+        self,
+        filepath: pathlib.Path,
+        *_,
+        deduplicate: bool = False,
+        compression: t.Optional[t.Dict[str, str]] = None,
+        async_workers: int = 16,
+        **__
+    ):
         """Construct a new instance.
 
         :param filepath: absolute filepath to the base folder where files will be stored.
+        :param deduplicate: boolean, when ``True``, the content of each file is stored once in the ``blobs`` folder
+            under its SHA-256 hash and the file of each entry is a hardlink to it. Writing content that is already
+            stored then only creates a hardlink. If the file system does not support hardlinks, the content is copied.
+        :param compression: optional dictionary that maps the value of a file type onto the compression with which
+            files of that type are stored, which should be one of the keys of :attr:`COMPRESSION_SUFFIXES`. Files are
+            transparently decompressed when read. Files that were stored before a compression was configured for their
+            file type remain readable.
+        :param async_workers: the maximum number of threads in which the blocking operations of the asynchronous
+            interface are run concurrently. The threads are only started once the asynchronous interface is used.
+        :raises ``ValueError``: if the ``compression`` contains an invalid file type or compression.
         """
+        compression = compression or {}
+
+        for key, value in compression.items():
+            if key not in {file_type.value for file_type in FileType}:
+                raise ValueError(f'invalid file type `{key}` in ``compression``.')
+            if value not in self.COMPRESSION_SUFFIXES:
+                raise ValueError(
+                    f'invalid compression `{value}`, should be one of: {", ".join(self.COMPRESSION_SUFFIXES)}.'
+                )
+
         self.filepath = pathlib.Path(filepath)
+        self.deduplicate = deduplicate
+        self.compression: t.Dict[FileType, str] = {FileType(key): value for key, value in compression.items()}
+        self.async_workers = async_workers
+        self._executor: t.Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def get_version(self) -> t.Optional[str]:
+        """Return a token that identifies the current version of the storage.
+
+        The token is stored in a file in the base folder, which is replaced with a new token by :meth:`put_file`. Files
+        that are added to the base folder by other means therefore do not change the version.
+
+        :return: the token, which is ``0`` if no file has been written through :meth:`put_file` yet.
+        """
+        try:
+            return (self.filepath / self.VERSION_FILENAME).read_text()
+        except FileNotFoundError:
+            return '0'
+        except OSError:
+            return None
+
+    def stat_file(self, entry: BibliographyEntry, file_type: FileType) -> t.Tuple[int, int]:
+        """Return the size and modification time of a file with the given type for the given bibliographic entry.
+
+        :param entry: the :class:`biblary.bibliographic.entry.BibliographicEntry` for which to retrieve the file.
+        :param file_type: the file type to retrieve for the given entry.
+        :returns: tuple of the size in bytes and the modification time in nanoseconds since the epoch.
+        :raises ``FileNotFoundError``: if the file of the given type does not exist for the given entry.
+        :raises ``TypeError``: if the given ``file_type`` is not a valid ``FileType``.
+        """
+        filepath, _ = self._find_stored_file(entry, file_type)
+        stat = filepath.stat()
+        return stat.st_size, stat.st_mtime_ns
 
     @staticmethod
     def validate_file_type(file_type):
@@ -39,7 +207,7 @@ class FileSystemStorage(AbstractStorage):
         """
         self.validate_file_type(file_type)
 
-        doi_hash = hashlib.sha256(str(entry.identifier).encode('utf-8')).hexdigest()
+        doi_hash = _hash_identifier(str(entry.identifier))
 
         if isinstance(file_type, FileType):
             filename = file_type.value
@@ -48,6 +216,48 @@ class FileSystemStorage(AbstractStorage):
 
         return self.filepath / doi_hash / filename
 
+    def get_stored_filepath(
+        self, entry: BibliographyEntry, file_type: FileType, compression: t.Optional[str]
+    ) -> pathlib.Path:
+        """Return the filepath where the file with the given type is stored with the given compression.
+
+        :param entry: the :class:`biblary.bibliographic.entry.BibliographicEntry` for which to retrieve the file.
+        :param file_type: the file type to retrieve for the given entry.
+        :param compression: the compression with which the file is stored, or ``None`` if it is not compressed.
+        :returns: the absolute filepath where the file is stored with the given compression if it exists.
+        """
+        filepath = self.get_filepath(entry, file_type)
+
+        if compression is None:
+            return filepath
+
+        return filepath.with_name(filepath.name + self.COMPRESSION_SUFFIXES[compression])
+
+    def _find_stored_file(
+        self,
+        entry: BibliographyEntry,
+        file_type: FileType,
+    ) -> t.Tuple[pathlib.Path, t.Optional[str]]:
+        """Return the filepath where the file with the given type is stored and the compression it is stored with.
+
+        The file is first looked for with the compression that is currently configured for the file type, and then with
+        any of the other compressions, such that files remain readable when the configured compression changes.
+
+        :param entry: the :class:`biblary.bibliographic.entry.BibliographicEntry` for which to retrieve the file.
+        :param file_type: the file type to retrieve for the given entry.
+        :returns: tuple of the filepath and the compression, which is ``None`` if the file is not compressed.
+        :raises ``FileNotFoundError``: if the file of the given type does not exist for the given entry.
+        """
+        configured = self.compression.get(file_type, None)
+
+        for compression in dict.fromkeys([configured, None, *self.COMPRESSION_SUFFIXES]):
+            filepath = self.get_stored_filepath(entry, file_type, compression)
+
+            if filepath.is_file():
+                return filepath, compression
+
+        raise FileNotFoundError(f'the file `{file_type.value}` does not exist for entry `{entry.identifier}`.')
+
     def get_file(self, entry: BibliographyEntry, file_type: FileType) -> bytes:
         """Return the byte content of a file with the given type for the given bibliographic entry.
 
@@ -56,30 +266,212 @@ class FileSystemStorage(AbstractStorage):
         :raises ``FileNotFoundError``: if the file of the given type does not exist for the given entry.
         :raises ``TypeError``: if the given ``file_type`` is not a valid ``FileType``.
         """
-        with self.get_filepath(entry, file_type).open('rb') as handle:
+        with self.open_file(entry, file_type) as handle:
             return handle.read()
 
-    def put_file(self, content: t.Union[io.BytesIO, bytes], entry: BibliographyEntry, file_type: FileType) -> None:
+    def get_file_encoding(self, entry: BibliographyEntry, file_type: FileType) -> t.Optional[str]:
+        """Return the compression with which a file with the given type for the given bibliographic entry is stored.
+
+        :param entry: the :class:`biblary.bibliographic.entry.BibliographicEntry` for which to retrieve the file.
+        :param file_type: the file type to retrieve for the given entry.
+        :returns: the compression, either ``gzip`` or ``lzma``, or ``None`` if the file is not compressed.
+        :raises ``FileNotFoundError``: if the file of the given type does not exist for the given entry.
+        :raises ``TypeError``: if the given ``file_type`` is not a valid ``FileType``.
+        """
+        return self._find_stored_file(entry, file_type)[1]
+
+    def open_raw_file(self, entry: BibliographyEntry, file_type: FileType) -> t.BinaryIO:
+        """Return a binary stream of the content of a file with the given type as it is stored, i.e., compressed.
+
+        :param entry: the :class:`biblary.bibliographic.entry.BibliographicEntry` for which to retrieve the file.
+        :param file_type: the file type to retrieve for the given entry.
+        :raises ``FileNotFoundError``: if the file of the given type does not exist for the given entry.
+        :raises ``TypeError``: if the given ``file_type`` is not a valid ``FileType``.
+        """
+        return self._find_stored_file(entry, file_type)[0].open('rb')
+
+    def open_file(self, entry: BibliographyEntry, file_type: FileType) -> t.BinaryIO:
+        """Return a binary stream of the content of a file with the given type for the given bibliographic entry.
+
+        :param entry: the :class:`biblary.bibliographic.entry.BibliographicEntry` for which to retrieve the file.
+        :param file_type: the file type to retrieve for the given entry.
+        :raises ``FileNotFoundError``: if the file of the given type does not exist for the given entry.
+        :raises ``TypeError``: if the given ``file_type`` is not a valid ``FileType``.
+        """
+        filepath, compression = self._find_stored_file(entry, file_type)
+
+        if compression == 'gzip':
+            return gzip.open(filepath, 'rb')
+
+        if compression == 'lzma':
+            return lzma.open(filepath, 'rb')
+
+        return filepath.open('rb')
+
+    def put_file(
+        self, content: t.Union[bytes, t.BinaryIO, t.Iterable[bytes]], entry: BibliographyEntry, file_type: FileType
+    ) -> str:
         """Write the given byte content for the given bibliographic entry and file type.
 
+        The content is streamed in chunks to a temporary file in the same folder as the target file, while its SHA-256
+        hash is computed, which is synced to disk and then atomically moved in place, after which the folder is synced
+        as well. This keeps the memory usage bounded regardless of the size of the content and guarantees that a
+        concurrent reader never sees a partially written file. If a compression is configured for the file type, the
+        content is compressed while it is streamed.
+
+        :param content: the content as bytes, as an object with a ``chunks`` method such as a Django ``UploadedFile``,
+            as a binary stream or as an iterable of bytes.
         :param entry: the :class:`biblary.bibliographic.entry.BibliographicEntry` for which to retrieve the file.
         :param file_type: the file type to retrieve for the given entry.
+        :returns: the hexadecimal SHA-256 hash of the content as it is stored, i.e., after compression.
         :raises ``TypeError``: if the ``content`` is not a byte-stream or pure bytes.
         """
-        if isinstance(content, bytes):
-            data = content
+        compression = self.compression.get(file_type, None)
+        filepath = self.get_stored_filepath(entry, file_type, compression)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        chunks = _iter_chunks(content, self.CHUNK_SIZE)
+
+        if compression is not None:
+            chunks = _compress_chunks(chunks, compression)
+
+        if self.deduplicate:
+            # The lock guarantees that a blob is not pruned between checking that it exists and linking to it.
+            with file_lock(self.filepath / self.BLOBS_DIRNAME / self.BLOBS_LOCK_FILENAME):
+                blob = self._put_blob(chunks)
+                self._link_blob(blob, filepath)
+            content_hash = blob.name
         else:
-            data = content.read()
+            # Since the file is replaced, a hardlink to a blob that was written with deduplication is not modified.
+            temporary, content_hash = self._write_temporary(chunks, filepath.parent)
+            _replace(temporary, filepath)
 
-        if not isinstance(data, bytes):
-            raise TypeError(f'invalid type for ``content``, should be bytes or byte-stream but got: `{content}`.')
+        # Remove the file if it was previously stored with another compression, since it would otherwise shadow it.
+        for other in dict.fromkeys([None, *self.COMPRESSION_SUFFIXES]):
+            if other != compression:
+                try:
+                    self.get_stored_filepath(entry, file_type, other).unlink()
+                except FileNotFoundError:
+                    pass
 
-        filepath = self.get_filepath(entry, file_type)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
+        # The version file is replaced atomically, such that a concurrent reader never sees an empty or partial token.
+        temporary, _ = self._write_temporary(uuid.uuid4().hex.encode('utf-8'), self.filepath)
+        _replace(temporary, self.filepath / self.VERSION_FILENAME)
 
-        with filepath.open('wb') as handle:
-            handle.write(data)
-            handle.flush()
+        return content_hash
+
+    def _write_temporary(
+        self,
+        content: t.Union[bytes, t.BinaryIO, t.Iterable[bytes]],
+        dirpath: pathlib.Path,
+    ) -> t.Tuple[pathlib.Path, str]:
+        """Stream the given content to a new temporary file in the given folder and sync it to disk.
+
+        The SHA-256 hash of the content is computed while it is written.
+
+        :param content: the content, see :meth:`put_file` for the supported types.
+        :param dirpath: the folder in which to create the temporary file.
+        :returns: tuple of the filepath of the temporary file and the hexadecimal hash of the content.
+        :raises ``TypeError``: if the ``content`` is not a byte-stream or pure bytes.
+        """
+        content_hash = hashlib.sha256()
+
+        # pylint: disable=consider-using-with
+        handle = tempfile.NamedTemporaryFile('wb', dir=dirpath, prefix='.', suffix='.tmp', delete=False)
+
+        try:
+            with handle:
+                for chunk in _iter_chunks(content, self.CHUNK_SIZE):
+                    content_hash.update(chunk)
+                    handle.write(chunk)
+
+                handle.flush()
+                os.fsync(handle.fileno())
+        except BaseException:
+            os.unlink(handle.name)
+            raise
+
+        return pathlib.Path(handle.name), content_hash.hexdigest()
+
+    def get_blob_filepath(self, content_hash: str) -> pathlib.Path:
+        """Return the filepath of the blob with the given content hash.
+
+        :param content_hash: the hexadecimal SHA-256 hash of the content of the blob.
+        :returns: the absolute filepath where the blob is stored if it exists.
+        """
+        return self.filepath / self.BLOBS_DIRNAME / content_hash[:2] / content_hash
+
+    def _put_blob(self, content: t.Union[bytes, t.BinaryIO, t.Iterable[bytes]]) -> pathlib.Path:
+        """Store the given content as a blob unless a blob with the same content already exists.
+
+        The content is first written to a temporary file while its hash is computed, which is then moved in place if no
+        blob with that hash exists yet, such that a blob is never partially written.
+
+        :param content: the content, see :meth:`put_file` for the supported types.
+        :returns: the filepath of the blob.
+        """
+        dirpath = self.filepath / self.BLOBS_DIRNAME
+        dirpath.mkdir(parents=True, exist_ok=True)
+
+        temporary, content_hash = self._write_temporary(content, dirpath)
+        filepath = self.get_blob_filepath(content_hash)
+
+        if filepath.exists():
+            temporary.unlink()
+        else:
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            _replace(temporary, filepath)
+
+        return filepath
+
+    @staticmethod
+    def _link_blob(blob: pathlib.Path, filepath: pathlib.Path) -> None:
+        """Make the given filepath a hardlink to the given blob, replacing the file if it already exists.
+
+        If hardlinks are not supported, the content of the blob is copied instead.
+
+        :param blob: the filepath of the blob.
+        :param filepath: the filepath of the file of an entry.
+        """
+        try:
+            if os.path.samefile(blob, filepath):
+                return
+        except FileNotFoundError:
+            pass
+
+        temporary = filepath.with_name(f'.{filepath.name}.{uuid.uuid4().hex}')
+
+        try:
+            os.link(blob, temporary)
+        except OSError:
+            shutil.copyfile(blob, temporary)
+
+        _replace(temporary, filepath)
+
+    def prune_blobs(self) -> int:
+        """Delete all blobs that are no longer referenced by the file of any entry.
+
+        A blob is no longer referenced if it has no other hardlinks. Blobs that were copied because hardlinks are not
+        supported are therefore also deleted, which is harmless since the files of the entries are independent copies.
+
+        The blobs are pruned while holding the same lock as :meth:`put_file` holds while it links to a blob, such that a
+        blob to which a concurrent :meth:`put_file` is about to link is not deleted.
+
+        :returns: the number of deleted blobs.
+        """
+        dirpath = self.filepath / self.BLOBS_DIRNAME
+        deleted = 0
+
+        if not dirpath.is_dir():
+            return deleted
+
+        with file_lock(dirpath / self.BLOBS_LOCK_FILENAME):
+            for filepath in dirpath.glob('*/*'):
+                if not filepath.name.startswith('.') and filepath.stat().st_nlink <= 1:
+                    filepath.unlink()
+                    deleted += 1
+
+        return deleted
 
     def exists(self, entry: BibliographyEntry, file_type: FileType) -> bool:
         """Return whether the file with the given type for the given bibliographic entry exists.
@@ -89,4 +481,116 @@ class FileSystemStorage(AbstractStorage):
         :returns: True if the file exists and False otherwise.
         :raises ``TypeError``: if the given ``file_type`` is not a valid ``FileType``.
         """
-        return self.get_filepath(entry, file_type).exists()
+        try:
+            self._find_stored_file(entry, file_type)
+        except FileNotFoundError:
+            return False
+
+        return True
+
+    def exists_many(self, entries: t.Iterable[BibliographyEntry]) -> t.Dict[str, t.Dict[FileType, bool]]:
+        """Return for each of the given bibliographic entries which files exist.
+
+        Instead of checking the existence of each file separately, only the folder of each of the given entries is
+        scanned once for the files it contains, such that the cost does not depend on the size of the storage.
+
+        :param entries: the bibliographic entries for which to determine which files exist.
+        :returns: dictionary mapping the identifier of each entry onto a dictionary that maps each file type onto
+            whether the file exists.
+        """
+        hashes = {entry.identifier: _hash_identifier(str(entry.identifier)) for entry in entries}
+        filenames: t.Dict[str, t.Set[str]] = {}
+
+        for doi_hash in set(hashes.values()):
+            try:
+                with os.scandir(self.filepath / doi_hash) as iterator:
+                    filenames[doi_hash] = {item.name for item in iterator if item.is_file()}
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+
+        # A file can be stored compressed, in which case its filename has the suffix of the compression.
+        suffixes = ('', *self.COMPRESSION_SUFFIXES.values())
+
+        available = {}
+
+        for identifier, doi_hash in hashes.items():
+            stored = filenames.get(doi_hash, set())
+            available[identifier] = {
+                file_type: any(file_type.value + suffix in stored for suffix in suffixes) for file_type in FileType
+            }
+
+        return available
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool in which the blocking operations of the asynchronous interface are run."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.async_workers, thread_name_prefix='biblary-file-system-storage'
+                )
+            return self._executor
+
+    async def _run(self, func: t.Callable, *args: t.Any) -> t.Any:
+        """Run the given function with the given arguments in the thread pool and return its result."""
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(), functools.partial(func, *args))
+
+    async def aget_file(self, entry: BibliographyEntry, file_type: FileType) -> bytes:
+        """Return the byte content of a file with the given type for the given bibliographic entry.
+
+        :param entry: the :class:`biblary.bibliographic.entry.BibliographicEntry` for which to retrieve the file.
+        :param file_type: the file type to retrieve for the given entry.
+        :raises ``FileNotFoundError``: if the file of the given type does not exist for the given entry.
+        :raises ``TypeError``: if the given ``file_type`` is not a valid ``FileType``.
+        """
+        return await self._run(self.get_file, entry, file_type)
+
+    async def aopen_file(self, entry: BibliographyEntry, file_type: FileType) -> AsyncFile:
+        """Return an asynchronous binary stream of the content of a file with the given type for the given entry.
+
+        The file is opened and read in the thread pool.
+
+        :param entry: the :class:`biblary.bibliographic.entry.BibliographicEntry` for which to retrieve the file.
+        :param file_type: the file type to retrieve for the given entry.
+        :raises ``FileNotFoundError``: if the file of the given type does not exist for the given entry.
+        :raises ``TypeError``: if the given ``file_type`` is not a valid ``FileType``.
+        """
+        return AsyncFile(await self._run(self.open_file, entry, file_type), self._run)
+
+    async def aopen_raw_file(self, entry: BibliographyEntry, file_type: FileType) -> AsyncFile:
+        """Return an asynchronous binary stream of the content of a file with the given type as it is stored.
+
+        :param entry: the :class:`biblary.bibliographic.entry.BibliographicEntry` for which to retrieve the file.
+        :param file_type: the file type to retrieve for the given entry.
+        :raises ``FileNotFoundError``: if the file of the given type does not exist for the given entry.
+        :raises ``TypeError``: if the given ``file_type`` is not a valid ``FileType``.
+        """
+        return AsyncFile(await self._run(self.open_raw_file, entry, file_type), self._run)
+
+    async def astat_file(self, entry: BibliographyEntry, file_type: FileType) -> t.Tuple[int, int]:
+        """Return the size and modification time of a file with the given type for the given bibliographic entry.
+
+        :param entry: the :class:`biblary.bibliographic.entry.BibliographicEntry` for which to retrieve the file.
+        :param file_type: the file type to retrieve for the given entry.
+        :returns: tuple of the size in bytes and the modification time in nanoseconds since the epoch.
+        :raises ``FileNotFoundError``: if the file of the given type does not exist for the given entry.
+        """
+        return await self._run(self.stat_file, entry, file_type)
+
+    async def aget_file_encoding(self, entry: BibliographyEntry, file_type: FileType) -> t.Optional[str]:
+        """Return the compression with which a file with the given type for the given bibliographic entry is stored.
+
+        :param entry: the :class:`biblary.bibliographic.entry.BibliographicEntry` for which to retrieve the file.
+        :param file_type: the file type to retrieve for the given entry.
+        :returns: the compression, either ``gzip`` or ``lzma``, or ``None`` if the file is not compressed.
+        :raises ``FileNotFoundError``: if the file of the given type does not exist for the given entry.
+        """
+        return await self._run(self.get_file_encoding, entry, file_type)
+
+    async def aexists_many(self, entries: t.Iterable[BibliographyEntry]) -> t.Dict[str, t.Dict[FileType, bool]]:
+        """Return for each of the given bibliographic entries which files exist.
+
+        :param entries: the bibliographic entries for which to determine which files exist.
+        :returns: dictionary mapping the identifier of each entry onto a dictionary that maps each file type onto
+            whether the file exists.
+        """
+        return await self._run(self.exists_many, list(entries))
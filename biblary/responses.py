@@ -0,0 +1,437 @@
+# -*- coding: utf-8 -*-
+"""Module with responses that serve the content of stored files."""
+import functools
+import os
+import re
+import typing as t
+import uuid
+
+import django
+from django.http import HttpRequest
+from django.http.response import FileResponse, HttpResponse, HttpResponseBase, StreamingHttpResponse
+from django.utils import cache
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+
+from .bibliography.storage import AsyncFile
+
+__all__ = (
+    'aget_file_response', 'get_conditional_response', 'get_file_response', 'parse_accept_encoding',
+    'parse_range_header', 'set_validators'
+)
+
+MAX_RANGES = 16
+"""Maximum number of ranges that are served for a single request, if more are requested the entire file is served."""
+
+BLOCK_SIZE = FileResponse.block_size
+"""Number of bytes that are read from the file at a time."""
+
+_REGEX_RANGE = re.compile(r'^\s*(\d*)\s*-\s*(\d*)\s*$')
+
+
+def parse_range_header(header: str, size: int) -> t.Optional[t.List[t.Tuple[int, int]]]:
+    """Return the byte ranges requested by the value of a ``Range`` header for content of the given size.
+
+    :param header: the value of the ``Range`` header, for example ``bytes=0-499,-500``.
+    :param size: the size of the content in bytes.
+    :returns: list of tuples with the first and last byte position of each satisfiable range, where the last position
+        is inclusive. The list is empty if none of the ranges are satisfiable. If the header is invalid, or does not use
+        the ``bytes`` unit, ``None`` is returned, in which case the header should be ignored.
+    """
+    unit, _, specification = header.partition('=')
+
+    if unit.strip().lower() != 'bytes' or not specification.strip():
+        return None
+
+    ranges = []
+
+    for part in specification.split(','):
+        match = _REGEX_RANGE.match(part)
+
+        if match is None:
+            return None
+
+        first, last = match.groups()
+
+        if not first and not last:
+            return None
+
+        if not first:
+            # Suffix range that requests the last ``last`` bytes of the content.
+            if int(last) > 0 and size > 0:
+                ranges.append((max(size - int(last), 0), size - 1))
+            continue
+
+        if last and int(last) < int(first):
+            return None
+
+        if int(first) < size:
+            ranges.append((int(first), min(int(last), size - 1) if last else size - 1))
+
+    return ranges
+
+
+def parse_accept_encoding(header: t.Optional[str]) -> t.Set[str]:
+    """Return the content codings that are acceptable according to the value of an ``Accept-Encoding`` header.
+
+    Codings with a quality value of zero are not acceptable. The wildcard ``*`` is returned as is and ``x-gzip`` is
+    normalized to ``gzip``.
+
+    :param header: the value of the ``Accept-Encoding`` header, for example ``gzip, br;q=0.5``, or ``None``.
+    :returns: set of the lowercase names of the acceptable codings.
+    """
+    codings = set()
+
+    for part in (header or '').split(','):
+        coding, *parameters = part.split(';')
+        coding = coding.strip().lower()
+
+        if not coding:
+            continue
+
+        quality = 1.0
+
+        for parameter in parameters:
+            name, _, value = parameter.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        if quality > 0:
+            codings.add('gzip' if coding == 'x-gzip' else coding)
+
+    return codings
+
+
+def set_validators(
+    response: HttpResponseBase,
+    etag: t.Optional[str] = None,
+    last_modified: t.Optional[int] = None,
+) -> HttpResponseBase:
+    """Set the ``ETag`` and ``Last-Modified`` headers of the response, unless they are already set.
+
+    :param response: the response.
+    :param etag: the quoted ETag of the response.
+    :param last_modified: the time of last modification of the content of the response in seconds since the epoch.
+    :returns: the response.
+    """
+    if etag is not None and not response.has_header('ETag'):
+        response['ETag'] = etag
+
+    if last_modified is not None and not response.has_header('Last-Modified'):
+        response['Last-Modified'] = http_date(last_modified)
+
+    return response
+
+
+def get_conditional_response(
+    request: HttpRequest,
+    etag: t.Optional[str] = None,
+    last_modified: t.Optional[int] = None,
+) -> t.Optional[HttpResponseBase]:
+    """Return a response if the preconditions of the request allow to short-circuit it.
+
+    This evaluates the ``If-Match``, ``If-Unmodified-Since``, ``If-None-Match`` and ``If-Modified-Since`` headers of the
+    request against the validators of the current representation of the requested resource. It should be called before
+    the response is generated, such that no work is done if the client already has the current representation.
+
+    :param request: the request.
+    :param etag: the quoted ETag of the current representation.
+    :param last_modified: the time of last modification of the current representation in seconds since the epoch.
+    :returns: a ``304 Not Modified`` or ``412 Precondition Failed`` response with the validators set, or ``None`` if the
+        response should be generated normally.
+    """
+    response = cache.get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+    if response is not None:
+        set_validators(response, etag, last_modified)
+
+    return response
+
+
+def _if_range_passes(request: HttpRequest, etag: t.Optional[str], last_modified: t.Optional[int]) -> bool:
+    """Return whether the ``Range`` header of the request should be honored given its ``If-Range`` header.
+
+    The ``If-Range`` header contains either an ETag, which should strongly match the current ETag, or an HTTP date,
+    which should exactly match the current time of last modification. If the header is not present, it passes.
+    """
+    header = request.headers.get('If-Range', None)
+
+    if header is None:
+        return True
+
+    header = header.strip()
+
+    if header.startswith(('"', 'W/')):
+        return etag is not None and not etag.startswith('W/') and parse_etags(header) == [etag]
+
+    return last_modified is not None and parse_http_date_safe(header) == last_modified
+
+
+def _iter_range(handle: t.BinaryIO, first: int, last: int) -> t.Iterator[bytes]:
+    """Yield the content of the given handle from the first up to and including the last byte position in blocks."""
+    handle.seek(first)
+    remaining = last - first + 1
+
+    while remaining > 0:
+        block = handle.read(min(BLOCK_SIZE, remaining))
+
+        if not block:
+            break
+
+        remaining -= len(block)
+        yield block
+
+
+def _iter_stream(handle: t.BinaryIO) -> t.Iterator[bytes]:
+    """Yield the content of the given handle from its current position in blocks and close it once exhausted."""
+    try:
+        yield from iter(functools.partial(handle.read, BLOCK_SIZE), b'')
+    finally:
+        handle.close()
+
+
+def _iter_content(handle: t.BinaryIO, parts: t.List[t.Tuple[bytes, int, int]], closing: bytes) -> t.Iterator[bytes]:
+    """Yield the content of the given parts of the given handle, each preceded by its header, followed by ``closing``.
+
+    If ``closing`` is not empty, the content is a multipart body and each part is terminated by a line break. The handle
+    is closed once all content has been yielded, or when the iterator is closed by the response.
+    """
+    try:
+        for header, first, last in parts:
+            if header:
+                yield header
+            yield from _iter_range(handle, first, last)
+            if closing:
+                yield b'\r\n'
+        if closing:
+            yield closing
+    finally:
+        handle.close()
+
+
+def _get_parts(
+    request: HttpRequest,
+    size: int,
+    content_type: str,
+    etag: t.Optional[str],
+    last_modified: t.Optional[int],
+) -> t.Optional[t.Tuple[t.List[t.Tuple[bytes, int, int]], bytes, int, t.Dict[str, str]]]:
+    """Return the parts of content of the given size that should be served for the ``Range`` header of the request.
+
+    :returns: ``None`` if the entire content should be served. Otherwise a tuple of the parts, each a tuple of its
+        header and first and last byte position, the closing of a multipart body, the length of the response content
+        and the headers of the response. If no parts are returned, the ranges are not satisfiable.
+    """
+    header = request.headers.get('Range', None)
+
+    if header is not None and request.method in ('GET', 'HEAD') and _if_range_passes(request, etag, last_modified):
+        ranges = parse_range_header(header, size)
+    else:
+        ranges = None
+
+    if ranges is None or len(ranges) > MAX_RANGES:
+        return None
+
+    if not ranges:
+        return [], b'', 0, {'Content-Range': f'bytes */{size}'}
+
+    if len(ranges) == 1:
+        first, last = ranges[0]
+        parts = [(b'', first, last)]
+        closing = b''
+        content_length = last - first + 1
+        headers = {'Content-Type': content_type, 'Content-Range': f'bytes {first}-{last}/{size}'}
+    else:
+        boundary = uuid.uuid4().hex
+        template = '--{boundary}\r\nContent-Type: {content_type}\r\nContent-Range: bytes {first}-{last}/{size}\r\n\r\n'
+        parts = []
+
+        for first, last in ranges:
+            header = template.format(boundary=boundary, content_type=content_type, first=first, last=last, size=size)
+            parts.append((header.encode('ascii'), first, last))
+
+        closing = f'--{boundary}--\r\n'.encode('ascii')
+        content_length = sum(len(part) + last - first + 1 + 2 for part, first, last in parts) + len(closing)
+        headers = {'Content-Type': f'multipart/byteranges; boundary={boundary}'}
+
+    return parts, closing, content_length, headers
+
+
+def _get_streaming_response(
+    content: t.Union[t.Iterator[bytes], t.AsyncIterator[bytes]],
+    status: int,
+    content_length: int,
+    headers: t.Dict[str, str],
+    filename: str,
+) -> StreamingHttpResponse:
+    """Return a streaming response for the given content of a file that is served as an attachment."""
+    response = StreamingHttpResponse(content, status=status, headers=headers)
+    response['Content-Length'] = str(content_length)
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response['Accept-Ranges'] = 'bytes'
+    return response
+
+
+def _get_unranged_response(
+    content: t.Union[t.Iterator[bytes], t.AsyncIterator[bytes]], filename: str, content_type: str
+) -> StreamingHttpResponse:
+    """Return a streaming response for the given content of unknown length of a file that is served as an attachment.
+
+    The response does not have a ``Content-Length`` header and declares that ranges are not supported.
+    """
+    response = StreamingHttpResponse(content, headers={'Content-Type': content_type})
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response['Accept-Ranges'] = 'none'
+    return response
+
+
+def get_file_response(
+    request: HttpRequest,
+    handle: t.BinaryIO,
+    filename: str,
+    content_type: str,
+    etag: t.Optional[str] = None,
+    last_modified: t.Optional[int] = None,
+    ranges: bool = True,
+) -> HttpResponseBase:
+    """Return a response that streams the content of the given binary stream, honoring a ``Range`` request header.
+
+    A single satisfiable range is served as a ``206 Partial Content`` response with a ``Content-Range`` header. Multiple
+    ranges are served as a ``multipart/byteranges`` response. If none of the ranges are satisfiable, a ``416 Range Not
+    Satisfiable`` response is returned. In all other cases, the entire content is served. Only the requested ranges are
+    read from the stream, by seeking to their start. If the request contains an ``If-Range`` header that does not match
+    the given validators, the ``Range`` header is ignored.
+
+    :param request: the request.
+    :param handle: seekable binary stream with the content, which is closed by the response.
+    :param filename: the filename to use in the ``Content-Disposition`` header.
+    :param content_type: the content type of the content.
+    :param etag: optional quoted ETag of the content, which is set on the response.
+    :param last_modified: optional time of last modification of the content in seconds since the epoch, which is set
+        on the response.
+    :param ranges: boolean, when ``False``, the ``Range`` header is ignored and the content is streamed from the start
+        without a ``Content-Length`` header. This should be used for streams whose size is not known in advance and
+        that are expensive to seek, such as a file that is decompressed while it is read.
+    :returns: the response.
+    """
+    if not ranges:
+        return set_validators(_get_unranged_response(_iter_stream(handle), filename, content_type), etag, last_modified)
+
+    size = handle.seek(0, os.SEEK_END)
+    handle.seek(0)
+    result = _get_parts(request, size, content_type, etag, last_modified)
+
+    if result is None:
+        response = FileResponse(handle, as_attachment=True, filename=filename, content_type=content_type)
+        response['Accept-Ranges'] = 'bytes'
+        return set_validators(response, etag, last_modified)
+
+    parts, closing, content_length, headers = result
+
+    if not parts:
+        handle.close()
+        response = HttpResponse(status=416, headers={**headers, 'Accept-Ranges': 'bytes'})
+        return set_validators(response, etag, last_modified)
+
+    content = _iter_content(handle, parts, closing)
+    response = _get_streaming_response(content, 206, content_length, headers, filename)
+
+    return set_validators(response, etag, last_modified)
+
+
+async def _aiter_stream(handle: AsyncFile) -> t.AsyncIterator[bytes]:
+    """Asynchronous counterpart of :func:`_iter_stream` for an asynchronous binary stream."""
+    try:
+        while True:
+            block = await handle.read(BLOCK_SIZE)
+            if not block:
+                break
+            yield block
+    finally:
+        await handle.close()
+
+
+async def _aiter_content(
+    handle: AsyncFile,
+    parts: t.List[t.Tuple[bytes, int, int]],
+    closing: bytes,
+) -> t.AsyncIterator[bytes]:
+    """Asynchronous counterpart of :func:`_iter_content` for an asynchronous binary stream."""
+    try:
+        for header, first, last in parts:
+            if header:
+                yield header
+            await handle.seek(first)
+            remaining = last - first + 1
+            while remaining > 0:
+                block = await handle.read(min(BLOCK_SIZE, remaining))
+                if not block:
+                    break
+                remaining -= len(block)
+                yield block
+            if closing:
+                yield b'\r\n'
+        if closing:
+            yield closing
+    finally:
+        await handle.close()
+
+
+async def aget_file_response(
+    request: HttpRequest,
+    handle: AsyncFile,
+    filename: str,
+    content_type: str,
+    etag: t.Optional[str] = None,
+    last_modified: t.Optional[int] = None,
+    ranges: bool = True,
+) -> HttpResponseBase:
+    """Return a response that streams the content of the given asynchronous binary stream.
+
+    This is the asynchronous counterpart of :func:`get_file_response`, whose content is read without blocking the event
+    loop. Asynchronous streaming responses are only supported as of Django 4.2. For older versions, the response of
+    :func:`get_file_response` for the wrapped synchronous stream is returned instead, whose content is read by the
+    handler in the same way as for a synchronous view.
+
+    :param request: the request.
+    :param handle: seekable asynchronous binary stream with the content, which is closed by the response.
+    :param filename: the filename to use in the ``Content-Disposition`` header.
+    :param content_type: the content type of the content.
+    :param etag: optional quoted ETag of the content, which is set on the response.
+    :param last_modified: optional time of last modification of the content in seconds since the epoch, which is set
+        on the response.
+    :param ranges: boolean, when ``False``, the ``Range`` header is ignored and the content is streamed from the start
+        without a ``Content-Length`` header, see :func:`get_file_response`.
+    :returns: the response.
+    """
+    if django.VERSION < (4, 2):
+        return get_file_response(request, handle.raw, filename, content_type, etag, last_modified, ranges)
+
+    if not ranges:
+        return set_validators(
+            _get_unranged_response(_aiter_stream(handle), filename, content_type), etag, last_modified
+        )
+
+    size = await handle.seek(0, os.SEEK_END)
+    result = _get_parts(request, size, content_type, etag, last_modified)
+
+    if result is None:
+        parts = [(b'', 0, size - 1)] if size else []
+        response = _get_streaming_response(
+            _aiter_content(handle, parts, b''), 200, size, {'Content-Type': content_type}, filename
+        )
+        return set_validators(response, etag, last_modified)
+
+    parts, closing, content_length, headers = result
+
+    if not parts:
+        await handle.close()
+        response = HttpResponse(status=416, headers={**headers, 'Accept-Ranges': 'bytes'})
+        return set_validators(response, etag, last_modified)
+
+    content = _aiter_content(handle, parts, closing)
+    response = _get_streaming_response(content, 206, content_length, headers, filename)
+
+    return set_validators(response, etag, last_modified)
@@ -64,5 +64,51 @@ class Settings:
         """
         return self._get_setting('BIBLIOGRAPHY_MAIN_AUTHOR_CLASS', 'biblary-entry-author-main')
 
+    @property
+    def file_offload(self) -> t.Optional[str]:
+        """Return the mechanism with which serving stored files is offloaded to the web server, if any.
+
+        The value should be ``x-accel-redirect`` for nginx, ``x-sendfile`` for Apache and lighttpd, or ``None`` to serve
+        the files from Python. Offloading is only supported for the
+        :class:`biblary.bibliography.storage.file_system.FileSystemStorage`.
+        """
+        return self._get_setting('FILE_OFFLOAD', None)
+
+    @property
+    def file_offload_prefix(self) -> str:
+        """Return the URL prefix of the internal location of the web server that serves the stored files.
+
+        This is only used for the ``x-accel-redirect`` offload. The location should map onto the base folder of the
+        :class:`biblary.bibliography.storage.file_system.FileSystemStorage`.
+        """
+        return self._get_setting('FILE_OFFLOAD_PREFIX', '/protected/')
+
+    @property
+    def index_cache(self) -> t.Optional[str]:
+        """Return the alias of the Django cache in which the rendered index is cached, or ``None`` to disable it.
+
+        The rendered index is cached under a key that includes the content hash of the bibliography and the version of
+        the storage, such that it is rendered again as soon as either changes.
+        """
+        return self._get_setting('INDEX_CACHE', 'default')
+
+    @property
+    def index_cache_timeout(self) -> t.Optional[int]:
+        """Return the number of seconds that the rendered index is cached, or ``None`` to cache it indefinitely."""
+        return self._get_setting('INDEX_CACHE_TIMEOUT', 60 * 60 * 24)
+
+    @property
+    def index_page_size(self) -> t.Optional[int]:
+        """Return the default number of entries per page of the index, or ``None`` to show all entries on one page.
+
+        The page size can be changed per request through the ``page_size`` query parameter.
+        """
+        return self._get_setting('INDEX_PAGE_SIZE', None)
+
+    @property
+    def index_page_size_max(self) -> int:
+        """Return the maximum number of entries per page of the index that can be requested."""
+        return self._get_setting('INDEX_PAGE_SIZE_MAX', 1000)
+
 
 settings: Settings = Settings('BIBLARY')
@@ -1,18 +1,29 @@
 # -*- coding: utf-8 -*-
 """Module with template tags operating on the authors of bibliographic entries."""
+import functools
 import re
 import typing as t
 
 from django import template
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from biblary.bibliography.authors import get_author_key
 
 register = template.Library()
 
 
-@register.simple_tag()
-def main_author_class(author: str) -> t.Optional[str]:
-    """Return whether the given author matches any of the patterns in the ``BIBLIOGRAPHY_MAIN_AUTHOR_PATTERS``.
+@functools.lru_cache(maxsize=None)
+def get_main_author_matcher() -> t.Optional[t.Callable[[str], t.Any]]:
+    """Return a callable that matches an author against any of the patterns in ``BIBLIOGRAPHY_MAIN_AUTHOR_PATTERNS``.
 
-    :param author: the author.
+    The patterns are compiled into a single alternation, such that an author is matched against all of them at once.
+    Patterns that cannot be part of an alternation, for example because they start with global inline flags such as
+    ``(?i)``, are matched one by one instead. The matcher is compiled once and cached until the setting changes.
+
+    :returns: the matcher, which returns a truthy value if the author matches, or ``None`` if no patterns are
+        configured.
+    :raises ``TypeError``: if the setting is not a tuple.
     """
     from biblary.settings import settings
 
@@ -21,7 +32,58 @@ def main_author_class(author: str) -> t.Optional[str]:
     if not isinstance(patterns, tuple):
         raise TypeError('invalid configuration: setting `BIBLIOGRAPHY_MAIN_AUTHOR_PATTERS` should be a tuple.')
 
-    if patterns and any(re.match(pattern, author) for pattern in patterns):
+    if not patterns:
+        return None
+
+    try:
+        return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns)).match
+    except re.error:
+        regexes = [re.compile(pattern) for pattern in patterns]
+        return lambda author: any(regex.match(author) for regex in regexes)
+
+
+@functools.lru_cache(maxsize=2**16)
+def _get_main_author_class(author: str) -> t.Optional[str]:
+    """Return the CSS class of the given author, which is memoized per author until the settings change."""
+    from biblary.settings import settings
+
+    matcher = get_main_author_matcher()
+
+    if matcher is not None and matcher(author):
         return settings.bibliography_main_author_class
 
     return None
+
+
+@receiver(setting_changed)
+def clear_main_author_cache(setting: str, **kwargs) -> None:  # pylint: disable=unused-argument
+    """Clear the cached matcher and classes of the main authors when one of the settings that determine them changes.
+
+    :param setting: the name of the setting that changed.
+    """
+    from biblary.settings import settings
+
+    if setting in (
+        f'{settings.prefix}_BIBLIOGRAPHY_MAIN_AUTHOR_PATTERNS',
+        f'{settings.prefix}_BIBLIOGRAPHY_MAIN_AUTHOR_CLASS',
+    ):
+        get_main_author_matcher.cache_clear()
+        _get_main_author_class.cache_clear()
+
+
+@register.simple_tag()
+def main_author_class(author: str) -> t.Optional[str]:
+    """Return whether the given author matches any of the patterns in the ``BIBLIOGRAPHY_MAIN_AUTHOR_PATTERS``.
+
+    :param author: the author.
+    """
+    return _get_main_author_class(author)
+
+
+@register.filter()
+def author_key(author: str) -> str:
+    """Return the normalized key of the given author, which is used in the URL of the page of the author.
+
+    :param author: the author.
+    """
+    return get_author_key(author)
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""Module with template tags operating on bibliographic entries."""
+import typing as t
+
+from django import template
+
+from biblary.bibliography.entry import BibliographyEntry
+
+register = template.Library()
+
+
+@register.filter()
+def entry_files(files: t.Optional[t.Mapping[str, t.Dict[str, bool]]], entry: BibliographyEntry) -> t.Dict[str, bool]:
+    """Return which files exist for the given entry, see :meth:`biblary.utils.BibliographyMixin.get_entry_files`.
+
+    :param files: mapping of the identifier of each entry onto a dictionary that maps the value of each file type onto
+        whether the file exists.
+    :param entry: the entry.
+    """
+    return (files or {}).get(entry.identifier, {})
@@ -2,7 +2,17 @@
 """Module that defines the URLs of this application."""
 from django.urls import path
 
-from .views import BiblaryBibtexView, BiblaryFileView, BiblaryIndexView, BiblaryUploadEntryView, BiblaryUploadFileView
+from .views import (
+    BiblaryAuthorView,
+    BiblaryBibtexView,
+    BiblaryExportView,
+    BiblaryFileView,
+    BiblaryIndexView,
+    BiblaryJsonView,
+    BiblarySearchView,
+    BiblaryUploadEntryView,
+    BiblaryUploadFileView,
+)
 
 app_name = 'biblary'  # pylint: disable=invalid-name
 
@@ -10,6 +20,11 @@ urlpatterns = [
     path('', BiblaryIndexView.as_view(), name='index'),
     path('upload-entry', BiblaryUploadEntryView.as_view(), name='upload-entry'),
     path('upload-file', BiblaryUploadFileView.as_view(), name='upload-file'),
+    path('search', BiblarySearchView.as_view(), name='search'),
+    path('author/<author>', BiblaryAuthorView.as_view(), name='author'),
+    path('json', BiblaryJsonView.as_view(), name='json'),
+    path('csl-json', BiblaryJsonView.as_view(output_format='csl-json'), name='csl-json'),
+    path('export', BiblaryExportView.as_view(), name='export'),
     path('bibtex/<identifier>', BiblaryBibtexView.as_view(), name='bibtex'),
     path('file/<identifier>/<file_type>', BiblaryFileView.as_view(), name='file'),
 ]
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""Module that defines the URLs of this application with the asynchronous variants of the views where available.
+
+These URLs can be used instead of those of :mod:`biblary.urls` when the project is deployed on an ASGI server.
+"""
+from django.urls import path
+
+from .views import (
+    AsyncBiblaryBibtexView,
+    AsyncBiblaryFileView,
+    AsyncBiblaryIndexView,
+    BiblaryAuthorView,
+    BiblaryExportView,
+    BiblaryJsonView,
+    BiblarySearchView,
+    BiblaryUploadEntryView,
+    BiblaryUploadFileView,
+)
+
+app_name = 'biblary'  # pylint: disable=invalid-name
+
+urlpatterns = [
+    path('', AsyncBiblaryIndexView.as_view(), name='index'),
+    path('upload-entry', BiblaryUploadEntryView.as_view(), name='upload-entry'),
+    path('upload-file', BiblaryUploadFileView.as_view(), name='upload-file'),
+    path('search', BiblarySearchView.as_view(), name='search'),
+    path('author/<author>', BiblaryAuthorView.as_view(), name='author'),
+    path('json', BiblaryJsonView.as_view(), name='json'),
+    path('csl-json', BiblaryJsonView.as_view(output_format='csl-json'), name='csl-json'),
+    path('export', BiblaryExportView.as_view(), name='export'),
+    path('bibtex/<identifier>', AsyncBiblaryBibtexView.as_view(), name='bibtex'),
+    path('file/<identifier>/<file_type>', AsyncBiblaryFileView.as_view(), name='file'),
+]
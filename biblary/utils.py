@@ -4,8 +4,11 @@ from importlib import import_module
 import typing as t
 
 from django.core.exceptions import ImproperlyConfigured
+from django.utils.http import quote_etag
 
-from .bibliography import Bibliography
+from .bibliography import Bibliography, BibliographyEntry
+from .bibliography.adapter import BibliographyAdapter
+from .bibliography.cache import bibliography_cache
 
 
 class BibliographyMixin:
@@ -43,31 +46,169 @@ class BibliographyMixin:
 
         return instance
 
+    @staticmethod
+    def get_cache_key() -> t.Tuple[t.Optional[str], str, t.Optional[str], str]:
+        """Return the key under which the bibliography for the configured settings is cached.
+
+        The key is derived from the configured adapter and storage classes and their configuration, such that changing
+        any of these settings will cause a new bibliography to be constructed.
+        """
+        from biblary.settings import settings
+
+        return (
+            settings.bibliography_adapter,
+            repr(settings.bibliography_adapter_configuration),
+            settings.bibliography_storage,
+            repr(settings.bibliography_storage_configuration),
+        )
+
     @classmethod
-    def get_bibliography(cls, storage_required=False) -> Bibliography:
+    def get_bibliography(cls, storage_required=False, cached=True) -> Bibliography:
         """Construct the bibliography with bibliographic entries from the configured settings.
 
+        Constructing the bibliography requires parsing all entries from the bibliography source, which can be expensive
+        for large bibliographies. Therefore, the bibliography is cached in the process-wide
+        :data:`biblary.bibliography.cache.bibliography_cache` and reused for as long as its source does not change.
+
         :param storage_required: boolean to indicate whether a configured storage is requird.
+        :param cached: boolean, when ``False``, a new bibliography is always constructed and not cached. This should be
+            used when the bibliography is going to be modified, to not affect the shared cached instance. The adapter of
+            the cached bibliography is still reused, such that only what changed in the source is parsed.
         :raises :class`django.core.exceptions.ImproperlyConfigured`: if bibliography cannot be properly instantiated.
         :raises :class`django.core.exceptions.ImproperlyConfigured`: if no storage is configured and the argument
             ``storage_required`` is set to ``True``.
         """
         from biblary.settings import settings
 
-        try:
-            adapter = cls.construct_class(settings.bibliography_adapter, settings.bibliography_adapter_configuration)
-        except ImproperlyConfigured as exc:
-            raise ImproperlyConfigured(f'failed to construct the configured bibliography adapter: {exc}') from exc
+        key = cls.get_cache_key()
+
+        if cached:
+            bibliography = bibliography_cache.get(key)
+
+            if bibliography is not None:
+                if bibliography.storage is None and storage_required:
+                    raise ImproperlyConfigured(
+                        'file storage for this bibliography is required, but none has been configured.'
+                    )
+                return bibliography
+
+        stale = bibliography_cache.peek(key)
+
+        if stale is not None:
+            # Reuse the adapter of the cached bibliography, which allows it to only parse what changed in the source.
+            adapter = stale.adapter
+            storage = stale.storage
+        else:
+            try:
+                adapter = cls.construct_class(
+                    settings.bibliography_adapter, settings.bibliography_adapter_configuration
+                )
+            except ImproperlyConfigured as exc:
+                raise ImproperlyConfigured(f'failed to construct the configured bibliography adapter: {exc}') from exc
+
+            if adapter is None:
+                raise ImproperlyConfigured('no bibliography adapter has been configured.')
+
+            try:
+                storage = cls.construct_class(
+                    settings.bibliography_storage, settings.bibliography_storage_configuration
+                )
+            except ImproperlyConfigured as exc:
+                raise ImproperlyConfigured(f'failed to construct the configured bibliography storage: {exc}') from exc
+
+        if storage is None and storage_required:
+            raise ImproperlyConfigured('file storage for this bibliography is required, but none has been configured.')
 
-        if adapter is None:
-            raise ImproperlyConfigured('no bibliography adapter has been configured.')
+        version = adapter.get_version()
+        bibliography = Bibliography(adapter, storage=storage)
 
-        try:
-            storage = cls.construct_class(settings.bibliography_storage, settings.bibliography_storage_configuration)
-        except ImproperlyConfigured as exc:
-            raise ImproperlyConfigured(f'failed to construct the configured bibliography storage: {exc}') from exc
+        if cached:
+            bibliography_cache.set(key, version, bibliography)
 
-        if storage is None and storage_required:
+        return bibliography
+
+    @classmethod
+    def get_current_bibliography(cls, storage_required=False) -> Bibliography:
+        """Return the cached bibliography for the configured settings, even if it is stale.
+
+        The adapter and storage of a stale bibliography always read from the current bibliography source and storage,
+        which allows to retrieve individual entries, files or validators through them without having to construct an up
+        to date bibliography. Only if no bibliography has been cached yet, is the bibliography constructed first.
+
+        :param storage_required: boolean to indicate whether a configured storage is requird.
+        :raises :class`django.core.exceptions.ImproperlyConfigured`: if bibliography cannot be properly instantiated.
+        :raises :class`django.core.exceptions.ImproperlyConfigured`: if no storage is configured and the argument
+            ``storage_required`` is set to ``True``.
+        """
+        bibliography = bibliography_cache.peek(cls.get_cache_key())
+
+        if bibliography is None:
+            bibliography = cls.get_bibliography(storage_required=storage_required)
+
+        if bibliography.storage is None and storage_required:
             raise ImproperlyConfigured('file storage for this bibliography is required, but none has been configured.')
 
-        return Bibliography(adapter, storage=storage)
+        return bibliography
+
+    @classmethod
+    def get_adapter(cls, storage_required=False) -> BibliographyAdapter:
+        """Return the adapter of the bibliography for the configured settings.
+
+        See :meth:`get_current_bibliography` for details, the adapter does not have to parse the bibliography.
+
+        :param storage_required: boolean to indicate whether a configured storage is requird.
+        :raises :class`django.core.exceptions.ImproperlyConfigured`: if bibliography cannot be properly instantiated.
+        :raises :class`django.core.exceptions.ImproperlyConfigured`: if no storage is configured and the argument
+            ``storage_required`` is set to ``True``.
+        """
+        return cls.get_current_bibliography(storage_required=storage_required).adapter
+
+    @staticmethod
+    def get_entry_files(bibliography: Bibliography,
+                        entries: t.Sequence[BibliographyEntry]) -> t.Dict[str, t.Dict[str, bool]]:
+        """Return which files exist in the storage of the bibliography for each of the given entries.
+
+        The result is specific to the request that renders the entries and should be looked up in the template through
+        the ``entry_files`` filter. The entries themselves are shared by all requests through the cached bibliography,
+        so they should not be modified.
+
+        :param bibliography: the bibliography.
+        :param entries: the entries of the bibliography for which to determine the existing files.
+        :returns: mapping of the identifier of each entry onto a dictionary that maps the value of each file type onto
+            whether the file exists. The mapping is empty if the bibliography has no storage.
+        """
+        if bibliography.storage is None:
+            return {}
+
+        available = bibliography.storage.exists_many(entries)
+
+        return {
+            key: {file_type.value: exists for file_type, exists in files.items()} for key, files in available.items()
+        }
+
+    @classmethod
+    def get_etag(cls, include_storage=False) -> t.Optional[str]:
+        """Return a strong ETag for the current content of the configured bibliography.
+
+        The ETag is derived from the content hash of the bibliography source, which can be determined without parsing
+        the bibliography.
+
+        :param include_storage: boolean, when ``True``, the version of the configured storage, if any, is included
+            such that the ETag also changes when a file is added to the storage.
+        :returns: the quoted ETag or ``None`` if the content hash or the version of the storage cannot be determined.
+        """
+        bibliography = cls.get_current_bibliography()
+        content_hash = bibliography.adapter.get_content_hash()
+
+        if content_hash is None:
+            return None
+
+        if include_storage and bibliography.storage is not None:
+            version = bibliography.storage.get_version()
+
+            if version is None:
+                return None
+
+            return quote_etag(f'{content_hash}-{version}')
+
+        return quote_etag(content_hash)
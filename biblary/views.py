@@ -1,45 +1,540 @@
 # -*- coding: utf-8 -*-
 """Module that defines the views of this application."""
+import asyncio
+import functools
+import hashlib
 import io
 import typing as t
 
+from asgiref.sync import sync_to_async
+import django
+from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured, SuspiciousOperation
+from django.core.paginator import InvalidPage, Paginator
 from django.forms import Form
-from django.http.response import Http404, HttpResponse
+from django.http.response import Http404, HttpResponse, HttpResponseBase, StreamingHttpResponse
 from django.urls import reverse_lazy
+from django.utils.cache import patch_vary_headers
+from django.utils.http import quote_etag
+from django.utils.text import compress_sequence
 from django.views.generic import FormView, TemplateView, View
 
+from .bibliography import Bibliography
 from .bibliography.adapter.bibtex import BibtexBibliography
+from .bibliography.entry import BibliographyEntry
 from .bibliography.exceptions import BibliographicEntryParsingError, DuplicateEntryError
-from .bibliography.storage import FileType
+from .bibliography.serializers import FIELDS, FORMATS, iter_json
+from .bibliography.storage import AbstractAsyncStorage, AsyncStorageAdapter, FileSystemStorage, FileType
 from .forms import BibliographyUploadEntryForm, BibliographyUploadFileForm
+from .responses import (
+    aget_file_response,
+    get_conditional_response,
+    get_file_response,
+    parse_accept_encoding,
+    set_validators,
+)
 from .utils import BibliographyMixin
 
 
-class BiblaryIndexView(BibliographyMixin, TemplateView):
+class EntryFilterMixin:
+    """Mixin for views that filter the entries of the bibliography through query parameters.
+
+    The entries can be limited to an inclusive range of years through the ``year_from`` and ``year_to`` query parameters
+    and filtered by the values of the facets of :attr:`filter_facets` through query parameters with the name of the
+    facet.
+    """
+
+    filter_facets = ('entry_type', 'venue', 'keyword')
+    """Facets by which the entries can be filtered through query parameters, in addition to the range of years."""
+
+    def get_query_integer(self, name: str, default: t.Optional[int] = None) -> t.Optional[int]:
+        """Return the value of the query parameter with the given name as an integer.
+
+        :param name: the name of the query parameter.
+        :param default: the value to return if the query parameter is not specified or empty.
+        :raises :class:`django.core.exceptions.SuspiciousOperation`: if the value is not an integer.
+        """
+        value = self.request.GET.get(name, '').strip()
+
+        if not value:
+            return default
+
+        try:
+            return int(value)
+        except ValueError as exc:
+            raise SuspiciousOperation(f'The query parameter `{name}` should be an integer, got: `{value}`.') from exc
+
+    def get_selection(self) -> t.Dict[str, t.List[str]]:
+        """Return the selected values of the facets that are specified through the query parameters.
+
+        :returns: mapping of the name of each facet of :attr:`filter_facets` that is specified onto its values.
+        """
+        selection = {}
+
+        for facet in self.filter_facets:
+            values = [value for value in self.request.GET.getlist(facet) if value]
+
+            if values:
+                selection[facet] = values
+
+        return selection
+
+    def get_filtered_entries(self, bibliography: Bibliography) -> t.List[BibliographyEntry]:
+        """Return the entries of the given bibliography that match the query parameters sorted by descending year.
+
+        :param bibliography: the bibliography.
+        :raises :class:`django.core.exceptions.SuspiciousOperation`: if a query parameter is invalid.
+        """
+        year_from = self.get_query_integer('year_from')
+        year_to = self.get_query_integer('year_to')
+        return bibliography.get_entries_by_year(year_from, year_to, self.get_selection())
+
+
+class BiblaryIndexView(BibliographyMixin, EntryFilterMixin, TemplateView):
     """View with index of bibliography contents."""
 
     template_name = 'biblary/index.html'
 
+    facet_limit = 20
+    """Maximum number of values that are shown for each facet."""
+
+    def get(self, request, *args, **kwargs):
+        """Return the rendered index or ``304 Not Modified`` if the client already has the current version.
+
+        The ETag of the index is derived from the content hash of the bibliography and the version of the storage, such
+        that the bibliography does not have to be parsed to determine whether the index has changed. Unless disabled
+        through the ``BIBLARY_INDEX_CACHE`` setting, the rendered index is cached in the Django cache, such that it only
+        has to be rendered again when the bibliography or the storage changes.
+        """
+        from biblary.settings import settings
+
+        etag = self.get_etag(include_storage=True)
+        response = get_conditional_response(request, etag=etag)
+
+        if response is not None:
+            return response
+
+        parameters = self.get_index_parameters() if etag is not None and settings.index_cache is not None else None
+
+        if parameters is None:
+            return set_validators(super().get(request, *args, **kwargs), etag)
+
+        cache = caches[settings.index_cache]
+        key = self.get_index_cache_key(etag, parameters)
+        content = cache.get(key)
+
+        if content is not None:
+            return set_validators(HttpResponse(content), etag)
+
+        response = super().get(request, *args, **kwargs)
+        response.render()
+        cache.set(key, response.content, settings.index_cache_timeout)
+
+        return set_validators(response, etag)
+
+    def get_index_parameters(self) -> t.Optional[t.Tuple[t.Hashable, ...]]:
+        """Return the normalized query parameters that determine the rendered index, or ``None`` if it is not cached.
+
+        Only requests whose query parameters are all known and valid are cached, where the range of years has to lie
+        within the years of the bibliography and the selected values of the facets have to exist. This bounds the number
+        of rendered indexes that can be cached to what the content of the bibliography allows, regardless of the
+        requests that clients make.
+
+        :returns: tuple of the range of years, the page, the page size and the selected values of each facet, or
+            ``None`` if the rendered index should not be cached.
+        :raises :class:`django.core.exceptions.SuspiciousOperation`: if a query parameter is invalid.
+        """
+        known = {'page', 'page_size', 'year_from', 'year_to', *self.filter_facets}
+
+        if any(name not in known for name in self.request.GET):
+            return None
+
+        if any(len(self.request.GET.getlist(name)) > 1 for name in ('page', 'page_size', 'year_from', 'year_to')):
+            return None
+
+        bibliography = self.get_bibliography()
+        years = [year for year in bibliography.get_year_counts() if year is not None]
+        year_from = self.get_query_integer('year_from')
+        year_to = self.get_query_integer('year_to')
+
+        for year in (year_from, year_to):
+            if year is not None and (not years or not min(years) <= year <= max(years)):
+                return None
+
+        try:
+            page = int(self.request.GET.get('page', '').strip() or 1)
+        except ValueError:
+            return None
+
+        facets = bibliography.get_facets()
+        selection = []
+
+        for facet, values in sorted(self.get_selection().items()):
+            if not all(facets.contains(facet, value) for value in values):
+                return None
+            selection.append((facet, tuple(sorted(set(values)))))
+
+        return year_from, year_to, page, self.get_page_size(), tuple(selection)
+
+    def get_index_cache_key(self, etag: str, parameters: t.Tuple[t.Hashable, ...]) -> str:
+        """Return the key under which the rendered index is cached.
+
+        The key is derived from the ETag of the index, which changes whenever the content of the bibliography or the
+        storage changes, for example through ``Bibliography.save`` or ``put_file``. This means that a stale index is
+        never served and does not have to be deleted explicitly: it is simply no longer used and expires. The key also
+        includes the normalized query parameters and the settings that affect the rendering. These are hashed, such
+        that the length of the key is fixed.
+
+        :param etag: the ETag of the index.
+        :param parameters: the normalized query parameters as returned by :meth:`get_index_parameters`.
+        """
+        from biblary.settings import settings
+
+        identity = (
+            etag,
+            self.request.path,
+            parameters,
+            self.get_cache_key(),
+            settings.bibliography_main_author_patterns,
+            settings.bibliography_main_author_class,
+        )
+
+        return f'biblary:index:{hashlib.sha256(repr(identity).encode("utf-8")).hexdigest()}'
+
+    def get_page_size(self) -> t.Optional[int]:
+        """Return the number of entries per page, or ``None`` if all entries should be shown on a single page.
+
+        The page size is taken from the ``page_size`` query parameter, or the ``BIBLARY_INDEX_PAGE_SIZE`` setting if it
+        is not specified, and is limited to the ``BIBLARY_INDEX_PAGE_SIZE_MAX`` setting.
+        """
+        from biblary.settings import settings
+
+        page_size = self.get_query_integer('page_size', settings.index_page_size)
+
+        if page_size is None:
+            return None
+
+        return max(1, min(page_size, settings.index_page_size_max))
+
+    def get_facet_context(
+        self, selection: t.Dict[str, t.List[str]], counts: t.Dict[str, t.Dict[t.Hashable, int]]
+    ) -> t.List[t.Tuple[str, t.List[t.Tuple[t.Hashable, int, bool, str]]]]:
+        """Return the values of the facets to render with their count, whether they are selected and their query.
+
+        The query of a value toggles whether it is selected. Only the :attr:`facet_limit` values with the largest counts
+        are included, in addition to the values that are selected.
+
+        :param selection: the selected values of the facets.
+        :param counts: the number of entries per value for each facet.
+        :returns: list of tuples of the name of a facet and the list of its values.
+        """
+        facets = []
+
+        for facet in self.filter_facets:
+            selected = selection.get(facet, [])
+            values = []
+
+            for index, (value, count) in enumerate(counts[facet].items()):
+                active = value in selected
+
+                if index >= self.facet_limit and not active:
+                    continue
+
+                query = self.request.GET.copy()
+                query.pop('page', None)
+                query.setlist(facet, [other for other in selected if other != value] + ([] if active else [value]))
+                values.append((value, count, active, query.urlencode()))
+
+            if values:
+                facets.append((facet, values))
+
+        return facets
+
     def get_context_data(self, **kwargs):
-        """Add the entries of the bibliography to the context."""
+        """Add the entries of the bibliography to the context.
+
+        The entries can be limited to an inclusive range of years through the ``year_from`` and ``year_to`` query
+        parameters, filtered by the values of the facets of :attr:`filter_facets` through query parameters with the
+        name of the facet, and paginated through the ``page`` and ``page_size`` query parameters. Only the entries of
+        the requested page are rendered and only for those is the existence of their files determined. The context also
+        contains the number of matching entries per year and per value of each facet, which can be used to navigate
+        the index. Both the filtering and the counts are resolved through the facet index of the bibliography.
+
+        :raises :class:`django.core.exceptions.SuspiciousOperation`: if a query parameter is invalid.
+        :raises :class:`django.core.exceptions.Http404`: if the requested page does not exist.
+        """
         bibliography = self.get_bibliography()
+        year_from = self.get_query_integer('year_from')
+        year_to = self.get_query_integer('year_to')
+        page_size = self.get_page_size()
+        selection = self.get_selection()
 
         context = super().get_context_data(**kwargs)
-        context['entries'] = []
+        context['entries'] = bibliography.get_entries_by_year(year_from, year_to, selection)
+        context['year_from'] = year_from
+        context['year_to'] = year_to
+        context['page_obj'] = None
+
+        if page_size is not None:
+            try:
+                page = Paginator(context['entries'], page_size).page(self.request.GET.get('page', 1))
+            except InvalidPage as exc:
+                raise Http404(f'The requested page is invalid: {exc}') from exc
+
+            context['page_obj'] = page
+            context['entries'] = page.object_list
+
+        # The counts of the other facets are restricted to the selected range of years.
+        counts_selection: t.Dict[str, t.List[t.Hashable]] = dict(selection)
+
+        if year_from is not None or year_to is not None:
+            counts_selection['year'] = [
+                year for year in bibliography.get_year_counts() if year is not None and
+                (year_from is None or year >= year_from) and (year_to is None or year <= year_to)
+            ]
+
+        counts = bibliography.get_facets().get_counts(counts_selection)
+        context['facets'] = self.get_facet_context(selection, counts)
+
+        # The query of the links to the individual years retains the other query parameters, except for the page.
+        query = self.request.GET.copy()
+        query.pop('page', None)
+        query.pop('year_from', None)
+        query.pop('year_to', None)
+        context['query_all_years'] = query.urlencode()
+        context['years'] = []
+
+        for year, count in counts['year'].items():
+            query['year_from'] = year
+            query['year_to'] = year
+            context['years'].append((year, count, query.urlencode()))
+
+        query = self.request.GET.copy()
+        query.pop('page', None)
+        context['query_pages'] = query.urlencode()
+
+        context['entry_files'] = self.get_entry_files(bibliography, context['entries'])
+
+        return context
+
+
+class BiblarySearchView(BibliographyMixin, TemplateView):
+    """View with the entries of the bibliography that match a query ordered by relevance.
+
+    The query is specified through the ``q`` query parameter and is answered through the full-text search index of the
+    bibliography, see :meth:`biblary.bibliography.bibliography.Bibliography.search`.
+    """
+
+    template_name = 'biblary/search.html'
+
+    max_results = 100
+    """Maximum number of entries that are shown."""
+
+    def get(self, request, *args, **kwargs):
+        """Return the rendered results or ``304 Not Modified`` if the client already has the current version."""
+        etag = self.get_etag(include_storage=True)
+        response = get_conditional_response(request, etag=etag)
+
+        if response is not None:
+            return response
+
+        return set_validators(super().get(request, *args, **kwargs), etag)
+
+    def get_context_data(self, **kwargs):
+        """Add the query and the entries that match it to the context."""
+        bibliography = self.get_bibliography()
+        query = self.request.GET.get('q', '').strip()
+
+        context = super().get_context_data(**kwargs)
+        context['query'] = query
+        context['entries'] = bibliography.search(query, limit=self.max_results) if query else []
+
+        context['entry_files'] = self.get_entry_files(bibliography, context['entries'])
+
+        return context
+
+
+class BiblaryAuthorView(BibliographyMixin, TemplateView):
+    """View with the entries of a single author sorted by descending year.
+
+    The author is specified through the ``author`` URL argument, which should be the normalized key of the author, see
+    :func:`biblary.bibliography.authors.get_author_key`. The entries are looked up in the author index of the
+    bibliography, see :meth:`biblary.bibliography.bibliography.Bibliography.get_authors`.
+    """
+
+    template_name = 'biblary/author.html'
+
+    def get(self, request, *args, **kwargs):
+        """Return the rendered entries or ``304 Not Modified`` if the client already has the current version.
+
+        :raises ``django.http.Http404``: if the bibliography does not contain any entries of the author.
+        """
+        etag = self.get_etag(include_storage=True)
+        response = get_conditional_response(request, etag=etag)
+
+        if response is not None:
+            return response
+
+        return set_validators(super().get(request, *args, **kwargs), etag)
+
+    def get_context_data(self, **kwargs):
+        """Add the name of the author and its entries to the context."""
+        bibliography = self.get_bibliography()
+        authors = bibliography.get_authors()
+        key = self.kwargs['author']
 
-        for entry in bibliography.get_entries(sort=lambda entry: entry.year, reverse=True):
+        if key not in authors:
+            raise Http404(f'the bibliography does not contain entries of the author `{key}`.')
 
-            if bibliography.storage is not None:
-                entry.files = {file_type.value: bibliography.storage.exists(entry, file_type) for file_type in FileType}
+        context = super().get_context_data(**kwargs)
+        context['author_name'] = authors.get_name(key)
+        context['entries'] = authors[key]
 
-            context['entries'].append(entry)
+        context['entry_files'] = self.get_entry_files(bibliography, context['entries'])
 
         return context
 
 
+class BiblaryJsonView(BibliographyMixin, EntryFilterMixin, View):
+    """View that streams the entries of the bibliography as a JSON array, either plain or in the CSL-JSON format.
+
+    The entries are sorted by descending year and can be filtered through the same query parameters as the index, see
+    :class:`EntryFilterMixin`. The fields that are included can be selected through the ``fields`` query parameter,
+    which takes a comma separated list of field names. The entries are encoded in chunks while the response is being
+    sent, such that the response is never held in memory in its entirety.
+    """
+
+    output_format = 'json'
+    """The format of the entries, which should be one of :data:`biblary.bibliography.serializers.FORMATS`."""
+
+    content_types = {
+        'json': 'application/json',
+        'csl-json': 'application/vnd.citationstyles.csl+json',
+    }
+    """Content type of the response for each format."""
+
+    def get_fields(self) -> t.Optional[t.List[str]]:
+        """Return the names of the fields that are selected through the ``fields`` query parameter.
+
+        :returns: the names of the selected fields or ``None`` if all fields should be included.
+        :raises :class:`django.core.exceptions.SuspiciousOperation`: if one of the fields is invalid.
+        """
+        names = [name.strip() for value in self.request.GET.getlist('fields') for name in value.split(',')]
+        names = list(dict.fromkeys(name for name in names if name))
+
+        if not names:
+            return None
+
+        invalid = [name for name in names if name not in FIELDS]
+
+        if invalid:
+            raise SuspiciousOperation(
+                f'The query parameter `fields` contains invalid fields: {", ".join(invalid)}. Valid fields are: '
+                f'{", ".join(FIELDS)}.'
+            )
+
+        return names
+
+    def get(self, request, *_, **__):
+        """Return the streamed entries or ``304 Not Modified`` if the client already has the current version.
+
+        :raises :class:`django.core.exceptions.ImproperlyConfigured`: if the :attr:`output_format` is not supported.
+        :raises :class:`django.core.exceptions.SuspiciousOperation`: if a query parameter is invalid.
+        """
+        if self.output_format not in FORMATS:
+            raise ImproperlyConfigured(
+                f'invalid output format `{self.output_format}`, should be one of: {", ".join(FORMATS)}.'
+            )
+
+        etag = self.get_etag()
+        response = get_conditional_response(request, etag=etag)
+
+        if response is not None:
+            return response
+
+        entries = self.get_filtered_entries(self.get_bibliography())
+        content = iter_json(entries, FORMATS[self.output_format], self.get_fields())
+        response = StreamingHttpResponse(content, content_type=self.content_types[self.output_format])
+
+        return set_validators(response, etag)
+
+
+class BiblaryExportView(BibliographyMixin, EntryFilterMixin, View):
+    """View that streams the entries of the bibliography in bibtex format as a single ``.bib`` file.
+
+    The entries are sorted by descending year and can be filtered through the same query parameters as the index, see
+    :class:`EntryFilterMixin`. The entries are formatted in chunks while the response is being sent, see
+    :meth:`biblary.bibliography.adapter.bibtex.BibtexBibliography.iter_entries`, such that the response is never held in
+    memory in its entirety. If the client accepts it, the response is compressed with gzip while it is being sent.
+    """
+
+    filename = 'bibliography.bib'
+    """Name of the file that is suggested to the client through the ``Content-Disposition`` header."""
+
+    def get(self, request, *_, **__):
+        """Return the streamed entries or ``304 Not Modified`` if the client already has the current version.
+
+        :raises :class:`django.core.exceptions.SuspiciousOperation`: if a query parameter is invalid.
+        """
+        send_encoded = 'gzip' in parse_accept_encoding(request.headers.get('Accept-Encoding', None))
+        etag = self.get_etag()
+
+        # The compressed and uncompressed representations need a distinct ETag.
+        if etag is not None and send_encoded:
+            etag = quote_etag(etag.strip('"') + '-gzip')
+
+        response = get_conditional_response(request, etag=etag)
+
+        if response is not None:
+            patch_vary_headers(response, ('Accept-Encoding',))
+            return response
+
+        entries = self.get_filtered_entries(self.get_bibliography())
+        content = (chunk.encode('utf-8') for chunk in BibtexBibliography.iter_entries(entries))
+
+        if send_encoded:
+            content = compress_sequence(content)
+
+        response = StreamingHttpResponse(
+            content,
+            headers={
+                'Content-Type': 'application/x-bibtex; charset=utf-8',
+                'Content-Disposition': f'attachment; filename="{self.filename}"',
+            }
+        )
+
+        if send_encoded:
+            response['Content-Encoding'] = 'gzip'
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        return set_validators(response, etag)
+
+
 class BiblaryBibtexView(BibliographyMixin, View):
-    """View that serves the bibliographic entry in bibtex format."""
+    """View that serves the bibliographic entry in bibtex format.
+
+    The entry is retrieved directly through the adapter if it supports it, which avoids having to parse the entire
+    bibliography for each request.
+    """
+
+    def get_entry_content(self, entry_identifier: str) -> t.Optional[str]:
+        """Return the bibliographic entry in bibtex format by looking it up in the parsed bibliography.
+
+        :param entry_identifier: the identifier of the entry.
+        :returns: the entry in bibtex format or ``None`` if the bibliography does not contain it.
+        """
+        bibliography = self.get_bibliography(storage_required=True)
+
+        try:
+            entry = bibliography[entry_identifier]
+        except KeyError:
+            return None
+
+        stream = io.StringIO()
+        BibtexBibliography.write_entry(entry, stream)
+        stream.seek(0)
+        return stream.read()
 
     def get(self, _, *__, **___) -> HttpResponse:
         """Return the byte content of the bibliographic entry in bibtex format.
@@ -52,23 +547,25 @@ class BiblaryBibtexView(BibliographyMixin, View):
         entry_identifier = self.kwargs['identifier']
 
         try:
-            bibliography = self.get_bibliography(storage_required=True)
+            adapter = self.get_adapter(storage_required=True)
         except ImproperlyConfigured as exc:
             raise Http404('No files are available for the current configuration.') from exc
 
-        assert bibliography.storage is not None
+        etag = self.get_etag()
+        response = get_conditional_response(self.request, etag=etag)
+
+        if response is not None:
+            return response
 
         try:
-            entry = bibliography[entry_identifier]
-        except KeyError as exc:
-            raise Http404(f'The requested bibliographic entry `{entry_identifier}` does not exist.') from exc
+            content = adapter.get_entry_source(entry_identifier)
+        except NotImplementedError:
+            content = self.get_entry_content(entry_identifier)
 
-        stream = io.StringIO()
-        BibtexBibliography.write_entry(entry, stream)
-        stream.seek(0)
-        content = stream.read()
+        if content is None:
+            raise Http404(f'The requested bibliographic entry `{entry_identifier}` does not exist.')
 
-        return HttpResponse(
+        response = HttpResponse(
             content,
             headers={
                 'Content-Type': 'application/plain',
@@ -76,21 +573,132 @@ class BiblaryBibtexView(BibliographyMixin, View):
             }
         )
 
+        return set_validators(response, etag)
+
 
 class BiblaryFileView(BibliographyMixin, View):
-    """View that serves a file stored for a bibliographic entry."""
+    """View that serves a file stored for a bibliographic entry.
+
+    The file is streamed from the storage, such that it does not have to be loaded in memory entirely. If the
+    ``BIBLARY_FILE_OFFLOAD`` setting is defined and the storage is a
+    :class:`biblary.bibliography.storage.file_system.FileSystemStorage`, the response is empty and instead instructs the
+    web server to serve the file through the ``X-Accel-Redirect`` or ``X-Sendfile`` header. Files that are stored
+    compressed are served without decompressing them to clients that accept the compression.
+    """
+
+    OFFLOAD_HEADERS = {
+        'x-accel-redirect': 'X-Accel-Redirect',
+        'x-sendfile': 'X-Sendfile',
+    }
+
+    CONTENT_CODINGS = ('gzip',)
+    """Compressions of stored files that are also HTTP content codings, so they can be served without decompressing."""
+
+    def get_offload_response(
+        self,
+        storage: FileSystemStorage,
+        entry: BibliographyEntry,
+        file_type: FileType,
+    ) -> t.Optional[HttpResponse]:
+        """Return a response that offloads serving the file to the web server, if configured.
+
+        :returns: the response or ``None`` if offloading is not configured.
+        :raises :class:`django.core.exceptions.ImproperlyConfigured`: if the configured offload is not supported.
+        :raises :class:`django.core.exceptions.Http404`: if the requested file does not exist.
+        """
+        from biblary.settings import settings
 
-    def get(self, _, *__, **___) -> HttpResponse:
-        """Return the byte content of the file for the specified bibliographic entry and file type.
+        offload = settings.file_offload
+
+        if offload is None:
+            return None
+
+        try:
+            header = self.OFFLOAD_HEADERS[offload]
+        except KeyError as exc:
+            raise ImproperlyConfigured(
+                f'invalid file offload `{offload}`, should be one of: {", ".join(self.OFFLOAD_HEADERS)}.'
+            ) from exc
+
+        filepath = storage.get_filepath(entry, file_type)
+
+        if not filepath.is_file():
+            raise Http404(f'The requested file `{entry.identifier}:{file_type.value}` does not exist.')
+
+        if offload == 'x-sendfile':
+            location = str(filepath.resolve())
+        else:
+            relative = filepath.relative_to(storage.filepath).as_posix()
+            location = f'{settings.file_offload_prefix.rstrip("/")}/{relative}'
+
+        return HttpResponse(
+            headers={
+                'Content-Type': 'application/pdf',
+                'Content-Disposition': f'attachment; filename="{file_type.value}.pdf"',
+                header: location,
+            }
+        )
+
+    def get_requested_file(self, bibliography: Bibliography) -> t.Tuple[BibliographyEntry, FileType]:
+        """Return the bibliographic entry and the file type that are requested.
 
-        :returns :class:`django.http.response.HttpResponse`: if the file exists for the specified entry and file type.
         :raises :class:`django.core.exceptions.SuspiciousOperation`: if the requested file type does not exist.
-        :raises :class:`django.core.exceptions.Http404`: if the bibliographic entry does not exist, or it
-            does but the requested file does not exist.
+        :raises :class:`django.core.exceptions.Http404`: if the bibliographic entry does not exist.
         """
         entry_identifier = self.kwargs['identifier']
         file_type = self.kwargs['file_type']
 
+        try:
+            file_type = FileType(self.kwargs['file_type'])
+        except ValueError as exc:
+            raise SuspiciousOperation(f'The requested file type `{file_type}` is invalid.') from exc
+
+        try:
+            entry = bibliography[entry_identifier]
+        except KeyError as exc:
+            raise Http404(f'The requested bibliographic entry `{entry_identifier}` does not exist.') from exc
+
+        return entry, file_type
+
+    def get_validators(
+        self,
+        stat: t.Optional[t.Tuple[int, int]],
+        encoding: t.Optional[str],
+    ) -> t.Tuple[bool, t.Optional[str], t.Optional[int]]:
+        """Return whether the file is sent encoded and the validators of the response for the given file metadata.
+
+        A file that is stored compressed is served as is if the client accepts the compression, otherwise it is
+        decompressed while it is streamed. Both representations need a distinct ETag.
+
+        :param stat: the size and modification time of the file as returned by the ``stat_file`` method of the storage.
+        :param encoding: the compression with which the file is stored.
+        :returns: tuple of whether the file is sent encoded, the ETag and the time of last modification.
+        """
+        send_encoded = encoding in self.CONTENT_CODINGS and encoding in parse_accept_encoding(
+            self.request.headers.get('Accept-Encoding', None)
+        )
+        etag, last_modified = None, None
+
+        if stat is not None:
+            size, mtime_ns = stat
+            etag = quote_etag(f'{size:x}-{mtime_ns:x}' + (f'-{encoding}' if send_encoded else ''))
+            last_modified = mtime_ns // 10**9
+
+        return send_encoded, etag, last_modified
+
+    def get(self, _, *__, **___) -> HttpResponseBase:
+        """Return the byte content of the file for the specified bibliographic entry and file type.
+
+        Requests for one or more byte ranges of the file through the ``Range`` header are honored, except for a file
+        that is stored compressed and is decompressed while it is sent, since its size is not known in advance and
+        seeking in it requires decompressing it from the start.
+
+        :returns :class:`django.http.response.HttpResponseBase`: streaming response with the content of the file, or the
+            requested ranges, if the file exists for the specified entry and file type.
+        :raises :class:`django.core.exceptions.SuspiciousOperation`: if the requested file type does not exist.
+        :raises :class:`django.core.exceptions.Http404`: if the bibliographic entry does not exist, or it
+            does but the requested file does not exist.
+        """
         try:
             bibliography = self.get_bibliography(storage_required=True)
         except ImproperlyConfigured as exc:
@@ -98,28 +706,173 @@ class BiblaryFileView(BibliographyMixin, View):
 
         assert bibliography.storage is not None
 
+        entry, file_type = self.get_requested_file(bibliography)
+        storage = bibliography.storage
+
         try:
-            file_type = FileType(self.kwargs['file_type'])
-        except ValueError as exc:
-            raise SuspiciousOperation(f'The requested file type `{file_type}` is invalid.') from exc
+            stat = storage.stat_file(entry, file_type)
+            encoding = storage.get_file_encoding(entry, file_type)
+        except FileNotFoundError as exc:
+            raise Http404(f'The requested file `{entry.identifier}:{file_type.value}` does not exist.') from exc
+
+        send_encoded, etag, last_modified = self.get_validators(stat, encoding)
+        response = get_conditional_response(self.request, etag=etag, last_modified=last_modified)
+
+        if response is None and encoding is None and isinstance(storage, FileSystemStorage):
+            response = self.get_offload_response(storage, entry, file_type)
+
+            if response is not None:
+                set_validators(response, etag, last_modified)
+
+        if response is None:
+            try:
+                if send_encoded:
+                    handle = storage.open_raw_file(entry, file_type)
+                else:
+                    handle = storage.open_file(entry, file_type)
+            except FileNotFoundError as exc:
+                raise Http404(f'The requested file `{entry.identifier}:{file_type.value}` does not exist.') from exc
+
+            response = get_file_response(
+                self.request,
+                handle,
+                filename=f'{file_type.value}.pdf',
+                content_type='application/pdf',
+                etag=etag,
+                last_modified=last_modified,
+                ranges=encoding is None or send_encoded,
+            )
+
+            if send_encoded:
+                response['Content-Encoding'] = encoding
+
+        if encoding is not None:
+            patch_vary_headers(response, ('Accept-Encoding',))
+
+        return response
+
+
+class AsyncViewMixin:
+    """Mixin for class-based views with asynchronous handlers.
+
+    Class-based views only support asynchronous handlers as of Django 4.1. For older versions, the view returned by
+    :meth:`as_view` is wrapped in a coroutine function, such that Django recognizes it as asynchronous.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        """Return the view function, which is a coroutine function."""
+        view = super().as_view(**initkwargs)
+
+        if django.VERSION >= (4, 1):
+            return view
+
+        async def async_view(request, *args, **kwargs):
+            response = view(request, *args, **kwargs)
+
+            # Handlers that are not overridden, such as ``options``, return the response synchronously.
+            if asyncio.iscoroutine(response):
+                response = await response
+
+            return response
+
+        return functools.update_wrapper(async_view, view)
+
+
+class AsyncBiblaryIndexView(AsyncViewMixin, BiblaryIndexView):
+    """Asynchronous variant of :class:`BiblaryIndexView` for deployment on an ASGI server.
+
+    Constructing the bibliography and rendering the index are run in a thread of a pool, such that they do not block
+    the event loop. They are not run in the single thread that is shared by all thread sensitive code, such that
+    concurrent requests are handled concurrently.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        """Return the rendered index or ``304 Not Modified`` if the client already has the current version."""
+        return await sync_to_async(super().get, thread_sensitive=False)(request, *args, **kwargs)
+
 
+class AsyncBiblaryBibtexView(AsyncViewMixin, BiblaryBibtexView):
+    """Asynchronous variant of :class:`BiblaryBibtexView` for deployment on an ASGI server.
+
+    Retrieving the entry is run in a thread of a pool, such that it does not block the event loop and concurrent
+    requests are handled concurrently, see :class:`AsyncBiblaryIndexView`.
+    """
+
+    async def get(self, request, *args, **kwargs) -> HttpResponse:
+        """Return the byte content of the bibliographic entry in bibtex format."""
+        return await sync_to_async(super().get, thread_sensitive=False)(request, *args, **kwargs)
+
+
+class AsyncBiblaryFileView(AsyncViewMixin, BiblaryFileView):
+    """Asynchronous variant of :class:`BiblaryFileView` for deployment on an ASGI server.
+
+    The file is accessed through the :class:`biblary.bibliography.storage.AbstractAsyncStorage` interface of the
+    storage, such that reading it does not block the event loop. Storages that do not implement it are wrapped in a
+    :class:`biblary.bibliography.storage.AsyncStorageAdapter`.
+    """
+
+    async def get(self, _, *__, **___) -> HttpResponseBase:
+        """Return the byte content of the file for the specified bibliographic entry and file type.
+
+        See :meth:`BiblaryFileView.get` for details.
+        """
         try:
-            entry = bibliography[entry_identifier]
-        except KeyError as exc:
-            raise Http404(f'The requested bibliographic entry `{entry_identifier}` does not exist.') from exc
+            bibliography = await sync_to_async(self.get_bibliography, thread_sensitive=False)(storage_required=True)
+        except ImproperlyConfigured as exc:
+            raise Http404('No files are available for the current configuration.') from exc
+
+        assert bibliography.storage is not None
+
+        entry, file_type = self.get_requested_file(bibliography)
+        storage = bibliography.storage
+
+        if isinstance(storage, AbstractAsyncStorage):
+            async_storage = storage
+        else:
+            async_storage = AsyncStorageAdapter(storage)
 
         try:
-            content = bibliography.storage.get_file(entry, file_type)
+            stat = await async_storage.astat_file(entry, file_type)
+            encoding = await async_storage.aget_file_encoding(entry, file_type)
         except FileNotFoundError as exc:
-            raise Http404(f'The requested file `{entry_identifier}:{file_type.value}` does not exist.') from exc
+            raise Http404(f'The requested file `{entry.identifier}:{file_type.value}` does not exist.') from exc
 
-        return HttpResponse(
-            content,
-            headers={
-                'Content-Type': 'application/pdf',
-                'Content-Disposition': f'attachment; filename="{file_type.value}.pdf"',
-            }
-        )
+        send_encoded, etag, last_modified = self.get_validators(stat, encoding)
+        response = get_conditional_response(self.request, etag=etag, last_modified=last_modified)
+
+        if response is None and encoding is None and isinstance(storage, FileSystemStorage):
+            response = await sync_to_async(self.get_offload_response, thread_sensitive=False)(storage, entry, file_type)
+
+            if response is not None:
+                set_validators(response, etag, last_modified)
+
+        if response is None:
+            try:
+                if send_encoded:
+                    handle = await async_storage.aopen_raw_file(entry, file_type)
+                else:
+                    handle = await async_storage.aopen_file(entry, file_type)
+            except FileNotFoundError as exc:
+                raise Http404(f'The requested file `{entry.identifier}:{file_type.value}` does not exist.') from exc
+
+            response = await aget_file_response(
+                self.request,
+                handle,
+                filename=f'{file_type.value}.pdf',
+                content_type='application/pdf',
+                etag=etag,
+                last_modified=last_modified,
+                ranges=encoding is None or send_encoded,
+            )
+
+            if send_encoded:
+                response['Content-Encoding'] = encoding
+
+        if encoding is not None:
+            patch_vary_headers(response, ('Accept-Encoding',))
+
+        return response
 
 
 class BiblaryUploadEntryView(BibliographyMixin, FormView):
@@ -159,10 +912,11 @@ class BiblaryUploadEntryView(BibliographyMixin, FormView):
     def form_valid(self, form: BibliographyUploadFileForm):
         """Attempt to add the content as an entry to the bibliography."""
         content = form.cleaned_data['content']
-        bibliography = self.get_bibliography()
+        bibliography = self.get_bibliography(cached=False)
 
         try:
             bibliography.add_entry(content)
+            bibliography.save()
         except DuplicateEntryError as exception:
             form.add_error('content', exception)
             return super().form_invalid(form)
@@ -170,8 +924,6 @@ class BiblaryUploadEntryView(BibliographyMixin, FormView):
             form.add_error('content', exception)
             return super().form_invalid(form)
 
-        bibliography.save()
-
         return super().form_valid(form)
 
 
@@ -225,7 +977,6 @@ class BiblaryUploadFileView(BibliographyMixin, FormView):
         entry = bibliography[entry_identifer]
         assert bibliography.storage is not None
 
-        with content.open('rb') as handle:
-            bibliography.storage.put_file(handle, entry, file_type)
+        bibliography.storage.put_file(content, entry, file_type)
 
         return super().form_valid(form)
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of the engines of :class:`biblary.bibliography.adapter.bibtex.BibtexBibliography`.
+
+Generates a Bibtex file with the given number of entries and reports the time it takes each engine to parse it::
+
+    python tests/benchmarks/bibtex_engines.py --entries 10000
+
+"""
+import argparse
+import io
+import pathlib
+import sys
+import time
+
+# Allow running the script from the root of the repository without the package being installed.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from biblary.bibliography.adapter.bibtex import BibtexBibliography  # pylint: disable=wrong-import-position
+
+TEMPLATE = """@article{{Entry_{index},
+    doi = {{10.1002/andp.{index}}},
+    url = {{https://doi.org/10.1002/andp.{index}}},
+    year = {year},
+    month = jun,
+    publisher = {{Wiley}},
+    volume = {{{volume}}},
+    number = {{6}},
+    pages = {{132-148}},
+    author = {{Einstein, Albert and Planck, Max and Schr{{\\"o}}dinger, Erwin}},
+    title = {{{{\\"U}}ber einen die Erzeugung und Verwandlung des Lichtes betreffenden heuristischen Gesichtspunkt}},
+    journal = {{Annalen der Physik}},
+    keyword = {{photoelectric effect, quanta}}
+}}
+"""
+
+
+def generate(entries: int) -> str:
+    """Return the content of a Bibtex file with the given number of entries."""
+    return '\n'.join(
+        TEMPLATE.format(index=index, year=1900 + index % 120, volume=index % 500) for index in range(entries)
+    )
+
+
+def main():
+    """Parse the generated content with each engine and print the timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--entries', type=int, default=10000, help='Number of entries to generate.')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of times to repeat each measurement.')
+    arguments = parser.parse_args()
+
+    content = generate(arguments.entries)
+    timings = {}
+
+    for engine in BibtexBibliography.ENGINES:
+        durations = []
+        for _ in range(arguments.repeat):
+            start = time.perf_counter()
+            # pylint: disable=protected-access
+            entries = BibtexBibliography._parse_records(io.StringIO(content), engine)
+            durations.append(time.perf_counter() - start)
+        assert len(entries) == arguments.entries
+        timings[engine] = min(durations)
+        print(f'{engine:>14}: {timings[engine]:.3f} s for {arguments.entries} entries')
+
+    print(f'{"speedup":>14}: {timings["bibtexparser"] / timings["native"]:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
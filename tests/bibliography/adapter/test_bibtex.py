@@ -1,13 +1,21 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=redefined-outer-name
 """Tests for the :mod:`biblary.bibliography.adapter.bibtex` module."""
+import copy
+import hashlib
 import io
+import itertools
+import pathlib
 
+from bibtexparser import customization, latexenc
+from bibtexparser.bibdatabase import BibDatabase
+from bibtexparser.bwriter import BibTexWriter
 import pytest
 
+from biblary.bibliography.adapter import bibtex, scanner, snapshot
 from biblary.bibliography.adapter.bibtex import BibtexBibliography
-from biblary.bibliography.entry import BibliographyEntry
-from biblary.bibliography.exceptions import BibliographicEntryParsingError
+from biblary.bibliography.entry import BibliographyEntry, LazyBibliographyEntry
+from biblary.bibliography.exceptions import BibliographicEntryParsingError, DuplicateEntryError
 
 
 def test_get_entries(filepath_bibtex):
@@ -19,6 +27,49 @@ def test_get_entries(filepath_bibtex):
     assert isinstance(entries[0], BibliographyEntry)
 
 
+def test_convert_to_unicode():
+    """Test that ``_convert_to_unicode`` is equivalent to :func:`bibtexparser.customization.convert_to_unicode`.
+
+    The adapter uses its own conversion, which relies on the internals of :mod:`bibtexparser.latexenc` for speed. This
+    test guards that it produces the same result as the public function for the pinned version of ``bibtexparser`` for
+    every LaTeX command that it converts, including the few commands for which the public function raises.
+    """
+    values = [
+        'Plain title',
+        '{Braced} title',
+        'Schr{\\"o}dinger and Schr\\"odinger',
+        '{\\"U}ber einen {\\\'e}l{\\`e}ve {\\c{c}}a',
+        '\\AA{}ngstr\\"om \\ss{} \\o{} {\\i}',
+        '$\\alpha$ -- $\\beta$ --- \\textendash',
+        '{{\\"o}}\\unknown{x}',
+    ]
+    commands = itertools.chain(
+        latexenc.unicode_to_crappy_latex1, latexenc.unicode_to_latex, latexenc.unicode_to_crappy_latex2
+    )
+    values.extend(f'a{latex}b' for _, latex in commands)
+
+    convert_to_unicode = BibtexBibliography._convert_to_unicode  # pylint: disable=protected-access
+
+    def convert(function, record):
+        try:
+            return function(copy.deepcopy(record))
+        except Exception as exception:  # pylint: disable=broad-except
+            return type(exception)
+
+    for value in values:
+        record = {'title': value, 'author': [value, 'Other'], 'editor': {'name': value}}
+        expected = convert(customization.convert_to_unicode, record)
+        assert convert(convert_to_unicode, record) == expected, value
+
+
+def test_convert_to_unicode_fallback(monkeypatch):
+    """Test that ``_convert_to_unicode`` falls back on the public conversion if the private function is missing."""
+    monkeypatch.setattr(bibtex, '_REPLACE_LATEX', None)
+    record = {'title': 'Schr{\\"o}dinger', 'author': ['{\\"U}ber']}
+    expected = customization.convert_to_unicode(copy.deepcopy(record))
+    assert BibtexBibliography._convert_to_unicode(record) == expected  # pylint: disable=protected-access
+
+
 def test_get_entries_excepts(tmp_path):
     """Test the :meth:`biblary.bibliography.adapter.bibtex.BibtexBibliography.get_entries` method when it excepts."""
     filepath_bibtex = tmp_path / 'bibliography.bib'
@@ -63,3 +114,370 @@ def test_write_entry(get_bibliography_entry):
 
     assert entry.entry_type in content
     assert entry.identifier in content
+
+
+def test_get_entries_snapshot(filepath_bibtex, monkeypatch):
+    """Test the :meth:`biblary.bibliography.adapter.bibtex.BibtexBibliography.get_entries` method with snapshot."""
+    adapter = BibtexBibliography(filepath_bibtex, snapshot=True)
+    entries = adapter.get_entries()
+    assert adapter.filepath_snapshot.exists()
+
+    def _parse_bibliography(*_, **__):
+        raise AssertionError('the bibliography should have been loaded from the snapshot.')
+
+    with monkeypatch.context() as context:
+        context.setattr(BibtexBibliography, '_parse_bibliography', _parse_bibliography)
+        assert adapter.get_entries() == entries
+
+
+def test_get_entries_snapshot_invalid(filepath_bibtex, monkeypatch):
+    """Test the :meth:`biblary.bibliography.adapter.bibtex.BibtexBibliography.get_entries` method with stale snapshot.
+
+    The snapshot should be ignored and rewritten if the content of the bibliography or the snapshot version changed.
+    """
+    adapter = BibtexBibliography(filepath_bibtex, snapshot=True)
+    adapter.get_entries()
+
+    filepath_bibtex.write_text(filepath_bibtex.read_text().replace('Einstein_1905', 'Einstein_1906'))
+    assert [entry.identifier for entry in adapter.get_entries()] == ['Einstein_1906']
+
+    spans = list(scanner.scan_entries(filepath_bibtex.read_bytes()))
+    content_hash = adapter._get_spans_hash(spans)  # pylint: disable=protected-access
+    monkeypatch.setattr(snapshot, 'SNAPSHOT_VERSION', snapshot.SNAPSHOT_VERSION + 1)
+    assert snapshot.read_snapshot(adapter.filepath_snapshot, content_hash) is None
+
+    adapter.get_entries()
+    assert snapshot.read_snapshot(adapter.filepath_snapshot, content_hash) is not None
+
+
+def test_get_entries_snapshot_unchanged_entries(filepath_bibtex, monkeypatch):
+    """Test that the snapshot is not rewritten if only the content between the entries of the bibliography changes."""
+    adapter = BibtexBibliography(filepath_bibtex, snapshot=True)
+    entries = adapter.get_entries()
+    writes = []
+
+    monkeypatch.setattr(bibtex, 'write_snapshot', lambda *args: writes.append(args))
+    filepath_bibtex.write_text(f'Comment\n\n{filepath_bibtex.read_text()}\n\n')
+
+    assert adapter.get_entries() == entries
+    assert not writes
+
+
+def test_read_snapshot_header(filepath_bibtex, monkeypatch):
+    """Test that :func:`biblary.bibliography.adapter.snapshot.read_snapshot` validates the header before the body."""
+    adapter = BibtexBibliography(filepath_bibtex, snapshot=True)
+    entries = adapter.get_entries()
+    spans = list(scanner.scan_entries(filepath_bibtex.read_bytes()))
+    content_hash = adapter._get_spans_hash(spans)  # pylint: disable=protected-access
+
+    def decompress(*_, **__):
+        raise AssertionError('the body of a stale snapshot should not be decompressed.')
+
+    assert adapter.filepath_snapshot.read_bytes().startswith(snapshot.get_header(content_hash))
+    assert snapshot.read_snapshot(adapter.filepath_snapshot, content_hash) == entries
+
+    monkeypatch.setattr(snapshot.zlib, 'decompress', decompress)
+    assert snapshot.read_snapshot(adapter.filepath_snapshot, 'stale') is None
+
+
+def test_get_entries_incremental(tmp_path, monkeypatch):
+    """Test the :meth:`biblary.bibliography.adapter.bibtex.BibtexBibliography.get_entries` parses incrementally.
+
+    Only the entries that changed since the last call should be parsed again.
+    """
+    filepath_bibtex = tmp_path / 'bibliography.bib'
+    template = '@article{{Entry_{index},\n    author = {{A. Einstein}},\n    title = {{Title {index}}}\n}}\n'
+    entries = [template.format(index=index) for index in range(5)]
+    filepath_bibtex.write_text(''.join(entries))
+
+    adapter = BibtexBibliography(filepath_bibtex)
+    parsed = adapter.get_entries()
+    assert [entry.title for entry in parsed] == [f'Title {index}' for index in range(5)]
+
+    contents = []
+    parse_records = BibtexBibliography._parse_records  # pylint: disable=protected-access
+
+    def _parse_records(_, filelike, *args):
+        contents.append(filelike.getvalue())
+        return parse_records(filelike, *args)
+
+    monkeypatch.setattr(BibtexBibliography, '_parse_records', classmethod(_parse_records))
+
+    entries[1] = entries[1].replace('Title 1', 'Changed')
+    del entries[3]
+    entries.append(template.format(index=5))
+    filepath_bibtex.write_text(''.join(entries))
+
+    reparsed = adapter.get_entries()
+    assert [entry.title for entry in reparsed] == ['Title 0', 'Changed', 'Title 2', 'Title 4', 'Title 5']
+    assert reparsed[0] is parsed[0]
+    assert len(contents) == 1
+    assert 'Entry_1' in contents[0] and 'Entry_5' in contents[0] and 'Entry_0' not in contents[0]
+
+
+def test_append_entries(filepath_bibtex, get_bibliography_entry):
+    """Test the :meth:`biblary.bibliography.adapter.bibtex.BibtexBibliography.append_entries` method."""
+    content = filepath_bibtex.read_text()
+    adapter = BibtexBibliography(filepath_bibtex)
+    entries = adapter.get_entries()
+    appended = [
+        get_bibliography_entry(identifier='Einstein_1906', author=['A. Einstein']),
+        get_bibliography_entry(identifier='Einstein_1907', author=['A. Einstein']),
+    ]
+    adapter.append_entries(appended)
+
+    assert filepath_bibtex.read_text().startswith(content)
+    assert BibtexBibliography(filepath_bibtex).get_entries() == entries + appended
+
+
+def test_append_entries_index(filepath_bibtex, get_bibliography_entry, monkeypatch):
+    """Test that ``append_entries`` only scans the file if it was modified by something else since the last append."""
+    adapter = BibtexBibliography(filepath_bibtex)
+    adapter.append_entries([get_bibliography_entry(identifier='Einstein_1906', author=['A. Einstein'])])
+    scanned = []
+
+    def scan_entries(content):
+        scanned.append(content)
+        return scanner.scan_entries(content)
+
+    monkeypatch.setattr(bibtex, 'scan_entries', scan_entries)
+    adapter.append_entries([get_bibliography_entry(identifier='Einstein_1907', author=['A. Einstein'])])
+    assert len(scanned) == 1
+    assert b'Einstein_1905' not in scanned[0]
+
+    with pytest.raises(DuplicateEntryError):
+        adapter.append_entries([get_bibliography_entry(identifier='Einstein_1907', author=['A. Einstein'])])
+
+    assert len(scanned) == 1
+    source = adapter.get_entry_source('Einstein_1907')
+    assert 'Einstein_1907' in source
+    assert BibtexBibliography(filepath_bibtex).get_entry_source('Einstein_1907') == source
+
+
+def test_append_entries_duplicate(filepath_bibtex, get_bibliography_entry):
+    """Test that ``append_entries`` raises if the file contains an entry, even if appended by another adapter."""
+    adapter = BibtexBibliography(filepath_bibtex)
+    adapter.get_entries()
+    entry = get_bibliography_entry(identifier='Einstein_1906', author=['A. Einstein'])
+    BibtexBibliography(filepath_bibtex).append_entries([entry])
+    content = filepath_bibtex.read_bytes()
+
+    with pytest.raises(DuplicateEntryError, match=r'.*`Einstein_1906`.*'):
+        adapter.append_entries([entry])
+
+    assert filepath_bibtex.read_bytes() == content
+
+
+@pytest.mark.parametrize('fixture', ('basic.bib', 'extended.bib'))
+@pytest.mark.parametrize('engine', BibtexBibliography.ENGINES)
+def test_get_entries_engine(tmp_path, fixture, engine):
+    """Test the :meth:`biblary.bibliography.adapter.bibtex.BibtexBibliography.get_entries` method for each engine.
+
+    The entries should be identical to those parsed from the entire file at once with ``bibtexparser``.
+    """
+    filepath_fixture = pathlib.Path(__file__).parents[2] / 'fixtures' / 'bibliography' / fixture
+    filepath_bibtex = tmp_path / fixture
+    filepath_bibtex.write_bytes(filepath_fixture.read_bytes())
+
+    with filepath_bibtex.open() as handle:
+        expected = BibtexBibliography._parse_bibliography(handle)  # pylint: disable=protected-access
+
+    assert BibtexBibliography(filepath_bibtex, engine=engine).get_entries() == expected
+
+
+@pytest.mark.parametrize('engine', BibtexBibliography.ENGINES)
+def test_get_entries_unclosed(tmp_path, engine):
+    """Test that an entry with unbalanced braces is skipped and the entries that follow it are still parsed."""
+    filepath_bibtex = tmp_path / 'bibliography.bib'
+    filepath_bibtex.write_text(
+        '@article{Valid_1, title = {One}}\n\n'
+        '@article{Broken, title = {Unclosed\n\n'
+        '@article{Valid_2, title = {Two}}\n'
+        '@article{Valid_3, title = {Three}}\n'
+    )
+
+    with filepath_bibtex.open() as handle:
+        expected = BibtexBibliography._parse_bibliography(handle)  # pylint: disable=protected-access
+
+    entries = BibtexBibliography(filepath_bibtex, engine=engine).get_entries()
+    assert [entry.identifier for entry in entries] == ['Valid_1', 'Valid_2', 'Valid_3']
+    assert entries == expected
+
+    lazy = BibtexBibliography(filepath_bibtex, lazy=True).get_entries()
+    titles = [('Valid_1', 'One'), ('Broken', None), ('Valid_2', 'Two'), ('Valid_3', 'Three')]
+    assert [(entry.identifier, entry.title) for entry in lazy] == titles
+
+
+def test_constructor_invalid_engine(filepath_bibtex):
+    """Test the :class:`biblary.bibliography.adapter.bibtex.BibtexBibliography` constructor with invalid engine."""
+    with pytest.raises(ValueError, match=r'invalid engine `.*`'):
+        BibtexBibliography(filepath_bibtex, engine='invalid')
+
+
+@pytest.mark.parametrize('fixture', ('basic.bib', 'extended.bib'))
+def test_get_entries_lazy(tmp_path, fixture):
+    """Test the :meth:`biblary.bibliography.adapter.bibtex.BibtexBibliography.get_entries` method in lazy mode."""
+    filepath_fixture = pathlib.Path(__file__).parents[2] / 'fixtures' / 'bibliography' / fixture
+    filepath_bibtex = tmp_path / fixture
+    filepath_bibtex.write_bytes(filepath_fixture.read_bytes())
+
+    with filepath_bibtex.open() as handle:
+        expected = BibtexBibliography._parse_bibliography(handle)  # pylint: disable=protected-access
+
+    adapter = BibtexBibliography(filepath_bibtex, lazy=True)
+    entries = adapter.get_entries()
+
+    assert all(isinstance(entry, LazyBibliographyEntry) for entry in entries)
+    assert all('title' not in vars(entry) for entry in entries)
+    assert [entry.identifier for entry in entries] == [entry.identifier for entry in expected]
+    assert entries == expected
+
+    # Entries whose content did not change are reused, including their decoded fields.
+    filepath_bibtex.write_text(filepath_bibtex.read_text() + '\n@misc{Other, author = {Other}}\n')
+    reloaded = adapter.get_entries()
+    assert all(first is second for first, second in zip(entries, reloaded))
+    assert len(reloaded) == len(entries) + 1
+    assert reloaded[-1].author == ['Other']
+
+
+def test_get_entries_lazy_undefined_string(tmp_path):
+    """Test that in lazy mode the fields of an entry that references an undefined string macro are ``None``."""
+    filepath_bibtex = tmp_path / 'bibliography.bib'
+    filepath_bibtex.write_text(
+        '@article{Valid, title = {Title}}\n'
+        '@article{Invalid, title = {Title}, journal = undefined}\n'
+    )
+
+    adapter = BibtexBibliography(filepath_bibtex, lazy=True)
+    valid, invalid = adapter.get_entries()
+
+    assert valid.title == 'Title'
+    assert invalid.identifier == 'Invalid'
+    assert invalid.title is None
+    assert invalid.journal is None
+
+
+def test_get_entries_lazy_empty_author(tmp_path):
+    """Test that in lazy mode an empty field that is removed when the entry is customized is ``None``."""
+    filepath_bibtex = tmp_path / 'bibliography.bib'
+    filepath_bibtex.write_text('@article{Empty, author = {}, title = {Title}}\n')
+
+    eager, = BibtexBibliography(filepath_bibtex).get_entries()
+    lazy, = BibtexBibliography(filepath_bibtex, lazy=True).get_entries()
+
+    assert lazy.author is None
+    assert lazy == eager
+
+
+@pytest.mark.parametrize('engine', BibtexBibliography.ENGINES)
+def test_get_entries_parallel(tmp_path, engine):
+    """Test the :meth:`biblary.bibliography.adapter.bibtex.BibtexBibliography.get_entries` method with workers."""
+    filepath_fixture = pathlib.Path(__file__).parents[2] / 'fixtures' / 'bibliography' / 'extended.bib'
+    filepath_bibtex = tmp_path / 'extended.bib'
+    filepath_bibtex.write_bytes(filepath_fixture.read_bytes())
+
+    with filepath_bibtex.open() as handle:
+        expected = BibtexBibliography._parse_bibliography(handle)  # pylint: disable=protected-access
+
+    adapter = BibtexBibliography(filepath_bibtex, engine=engine, workers=2, parallel_threshold=0)
+    spans = [span for span in scanner.scan_entries(filepath_bibtex.read_bytes()) if span.identifier is not None]
+    chunks = adapter._split_chunks(spans)  # pylint: disable=protected-access
+
+    assert len(chunks) == 2
+    assert [span for chunk in chunks for span in chunk] == spans
+    assert adapter.get_entries() == expected
+
+
+def test_split_chunks_threshold(filepath_bibtex):
+    """Test the content is not split into chunks if its size is below the parallel threshold."""
+    adapter = BibtexBibliography(filepath_bibtex, workers=4)
+    spans = list(scanner.scan_entries(filepath_bibtex.read_bytes())) * 2
+    assert adapter._split_chunks(spans) == [spans]  # pylint: disable=protected-access
+
+
+def test_get_entry_source(tmp_path, monkeypatch):
+    """Test the :meth:`biblary.bibliography.adapter.bibtex.BibtexBibliography.get_entry_source` method."""
+    filepath_fixture = pathlib.Path(__file__).parents[2] / 'fixtures' / 'bibliography' / 'extended.bib'
+    filepath_bibtex = tmp_path / 'extended.bib'
+    filepath_bibtex.write_bytes(filepath_fixture.read_bytes())
+
+    with filepath_bibtex.open() as handle:
+        expected = BibtexBibliography._parse_bibliography(handle)  # pylint: disable=protected-access
+
+    adapter = BibtexBibliography(filepath_bibtex)
+
+    for entry in expected:
+        stream = io.StringIO()
+        BibtexBibliography.write_entry(entry, stream)
+        assert adapter.get_entry_source(entry.identifier) == stream.getvalue()
+
+    assert adapter.get_entry_source('Website_2020') is None
+    assert adapter.get_entry_source('non-existent') is None
+
+    def _parse_chunk(*_, **__):
+        raise AssertionError('the entry should have been retrieved from the cache.')
+
+    with monkeypatch.context() as context:
+        context.setattr('biblary.bibliography.adapter.bibtex._parse_chunk', _parse_chunk)
+        assert 'Einstein_1905' in adapter.get_entry_source('Einstein_1905')
+
+    filepath_bibtex.write_text(filepath_bibtex.read_text().replace('Clarendon Press', 'Oxford University Press'))
+    assert 'Oxford University Press' in adapter.get_entry_source('Dirac_1930')
+
+
+def test_save_entries_serialized_cache(filepath_bibtex, get_bibliography_entry):
+    """Test the :meth:`biblary.bibliography.adapter.bibtex.BibtexBibliography.save_entries` method caches entries.
+
+    The content should be identical to that written by a ``BibTexWriter`` for all entries at once, but only entries that
+    changed should be formatted again.
+    """
+    adapter = BibtexBibliography(filepath_bibtex)
+    entries = adapter.get_entries() + [
+        get_bibliography_entry(identifier='b', author=['B'], keyword=['one', 'two']),
+        get_bibliography_entry(identifier='A', author=['A'], title='Title'),
+    ]
+
+    writer = BibTexWriter()
+    writer.indent = '    '
+    database = BibDatabase()
+    entry_to_dict = BibtexBibliography._entry_to_dict  # pylint: disable=protected-access
+    database.entries = [entry_to_dict(entry) for entry in entries]
+
+    adapter.save_entries(entries)
+    assert filepath_bibtex.read_text() == writer.write(database)
+
+    serialize_entry = BibtexBibliography._serialize_entry  # pylint: disable=protected-access
+    misses = serialize_entry.cache_info().misses
+    entries[-1].title = 'Changed'
+    adapter.save_entries(entries)
+    assert serialize_entry.cache_info().misses == misses + 1
+    assert 'Changed' in filepath_bibtex.read_text()
+
+
+@pytest.mark.parametrize('chunk_size', (1, 2, 100))
+def test_iter_entries(get_bibliography_entry, chunk_size):
+    """Test the :meth:`biblary.bibliography.adapter.bibtex.BibtexBibliography.iter_entries` method."""
+    entries = [get_bibliography_entry(identifier=identifier) for identifier in ('c', 'a', 'b')]
+    expected = []
+
+    for entry in entries:
+        stream = io.StringIO()
+        BibtexBibliography.write_entry(entry, stream)
+        expected.append(stream.getvalue())
+
+    chunks = list(BibtexBibliography.iter_entries(entries, chunk_size=chunk_size))
+    assert len(chunks) == -(-len(entries) // chunk_size)
+    assert ''.join(chunks) == '\n'.join(expected)
+    assert not list(BibtexBibliography.iter_entries([]))
+
+
+def test_get_content_hash(filepath_bibtex):
+    """Test the :meth:`biblary.bibliography.adapter.bibtex.BibtexBibliography.get_content_hash` method."""
+    adapter = BibtexBibliography(filepath_bibtex)
+    assert adapter.get_content_hash() == hashlib.sha256(filepath_bibtex.read_bytes()).hexdigest()
+
+    filepath_bibtex.write_text(filepath_bibtex.read_text() + '\n')
+    assert adapter.get_content_hash() == hashlib.sha256(filepath_bibtex.read_bytes()).hexdigest()
+
+    filepath_bibtex.unlink()
+    assert adapter.get_content_hash() is None
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""Tests for the :mod:`biblary.bibliography.adapter.scanner` module."""
+from biblary.bibliography.adapter.scanner import scan_entries
+
+
+def test_scan_entries():
+    """Test the :func:`biblary.bibliography.adapter.scanner.scan_entries` function."""
+    content = (
+        b'Some comment with an @ sign.\n'
+        b'@string{ann = {Annalen der Physik}}\n'
+        b'@Article{Einstein_1905,\n  title = {On {nested} braces},\n  journal = ann\n}\n'
+        b'@book(Planck_1901, title = {Parentheses (and braces)})\n'
+    )
+    spans = list(scan_entries(content))
+
+    assert [(span.entry_type, span.identifier) for span in spans] == [
+        ('string', None),
+        ('article', 'Einstein_1905'),
+        ('book', 'Planck_1901'),
+    ]
+    assert content[spans[1].start:spans[1].end].endswith(b'journal = ann\n}')
+    assert content[spans[2].start:spans[2].end] == b'@book(Planck_1901, title = {Parentheses (and braces)})'
+
+
+def test_scan_entries_digest():
+    """Test the digest of the spans yielded by :func:`biblary.bibliography.adapter.scanner.scan_entries`."""
+    entry = b'@article{Einstein_1905, title = {Title}}'
+    changed = b'@article{Einstein_1905, title = {Other}}'
+
+    first = list(scan_entries(entry + b'\n' + entry))
+    second = list(scan_entries(entry + b'\n' + changed))
+
+    assert first[0].digest == first[1].digest == second[0].digest
+    assert second[1].digest != first[1].digest
+
+
+def test_scan_entries_unclosed():
+    """Test that :func:`biblary.bibliography.adapter.scanner.scan_entries` ends an unclosed entry at the next entry."""
+    content = (
+        b'@article{Valid_1, title = {One}}\n'
+        b'@article{Broken, title = {Unclosed\n\n'
+        b'@article{Valid_2, title = {Two}}\n'
+    )
+    spans = list(scan_entries(content))
+
+    assert [span.identifier for span in spans] == ['Valid_1', 'Broken', 'Valid_2']
+    assert content[spans[1].start:spans[1].end] == b'@article{Broken, title = {Unclosed'
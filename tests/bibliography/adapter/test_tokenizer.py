@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Tests for the :mod:`biblary.bibliography.adapter.tokenizer` module."""
+import pytest
+
+from biblary.bibliography.adapter.tokenizer import iter_records
+from biblary.bibliography.exceptions import BibliographicEntryParsingError
+
+
+def test_iter_records():
+    """Test the :func:`biblary.bibliography.adapter.tokenizer.iter_records` function."""
+    content = """
+    @string{ann = "Annalen"}
+    @Article{Einstein_1905,
+        Title = {On {nested} braces},
+        journal = ann # { der Physik},
+        month = jun,
+        year = 1905,
+    }
+    @article{Invalid key, title = {Skipped}}
+    @misc(Planck_1901, title = "Quoted {"}value{"}")
+    """
+    records = list(iter_records(content))
+
+    assert records == [
+        {
+            'title': 'On {nested} braces',
+            'journal': 'Annalen der Physik',
+            'month': 'June',
+            'year': '1905',
+            'ENTRYTYPE': 'article',
+            'ID': 'Einstein_1905',
+        },
+        {
+            'title': 'Quoted {"}value{"}',
+            'ENTRYTYPE': 'misc',
+            'ID': 'Planck_1901',
+        },
+    ]
+
+
+def test_iter_records_macros():
+    """Test the ``macros`` argument of the :func:`biblary.bibliography.adapter.tokenizer.iter_records` function."""
+    macros = {}
+    assert not list(iter_records('@string{ann = {Annalen der Physik}}', macros))
+    assert macros == {'ann': 'Annalen der Physik'}
+
+    records = list(iter_records('@article{Einstein_1905, journal = ann}', macros))
+    assert records[0]['journal'] == 'Annalen der Physik'
+
+
+def test_iter_records_undefined_macro():
+    """Test the :func:`biblary.bibliography.adapter.tokenizer.iter_records` function for an undefined macro."""
+    with pytest.raises(BibliographicEntryParsingError, match=r'reference to undefined string `ann`.'):
+        list(iter_records('@article{Einstein_1905, journal = ann}'))
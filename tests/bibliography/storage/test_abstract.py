@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""Tests for the :mod:`biblary.bibliography.storage.abstract` module."""
+import asyncio
+
+from biblary.bibliography.entry import BibliographyEntry
+from biblary.bibliography.storage import AsyncStorageAdapter, FileType
+from biblary.bibliography.storage.file_system import FileSystemStorage
+
+
+def test_async_storage_adapter(tmp_path):
+    """Test the :class:`biblary.bibliography.storage.abstract.AsyncStorageAdapter` class."""
+    storage = FileSystemStorage(filepath=tmp_path)
+    entry = BibliographyEntry('article', 'a')
+    storage.put_file(b'content', entry, FileType.MANUSCRIPT)
+    async_storage = AsyncStorageAdapter(storage)
+
+    async def run():
+        assert await async_storage.aget_file(entry, FileType.MANUSCRIPT) == b'content'
+        assert await async_storage.astat_file(entry, FileType.MANUSCRIPT) is not None
+        assert await async_storage.aexists_many([entry]) == storage.exists_many([entry])
+
+        async with await async_storage.aopen_raw_file(entry, FileType.MANUSCRIPT) as handle:
+            assert await handle.read() == b'content'
+
+        assert handle.raw.closed
+
+    asyncio.run(run())
@@ -1,8 +1,17 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=redefined-outer-name
 """Tests for the :mod:`biblary.bibliography.storage.file_system` module."""
+import asyncio
+import gzip
+import hashlib
 import io
+import lzma
+import os
+import pathlib
+import stat
+import threading
 
+from django.core.files.uploadedfile import SimpleUploadedFile
 import pytest
 
 from biblary.bibliography.entry import BibliographyEntry
@@ -61,19 +70,39 @@ def test_get_file_non_existing(file_storage):
         file_storage.get_file(entry, FileType.MANUSCRIPT)
 
 
-@pytest.mark.parametrize('content', (b'test-content', io.BytesIO(b'test-content')))
-def test_put_file(file_storage, content):
+@pytest.mark.parametrize(
+    'get_content', (
+        lambda: b'test-content',
+        lambda: io.BytesIO(b'test-content'),
+        lambda: [b'test-', b'content'],
+        lambda: SimpleUploadedFile('file.pdf', b'test-content'),
+    )
+)
+@pytest.mark.parametrize('deduplicate', (False, True))
+def test_put_file(tmp_path, get_content, deduplicate):
     """Test the :meth:`biblary.bibliography.storage.file_system.FileSystemStorage.put_file` method."""
+    file_storage = FileSystemStorage(filepath=tmp_path, deduplicate=deduplicate)
     entry = BibliographyEntry('article', 1)
     file_type = FileType.MANUSCRIPT
 
-    file_storage.put_file(content, entry, file_type)
+    file_storage.put_file(get_content(), entry, file_type)
 
-    if isinstance(content, bytes):
-        assert file_storage.get_file(entry, file_type) == content
-    else:
-        content.seek(0)
-        assert file_storage.get_file(entry, file_type) == content.read()
+    assert file_storage.get_file(entry, file_type) == b'test-content'
+    assert not list(tmp_path.rglob('*.tmp'))
+
+
+@pytest.mark.parametrize('content', ('string', io.StringIO('string'), ['string'], 1))
+def test_put_file_invalid_content(file_storage, content):
+    """Test the :meth:`biblary.bibliography.storage.file_system.FileSystemStorage.put_file` method raises for content
+    that is not bytes, without leaving a partially written file.
+    """
+    entry = BibliographyEntry('article', 1)
+
+    with pytest.raises(TypeError, match=r'invalid type for ``content``'):
+        file_storage.put_file(content, entry, FileType.MANUSCRIPT)
+
+    assert not file_storage.exists(entry, FileType.MANUSCRIPT)
+    assert not list(file_storage.filepath.rglob('*.tmp'))
 
 
 def test_get_file_invalid_type(file_storage):
@@ -96,3 +125,296 @@ def test_exists(file_storage, write_file):
 
     assert file_storage.exists(entry, file_type)
     assert not file_storage.exists(entry, FileType.SUPPLEMENTARY)
+
+
+def test_exists_many(file_storage, write_file):
+    """Test the :meth:`biblary.bibliography.storage.file_system.FileSystemStorage.exists_many` method."""
+    entries = [BibliographyEntry('article', identifier) for identifier in ('a', 'b', 'c')]
+
+    write_file(file_storage, entries[0], FileType.MANUSCRIPT, b'')
+    write_file(file_storage, entries[0], FileType.PREPRINT, b'')
+    write_file(file_storage, entries[1], FileType.SUPPLEMENTARY, b'')
+
+    available = file_storage.exists_many(entries)
+    for entry in entries:
+        expected = {file_type: file_storage.exists(entry, file_type) for file_type in FileType}
+        assert available[entry.identifier] == expected
+    assert available['a'][FileType.PREPRINT]
+    assert not any(available['c'].values())
+
+
+def test_exists_many_scans_entry_folders(file_storage, write_file, monkeypatch):
+    """Test that ``exists_many`` only scans the folders of the given entries and not the entire base folder."""
+    entries = [BibliographyEntry('article', identifier) for identifier in ('a', 'b', 'c')]
+
+    for entry in entries:
+        write_file(file_storage, entry, FileType.MANUSCRIPT, b'')
+
+    scanned = []
+    scandir = os.scandir
+
+    def recording_scandir(path):
+        scanned.append(pathlib.Path(path))
+        return scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', recording_scandir)
+    available = file_storage.exists_many(entries[:1])
+
+    assert available == {'a': {file_type: file_type == FileType.MANUSCRIPT for file_type in FileType}}
+    assert scanned == [file_storage.get_filepath(entries[0], FileType.MANUSCRIPT).parent]
+
+
+def test_exists_many_non_existing(tmp_path):
+    """Test the :meth:`biblary.bibliography.storage.file_system.FileSystemStorage.exists_many` without base folder."""
+    file_storage = FileSystemStorage(filepath=tmp_path / 'non-existing')
+    assert file_storage.exists_many([BibliographyEntry('article', 'a')]) == {'a': dict.fromkeys(FileType, False)}
+
+
+def test_open_file(file_storage, write_file):
+    """Test the :meth:`biblary.bibliography.storage.file_system.FileSystemStorage.open_file` method."""
+    entry = BibliographyEntry('article', 1)
+    write_file(file_storage, entry, FileType.MANUSCRIPT, b'test-content')
+
+    with file_storage.open_file(entry, FileType.MANUSCRIPT) as handle:
+        assert handle.read() == b'test-content'
+
+    with pytest.raises(FileNotFoundError):
+        file_storage.open_file(entry, FileType.PREPRINT)
+
+
+def test_get_version(file_storage):
+    """Test the :meth:`biblary.bibliography.storage.file_system.FileSystemStorage.get_version` method."""
+    entry = BibliographyEntry('article', 1)
+    version = file_storage.get_version()
+    assert version == '0'
+
+    file_storage.put_file(b'content', entry, FileType.MANUSCRIPT)
+    assert file_storage.get_version() != version
+    assert file_storage.stat_file(entry, FileType.MANUSCRIPT)[0] == len(b'content')
+
+
+@pytest.mark.parametrize('deduplicate', (False, True))
+@pytest.mark.parametrize('compression', (None, 'gzip'))
+def test_put_file_checksum(tmp_path, deduplicate, compression):
+    """Test the :meth:`biblary.bibliography.storage.file_system.FileSystemStorage.put_file` returns the checksum."""
+    entry = BibliographyEntry('article', 1)
+    file_storage = FileSystemStorage(
+        filepath=tmp_path,
+        deduplicate=deduplicate,
+        compression={FileType.MANUSCRIPT.value: compression} if compression else None,
+    )
+    content_hash = file_storage.put_file([b'con', b'tent'], entry, FileType.MANUSCRIPT)
+
+    with file_storage.open_raw_file(entry, FileType.MANUSCRIPT) as handle:
+        assert content_hash == hashlib.sha256(handle.read()).hexdigest()
+
+
+def test_put_file_fsync_directory(file_storage, monkeypatch):
+    """Test the :meth:`biblary.bibliography.storage.file_system.FileSystemStorage.put_file` syncs the folder.
+
+    After the temporary file is moved in place, the folder that contains it should be synced, such that the rename is
+    not lost in a crash.
+    """
+    entry = BibliographyEntry('article', 1)
+    synced = []
+    fsync = os.fsync
+
+    def _fsync(descriptor):
+        if stat.S_ISDIR(os.fstat(descriptor).st_mode):
+            synced.append(os.fstat(descriptor).st_ino)
+        fsync(descriptor)
+
+    monkeypatch.setattr(os, 'fsync', _fsync)
+    file_storage.put_file(b'content', entry, FileType.MANUSCRIPT)
+
+    directory = file_storage.get_filepath(entry, FileType.MANUSCRIPT).parent
+    assert directory.stat().st_ino in synced
+    assert file_storage.filepath.stat().st_ino in synced
+
+
+def test_get_version_replaced_atomically(file_storage, tmp_path, monkeypatch):
+    """Test the :meth:`biblary.bibliography.storage.file_system.FileSystemStorage.put_file` replaces the version file.
+
+    The version file should be written to a temporary file that is moved in place, such that a concurrent reader of the
+    version never sees an empty or partially written token.
+    """
+    entry = BibliographyEntry('article', 1)
+    file_storage.put_file(b'content', entry, FileType.MANUSCRIPT)
+    version = file_storage.get_version()
+    replaced = []
+
+    def replace(source, destination):
+        if pathlib.Path(destination).name == FileSystemStorage.VERSION_FILENAME:
+            assert file_storage.get_version() == version
+            replaced.append(pathlib.Path(source).read_text())
+        os_replace(source, destination)
+
+    os_replace = os.replace
+    monkeypatch.setattr(os, 'replace', replace)
+    file_storage.put_file(b'other', entry, FileType.MANUSCRIPT)
+
+    assert replaced == [file_storage.get_version()]
+    assert len(file_storage.get_version()) == 32
+    assert not list(tmp_path.glob('.*.tmp'))
+
+
+def test_put_file_deduplicate(tmp_path):
+    """Test the :meth:`biblary.bibliography.storage.file_system.FileSystemStorage.put_file` method with deduplicate."""
+    file_storage = FileSystemStorage(filepath=tmp_path, deduplicate=True)
+    entries = [BibliographyEntry('article', identifier) for identifier in ('a', 'b')]
+    content = b'test-content'
+
+    file_storage.put_file(content, entries[0], FileType.MANUSCRIPT)
+    blob = file_storage.get_blob_filepath(hashlib.sha256(content).hexdigest())
+    stat = blob.stat()
+
+    file_storage.put_file(content, entries[1], FileType.PREPRINT)
+    assert (blob.stat().st_ino, blob.stat().st_mtime_ns) == (stat.st_ino, stat.st_mtime_ns)
+    assert blob.read_bytes() == content
+    assert blob.stat().st_nlink == 3
+    assert file_storage.get_file(entries[1], FileType.PREPRINT) == content
+    available = file_storage.exists_many(entries)
+    assert set(available) == {'a', 'b'}
+    assert available['a'] == {FileType.MANUSCRIPT: True, FileType.PREPRINT: False, FileType.SUPPLEMENTARY: False}
+    assert available['b'] == {FileType.MANUSCRIPT: False, FileType.PREPRINT: True, FileType.SUPPLEMENTARY: False}
+
+    file_storage.put_file(b'other-content', entries[0], FileType.MANUSCRIPT)
+    file_storage.put_file(b'other-content', entries[1], FileType.PREPRINT)
+    assert file_storage.get_file(entries[0], FileType.MANUSCRIPT) == b'other-content'
+    assert file_storage.prune_blobs() == 1
+    assert not blob.exists()
+
+
+def test_prune_blobs_concurrent_put_file(tmp_path, monkeypatch):
+    """Test that pruning blobs waits for a concurrent ``put_file`` that links to an unreferenced blob."""
+    entry = BibliographyEntry('article', 'a')
+    file_storage = FileSystemStorage(filepath=tmp_path, deduplicate=True)
+    file_storage.put_file(b'content', entry, FileType.MANUSCRIPT)
+    file_storage.put_file(b'other-content', entry, FileType.MANUSCRIPT)
+    blob = file_storage.get_blob_filepath(hashlib.sha256(b'content').hexdigest())
+    assert blob.stat().st_nlink == 1
+
+    link_blob = FileSystemStorage._link_blob  # pylint: disable=protected-access
+    threads = []
+    pruned = []
+
+    def _link_blob(source, destination):
+        """Start pruning the blobs just before the blob is linked, which should block until it is linked."""
+        thread = threading.Thread(target=lambda: pruned.append(file_storage.prune_blobs()))
+        thread.start()
+        thread.join(timeout=0.2)
+        assert thread.is_alive()
+        threads.append(thread)
+        link_blob(source, destination)
+
+    monkeypatch.setattr(FileSystemStorage, '_link_blob', staticmethod(_link_blob))
+    file_storage.put_file(b'content', entry, FileType.PREPRINT)
+    threads[0].join()
+
+    assert pruned == [0]
+    assert file_storage.get_file(entry, FileType.PREPRINT) == b'content'
+
+
+def test_put_file_after_deduplicate(tmp_path):
+    """Test that writing a file without deduplication does not modify a blob that the file is a hardlink of."""
+    entries = [BibliographyEntry('article', identifier) for identifier in ('a', 'b')]
+    file_storage = FileSystemStorage(filepath=tmp_path, deduplicate=True)
+    file_storage.put_file(b'content', entries[0], FileType.MANUSCRIPT)
+    file_storage.put_file(b'content', entries[1], FileType.MANUSCRIPT)
+
+    FileSystemStorage(filepath=tmp_path).put_file(b'changed', entries[0], FileType.MANUSCRIPT)
+    assert file_storage.get_file(entries[0], FileType.MANUSCRIPT) == b'changed'
+    assert file_storage.get_file(entries[1], FileType.MANUSCRIPT) == b'content'
+
+
+@pytest.mark.parametrize('compression, decompress', (('gzip', gzip.decompress), ('lzma', lzma.decompress)))
+@pytest.mark.parametrize('deduplicate', (False, True))
+def test_put_file_compression(tmp_path, compression, decompress, deduplicate):
+    """Test the :meth:`biblary.bibliography.storage.file_system.FileSystemStorage.put_file` method with compression."""
+    file_storage = FileSystemStorage(
+        filepath=tmp_path, deduplicate=deduplicate, compression={FileType.MANUSCRIPT.value: compression}
+    )
+    entry = BibliographyEntry('article', 'a')
+    content = b'test-content' * 100
+
+    file_storage.put_file(content, entry, FileType.MANUSCRIPT)
+    filepath = file_storage.get_stored_filepath(entry, FileType.MANUSCRIPT, compression)
+    assert filepath.name == FileType.MANUSCRIPT.value + FileSystemStorage.COMPRESSION_SUFFIXES[compression]
+    assert decompress(filepath.read_bytes()) == content
+    assert not file_storage.get_filepath(entry, FileType.MANUSCRIPT).exists()
+
+    assert file_storage.get_file(entry, FileType.MANUSCRIPT) == content
+    assert file_storage.get_file_encoding(entry, FileType.MANUSCRIPT) == compression
+    assert file_storage.stat_file(entry, FileType.MANUSCRIPT)[0] == filepath.stat().st_size
+    assert file_storage.exists(entry, FileType.MANUSCRIPT)
+    assert file_storage.exists_many([entry])['a'][FileType.MANUSCRIPT]
+
+    with file_storage.open_file(entry, FileType.MANUSCRIPT) as handle:
+        assert handle.read() == content
+
+    with file_storage.open_raw_file(entry, FileType.MANUSCRIPT) as handle:
+        assert handle.read() == filepath.read_bytes()
+
+
+def test_put_file_compression_deterministic(tmp_path):
+    """Test that the same content is always compressed to the same bytes, such that it can be deduplicated."""
+    file_storage = FileSystemStorage(filepath=tmp_path, deduplicate=True, compression={'manuscript': 'gzip'})
+    entries = [BibliographyEntry('article', identifier) for identifier in ('a', 'b')]
+
+    for entry in entries:
+        file_storage.put_file(b'content', entry, FileType.MANUSCRIPT)
+
+    filepath = file_storage.get_stored_filepath(entries[0], FileType.MANUSCRIPT, 'gzip')
+    assert filepath.stat().st_nlink == 3
+
+
+def test_put_file_compression_changed(tmp_path):
+    """Test that files remain readable when the configured compression changes."""
+    entry = BibliographyEntry('article', 'a')
+    FileSystemStorage(filepath=tmp_path).put_file(b'raw', entry, FileType.MANUSCRIPT)
+
+    file_storage = FileSystemStorage(filepath=tmp_path, compression={'manuscript': 'lzma'})
+    assert file_storage.get_file(entry, FileType.MANUSCRIPT) == b'raw'
+    assert file_storage.get_file_encoding(entry, FileType.MANUSCRIPT) is None
+
+    file_storage.put_file(b'compressed', entry, FileType.MANUSCRIPT)
+    assert file_storage.get_file_encoding(entry, FileType.MANUSCRIPT) == 'lzma'
+    assert not file_storage.get_filepath(entry, FileType.MANUSCRIPT).exists()
+
+    file_storage = FileSystemStorage(filepath=tmp_path)
+    assert file_storage.get_file(entry, FileType.MANUSCRIPT) == b'compressed'
+
+    file_storage.put_file(b'raw', entry, FileType.MANUSCRIPT)
+    assert file_storage.get_file_encoding(entry, FileType.MANUSCRIPT) is None
+    assert not file_storage.get_stored_filepath(entry, FileType.MANUSCRIPT, 'lzma').exists()
+
+
+@pytest.mark.parametrize('compression', ({'invalid': 'gzip'}, {'manuscript': 'invalid'}))
+def test_compression_invalid(tmp_path, compression):
+    """Test the constructor of :class:`biblary.bibliography.storage.file_system.FileSystemStorage` raises."""
+    with pytest.raises(ValueError, match=r'invalid .* in ``compression``|invalid compression'):
+        FileSystemStorage(filepath=tmp_path, compression=compression)
+
+
+def test_async_interface(tmp_path):
+    """Test the asynchronous interface of :class:`biblary.bibliography.storage.file_system.FileSystemStorage`."""
+    file_storage = FileSystemStorage(filepath=tmp_path, async_workers=2)
+    entry = BibliographyEntry('article', 'a')
+    file_storage.put_file(b'content', entry, FileType.MANUSCRIPT)
+
+    async def run():
+        assert await file_storage.aget_file(entry, FileType.MANUSCRIPT) == b'content'
+        stat = file_storage.stat_file(entry, FileType.MANUSCRIPT)
+        assert await file_storage.astat_file(entry, FileType.MANUSCRIPT) == stat
+        assert await file_storage.aget_file_encoding(entry, FileType.MANUSCRIPT) is None
+        assert await file_storage.aexists_many([entry]) == file_storage.exists_many([entry])
+
+        async with await file_storage.aopen_file(entry, FileType.MANUSCRIPT) as handle:
+            assert await handle.seek(3) == 3
+            assert await handle.read() == b'tent'
+
+        with pytest.raises(FileNotFoundError):
+            await file_storage.aopen_file(entry, FileType.PREPRINT)
+
+    asyncio.run(run())
+    assert file_storage._executor._max_workers == 2  # pylint: disable=protected-access
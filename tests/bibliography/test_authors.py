@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""Tests for the :mod:`biblary.bibliography.authors` module."""
+import pytest
+
+from biblary.bibliography.authors import AuthorIndex, get_author_key
+from biblary.bibliography.entry import BibliographyEntry
+
+
+@pytest.mark.parametrize(
+    'author, expected', (
+        ('Erwin Schrödinger', 'schrodinger-e'),
+        ('E. Schrodinger', 'schrodinger-e'),
+        ('Schrödinger, Erwin', 'schrodinger-e'),
+        ('J. Robert Oppenheimer', 'oppenheimer-j'),
+        ('John von Neumann', 'von-neumann-j'),
+        ('von Neumann, John', 'von-neumann-j'),
+        ('Plato', 'plato'),
+        (', Plato', 'plato'),
+        ('  ', ''),
+    )
+)
+def test_get_author_key(author, expected):
+    """Test the :func:`biblary.bibliography.authors.get_author_key` function."""
+    assert get_author_key(author) == expected
+
+
+def test_author_index():
+    """Test the :class:`biblary.bibliography.authors.AuthorIndex` class."""
+    entries = [
+        BibliographyEntry('article', 'a', author=['Erwin Schrödinger', 'N. Bohr']),
+        BibliographyEntry('article', 'b', author=['E. Schrödinger', 'Erwin Schrödinger']),
+        BibliographyEntry('article', 'c', author='E. Schrödinger'),
+        BibliographyEntry('article', 'd'),
+    ]
+    index = AuthorIndex(entries)
+
+    assert set(index) == {'schrodinger-e', 'bohr-n'}
+    assert len(index) == 2
+    assert [entry.identifier for entry in index['schrodinger-e']] == ['a', 'b', 'c']
+    assert [entry.identifier for entry in index['bohr-n']] == ['a']
+    assert index.get_name('schrodinger-e') == 'Erwin Schrödinger'
+    assert index.get_name('bohr-n') == 'N. Bohr'
+
+    with pytest.raises(KeyError):
+        index.get_name('einstein-a')
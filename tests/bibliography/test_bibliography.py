@@ -169,6 +169,74 @@ def test_sort(get_bibliography, sort, reverse, expected):
     assert [entry.identifier for entry in sorted(bibliography.values(), key=sort, reverse=reverse)] == expected
 
 
+def test_get_year_counts(get_bibliography):
+    """Test the :meth:`biblary.bibliography.bibliography.Bibliography.get_year_counts` method."""
+    bibliography = get_bibliography()
+    assert bibliography.get_year_counts() == {1916: 1, 1913: 1, 1905: 1, 1901: 1}
+    assert list(bibliography.get_year_counts()) == [1916, 1913, 1905, 1901]
+
+    bibliography.add_entry(BibliographyEntry('article', identifier=5, year='1905'))
+    bibliography.add_entry(BibliographyEntry('article', identifier=6))
+    assert bibliography.get_year_counts() == {1916: 1, 1913: 1, 1905: 2, 1901: 1, None: 1}
+
+
+@pytest.mark.parametrize(
+    'year_from, year_to, expected', (
+        (None, None, [4, 3, 2, 5, 1, 6]),
+        (1905, None, [4, 3, 2, 5]),
+        (None, 1905, [2, 5, 1]),
+        (1905, 1913, [3, 2, 5]),
+        (1905, 1905, [2, 5]),
+        (1906, 1912, []),
+        (1920, None, []),
+    )
+)
+def test_get_entries_by_year(get_bibliography, year_from, year_to, expected):
+    """Test the :meth:`biblary.bibliography.bibliography.Bibliography.get_entries_by_year` method."""
+    bibliography = get_bibliography()
+    bibliography.add_entry(BibliographyEntry('article', identifier=5, year='1905'))
+    bibliography.add_entry(BibliographyEntry('article', identifier=6))
+    entries = bibliography.get_entries_by_year(year_from, year_to)
+    assert [entry.identifier for entry in entries] == expected
+
+
+def test_get_entries_by_year_selection(get_bibliography):
+    """Test the :meth:`biblary.bibliography.bibliography.Bibliography.get_entries_by_year` method with a selection."""
+    bibliography = get_bibliography()
+    bibliography.add_entry(BibliographyEntry('book', identifier=5, year='1905', author='A. Einstein'))
+
+    entries = bibliography.get_entries_by_year(selection={'entry_type': ['article']})
+    assert [entry.identifier for entry in entries] == [4, 3, 2, 1]
+
+    entries = bibliography.get_entries_by_year(1905, 1913, selection={'entry_type': ['book', 'article']})
+    assert [entry.identifier for entry in entries] == [3, 2, 5]
+    assert bibliography.get_facets().get_counts()['entry_type'] == {'article': 4, 'book': 1}
+
+
+def test_get_authors(get_bibliography):
+    """Test the :meth:`biblary.bibliography.bibliography.Bibliography.get_authors` method."""
+    bibliography = get_bibliography()
+    authors = bibliography.get_authors()
+    assert [entry.identifier for entry in authors['einstein-a']] == [4, 2]
+    assert bibliography.get_authors() is authors
+
+    bibliography.add_entry(BibliographyEntry('article', identifier=5, year='1921', author='Einstein, Albert'))
+    assert [entry.identifier for entry in bibliography.get_authors()['einstein-a']] == [5, 4, 2]
+
+
+def test_search(get_bibliography):
+    """Test the :meth:`biblary.bibliography.bibliography.Bibliography.search` method."""
+    bibliography = get_bibliography()
+    assert [entry.identifier for entry in bibliography.search('einstein')] == [2, 4]
+    assert bibliography.search('einstein', limit=1) == [bibliography[2]]
+
+    bibliography.add_entry(BibliographyEntry('article', identifier=5, author='A. Einstein'))
+    assert [entry.identifier for entry in bibliography.search('einst')] == [2, 4, 5]
+
+    bibliography.refresh()
+    assert [entry.identifier for entry in bibliography.search('einst')] == [2, 4]
+
+
 @pytest.mark.parametrize(
     'entry',
     (BibliographyEntry(entry_type='article', identifier='123'), '{"entry_type": "article", "identifier": "123"}')
@@ -205,3 +273,31 @@ def test_save(filepath_bibtex):
     clone = Bibliography(BibtexBibliography(filepath_bibtex))
     assert added in bibliography
     assert added in clone
+
+
+def test_save_append(filepath_bibtex):
+    """Test the :meth:`biblary.bibliography.bibliography.Bibliography.save` method appends added entries."""
+    content = filepath_bibtex.read_text()
+    bibliography = Bibliography(BibtexBibliography(filepath_bibtex))
+    bibliography.add_entry(BibliographyEntry('article', identifier='1', year='1901', author=['M. Planck']))
+    bibliography.save()
+
+    assert filepath_bibtex.read_text().startswith(content)
+    assert len(Bibliography(BibtexBibliography(filepath_bibtex))) == 2
+
+
+def test_save_rewrite(monkeypatch):
+    """Test the :meth:`biblary.bibliography.bibliography.Bibliography.save` method rewrites all entries.
+
+    All entries should be rewritten if ``rewrite=True`` or if the adapter does not support appending entries.
+    """
+    saved = []
+    monkeypatch.setattr(MockAdapter, 'save_entries', lambda _, entries: saved.append(entries))
+
+    bibliography = Bibliography(MockAdapter(entries=[BibliographyEntry('article', identifier='1')]))
+    bibliography.add_entry(BibliographyEntry('article', identifier='2'))
+    bibliography.save()
+    assert [entry.identifier for entry in saved.pop()] == ['1', '2']
+
+    bibliography.save(rewrite=True)
+    assert [entry.identifier for entry in saved.pop()] == ['1', '2']
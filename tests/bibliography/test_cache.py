@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Tests for the :mod:`biblary.bibliography.cache` module."""
+from biblary.bibliography.adapter import BibtexBibliography
+from biblary.bibliography.bibliography import Bibliography
+from biblary.bibliography.cache import BibliographyCache
+
+
+def test_bibliography_cache(filepath_bibtex):
+    """Test the :class:`biblary.bibliography.cache.BibliographyCache` class."""
+    cache = BibliographyCache()
+    adapter = BibtexBibliography(filepath_bibtex)
+    bibliography = Bibliography(adapter)
+
+    assert cache.get('key') is None
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    cache.set('key', adapter.get_version(), bibliography)
+    assert cache.get('key') is bibliography
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    filepath_bibtex.write_text(filepath_bibtex.read_text() + '\n')
+    assert cache.get('key') is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_bibliography_cache_version_none(filepath_bibtex):
+    """Test that :meth:`biblary.bibliography.cache.BibliographyCache.set` does not cache without a version."""
+    cache = BibliographyCache()
+    cache.set('key', None, Bibliography(BibtexBibliography(filepath_bibtex)))
+    assert len(cache) == 0
+
+
+def test_bibliography_cache_invalidate(filepath_bibtex):
+    """Test the :meth:`biblary.bibliography.cache.BibliographyCache.invalidate` method."""
+    cache = BibliographyCache()
+    adapter = BibtexBibliography(filepath_bibtex)
+    cache.set('key', adapter.get_version(), Bibliography(adapter))
+    assert len(cache) == 1
+
+    cache.invalidate()
+    assert cache.get('key') is None
+    assert cache.peek('key') is not None
@@ -2,7 +2,7 @@
 """Tests for the :mod:`biblary.bibliography.entry` module."""
 import pytest
 
-from biblary.bibliography.entry import BibliographyEntry
+from biblary.bibliography.entry import BibliographyEntry, LazyBibliographyEntry
 
 
 def test_bibliography_entry_constructor():
@@ -18,3 +18,24 @@ def test_bibliography_entry_constructor_invalid():
     """Test the class:`biblary.bibliography.entry.BibliographyEntry` constructor with insufficient arguments."""
     with pytest.raises(TypeError, match=r'missing .* required positional arguments'):
         BibliographyEntry()  # pylint: disable=no-value-for-parameter
+
+
+def test_lazy_bibliography_entry():
+    """Test the class:`biblary.bibliography.entry.LazyBibliographyEntry` decodes fields once on first access."""
+    decoded = []
+
+    def decoder(name):
+        decoded.append(name)
+        return 'Title' if name == 'title' else None
+
+    entry = LazyBibliographyEntry('article', 'Einstein1905', decoder)
+    assert decoded == []
+
+    assert entry.title == 'Title'
+    assert entry.title == 'Title'
+    assert entry.author is None
+    assert decoded == ['title', 'author']
+
+    assert entry == BibliographyEntry('article', 'Einstein1905', title='Title')
+    assert BibliographyEntry('article', 'Einstein1905', title='Title') == entry
+    assert entry != BibliographyEntry('article', 'Einstein1905', title='Other')
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=redefined-outer-name
+"""Tests for the :mod:`biblary.bibliography.facets` module."""
+import pytest
+
+from biblary.bibliography.entry import BibliographyEntry
+from biblary.bibliography.facets import FacetIndex, get_facet_values
+
+
+@pytest.mark.parametrize(
+    'entry, facet, expected', (
+        (BibliographyEntry('article', 'a', year='1905'), 'year', (1905,)),
+        (BibliographyEntry('article', 'a', year='unknown'), 'year', ()),
+        (BibliographyEntry('article', 'a'), 'entry_type', ('article',)),
+        (BibliographyEntry('article', 'a', journal='Nature', publisher='Springer'), 'venue', ('Nature',)),
+        (BibliographyEntry('book', 'a', publisher='Springer'), 'venue', ('Springer',)),
+        (BibliographyEntry('article', 'a', keyword='quanta; light, quanta'), 'keyword', ('quanta', 'light')),
+        (BibliographyEntry('article', 'a', keyword=['quanta', 'light']), 'keyword', ('quanta', 'light')),
+        (BibliographyEntry('article', 'a'), 'keyword', ()),
+    )
+)
+def test_get_facet_values(entry, facet, expected):
+    """Test the :func:`biblary.bibliography.facets.get_facet_values` function."""
+    assert get_facet_values(entry, facet) == expected
+
+
+def test_get_facet_values_invalid():
+    """Test the :func:`biblary.bibliography.facets.get_facet_values` function with an invalid facet."""
+    with pytest.raises(ValueError, match=r'invalid facet `invalid`'):
+        get_facet_values(BibliographyEntry('article', 'a'), 'invalid')
+
+
+@pytest.fixture
+def facet_index():
+    """Return a :class:`biblary.bibliography.facets.FacetIndex` with a few entries."""
+    return FacetIndex([
+        BibliographyEntry('article', 'a', year=1916, journal='Annalen', keyword='relativity'),
+        BibliographyEntry('book', 'b', year=1913, publisher='Springer', keyword='atoms, quanta'),
+        BibliographyEntry('article', 'c', year=1905, journal='Annalen', keyword='quanta'),
+        BibliographyEntry('article', 'd', year=1905, journal='Nature'),
+    ])
+
+
+@pytest.mark.parametrize(
+    'selection, expected', (
+        ({}, None),
+        (dict(entry_type=[]), None),
+        (dict(entry_type=['article']), {0, 2, 3}),
+        (dict(entry_type=['article'], keyword=['quanta']), {2}),
+        (dict(venue=['Annalen', 'Springer']), {0, 1, 2}),
+        (dict(year=[1905], venue=['Springer']), set()),
+    )
+)
+def test_filter(facet_index, selection, expected):
+    """Test the :meth:`biblary.bibliography.facets.FacetIndex.filter` method."""
+    assert facet_index.filter(selection) == expected
+
+
+def test_filter_invalid(facet_index):
+    """Test the :meth:`biblary.bibliography.facets.FacetIndex.filter` method with an invalid facet."""
+    with pytest.raises(ValueError, match=r'invalid facet `invalid`'):
+        facet_index.filter({'invalid': ['value']})
+
+
+def test_get_counts(facet_index):
+    """Test the :meth:`biblary.bibliography.facets.FacetIndex.get_counts` method."""
+    counts = facet_index.get_counts()
+    assert counts['year'] == {1916: 1, 1913: 1, 1905: 2}
+    assert list(counts['year']) == [1916, 1913, 1905]
+    assert counts['entry_type'] == {'article': 3, 'book': 1}
+    assert list(counts['venue']) == ['Annalen', 'Nature', 'Springer']
+    assert counts['keyword'] == {'quanta': 2, 'atoms': 1, 'relativity': 1}
+
+    counts = facet_index.get_counts({'entry_type': ['article']})
+    assert counts['entry_type'] == {'article': 3, 'book': 1}
+    assert counts['year'] == {1916: 1, 1905: 2}
+    assert counts['keyword'] == {'quanta': 1, 'relativity': 1}
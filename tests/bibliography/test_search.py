@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Tests for the :mod:`biblary.bibliography.search` module."""
+import pytest
+
+from biblary.bibliography.entry import BibliographyEntry
+from biblary.bibliography.search import SearchIndex, tokenize
+
+
+@pytest.mark.parametrize(
+    'value, expected', (
+        (None, []),
+        ('Über die {Quantentheorie}', ['uber', 'die', 'quantentheorie']),
+        (['E. Schrödinger', 'M. Planck'], ['e', 'schrodinger', 'm', 'planck']),
+        (1905, ['1905']),
+    )
+)
+def test_tokenize(value, expected):
+    """Test the :func:`biblary.bibliography.search.tokenize` function."""
+    assert tokenize(value) == expected
+
+
+@pytest.fixture
+def search_index():
+    """Return a :class:`biblary.bibliography.search.SearchIndex` with a few entries."""
+    return SearchIndex([
+        BibliographyEntry('article', 'a', title='Quantum theory of radiation', author=['A. Einstein']),
+        BibliographyEntry('article', 'b', title='Photoelectric effect', author=['A. Einstein'], journal='Quantum'),
+        BibliographyEntry('article', 'c', title='Atomic structure', author=['N. Bohr'], keyword='quantum, atoms'),
+        BibliographyEntry('article', 'd', title='Quantization as an eigenvalue problem', author=['E. Schrödinger']),
+    ])
+
+
+@pytest.mark.parametrize(
+    'query, expected', (
+        ('quantum', ['a', 'c', 'b']),
+        ('QUANTUM einstein', ['a', 'b']),
+        ('quant', ['a', 'd', 'c', 'b']),
+        ('schrodinger', ['d']),
+        ('einstein bohr', []),
+        ('relativity', []),
+        ('', []),
+    )
+)
+def test_search(search_index, query, expected):
+    """Test the :meth:`biblary.bibliography.search.SearchIndex.search` method."""
+    assert search_index.search(query) == expected
+
+
+def test_search_limit(search_index):
+    """Test the :meth:`biblary.bibliography.search.SearchIndex.search` method with a limit."""
+    assert search_index.search('quantum', limit=2) == ['a', 'c']
+
+
+def test_add(search_index):
+    """Test the :meth:`biblary.bibliography.search.SearchIndex.add` method."""
+    search_index.add(BibliographyEntry('article', 'e', title='Zitterbewegung', author=['E. Schrödinger']))
+    assert len(search_index) == 5
+    assert search_index.search('zitter') == ['e']
+    assert search_index.search('schrödinger') == ['d', 'e']
+
+    with pytest.raises(ValueError, match=r'the index already contains an entry with identifier `e`.'):
+        search_index.add(BibliographyEntry('article', 'e'))
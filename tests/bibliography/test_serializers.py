@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Tests for the :mod:`biblary.bibliography.serializers` module."""
+import json
+
+import pytest
+
+from biblary.bibliography.entry import BibliographyEntry
+from biblary.bibliography.serializers import iter_json, to_csl_json, to_json
+
+
+@pytest.fixture
+def entry():
+    """Return a :class:`biblary.bibliography.entry.BibliographyEntry` with most fields defined."""
+    return BibliographyEntry(
+        'article',
+        'Einstein_1905',
+        author=['Albert Einstein', 'John von Neumann'],
+        title='Title',
+        journal='Annalen der Physik',
+        volume=17,
+        pages='891--921',
+        month='6',
+        year='1905',
+        keyword='relativity; light',
+        doi='10.1002/andp.19053221004',
+    )
+
+
+def test_to_json(entry):
+    """Test the :func:`biblary.bibliography.serializers.to_json` function."""
+    assert to_json(entry) == {
+        'entry_type': 'article',
+        'identifier': 'Einstein_1905',
+        'author': ['Albert Einstein', 'John von Neumann'],
+        'title': 'Title',
+        'journal': 'Annalen der Physik',
+        'volume': 17,
+        'pages': '891--921',
+        'month': '6',
+        'year': '1905',
+        'keyword': 'relativity; light',
+        'doi': '10.1002/andp.19053221004',
+    }
+    assert to_json(entry, ['title', 'publisher']) == {'identifier': 'Einstein_1905', 'title': 'Title'}
+
+
+def test_to_csl_json(entry):
+    """Test the :func:`biblary.bibliography.serializers.to_csl_json` function."""
+    authors = [{'family': 'Einstein', 'given': 'Albert'}, {'family': 'von Neumann', 'given': 'John'}]
+    issued = {'date-parts': [[1905, 6]]}
+    assert to_csl_json(entry) == {
+        'id': 'Einstein_1905',
+        'type': 'article-journal',
+        'author': authors,
+        'title': 'Title',
+        'container-title': 'Annalen der Physik',
+        'volume': '17',
+        'page': '891--921',
+        'DOI': '10.1002/andp.19053221004',
+        'keyword': 'relativity, light',
+        'issued': issued,
+    }
+    assert to_csl_json(entry, ['year']) == {'id': 'Einstein_1905', 'issued': {'date-parts': [[1905]]}}
+    assert to_csl_json(BibliographyEntry('misc', 'a', month='June')) == {'id': 'a', 'type': 'document'}
+
+
+@pytest.mark.parametrize(
+    'month, expected', (
+        ('6', [[1905, 6]]),
+        (' 12 ', [[1905, 12]]),
+        ('June', [[1905, 6]]),
+        ('jun', [[1905, 6]]),
+        ('Sept.', [[1905, 9]]),
+        ('13', [[1905]]),
+        ('summer', [[1905]]),
+        ('mayday', [[1905]]),
+        (None, [[1905]]),
+    )
+)
+def test_to_csl_json_month(month, expected):
+    """Test the :func:`biblary.bibliography.serializers.to_csl_json` function converts the month to a number."""
+    item = to_csl_json(BibliographyEntry('article', 'a', year='1905', month=month))
+    assert item['issued'] == {'date-parts': expected}
+
+
+@pytest.mark.parametrize('count', (0, 1, 3, 4, 7))
+def test_iter_json(count):
+    """Test the :func:`biblary.bibliography.serializers.iter_json` function."""
+    entries = [BibliographyEntry('article', str(index), title='Schrödinger') for index in range(count)]
+    chunks = list(iter_json(entries, selected=['title'], chunk_size=3))
+
+    assert len(chunks) == (count + 2) // 3 + 1
+    expected = [{'identifier': str(index), 'title': 'Schrödinger'} for index in range(count)]
+    assert json.loads(''.join(chunks)) == expected
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""Tests for the :mod:`biblary.responses` module."""
+import asyncio
+import io
+
+from django.test import RequestFactory
+import pytest
+
+from biblary.bibliography.storage import AsyncFile
+from biblary.responses import _aiter_content, get_file_response, parse_accept_encoding, parse_range_header
+
+CONTENT = bytes(range(100))
+
+
+@pytest.mark.parametrize(
+    'header, expected', (
+        ('bytes=0-9', [(0, 9)]),
+        ('bytes=90-', [(90, 99)]),
+        ('bytes=-10', [(90, 99)]),
+        ('bytes=-200', [(0, 99)]),
+        ('bytes=95-200', [(95, 99)]),
+        ('bytes=0-0, 10-19', [(0, 0), (10, 19)]),
+        ('bytes=100-', []),
+        ('bytes=-0', []),
+        ('bytes=10-5', None),
+        ('bytes=a-b', None),
+        ('bytes=', None),
+        ('items=0-9', None),
+    )
+)
+def test_parse_range_header(header, expected):
+    """Test the :func:`biblary.responses.parse_range_header` function."""
+    assert parse_range_header(header, len(CONTENT)) == expected
+
+
+@pytest.mark.parametrize(
+    'header, expected', (
+        (None, set()),
+        ('', set()),
+        ('gzip', {'gzip'}),
+        ('GZIP, br;q=0.5', {'gzip', 'br'}),
+        ('x-gzip', {'gzip'}),
+        ('gzip;q=0, *', {'*'}),
+        ('gzip;q=invalid', set()),
+    )
+)
+def test_parse_accept_encoding(header, expected):
+    """Test the :func:`biblary.responses.parse_accept_encoding` function."""
+    assert parse_accept_encoding(header) == expected
+
+
+def get_response(**headers):
+    """Return the response of :func:`biblary.responses.get_file_response` for a request with the given headers."""
+    request = RequestFactory().get('/', **{f'HTTP_{key.upper()}': value for key, value in headers.items()})
+    return get_file_response(request, io.BytesIO(CONTENT), filename='file.pdf', content_type='application/pdf')
+
+
+def test_get_file_response():
+    """Test the :func:`biblary.responses.get_file_response` function without ``Range`` header."""
+    response = get_response()
+    assert response.status_code == 200
+    assert response['Accept-Ranges'] == 'bytes'
+    assert b''.join(response.streaming_content) == CONTENT
+
+
+def test_get_file_response_single_range():
+    """Test the :func:`biblary.responses.get_file_response` function with a single range."""
+    response = get_response(range='bytes=10-19')
+    assert response.status_code == 206
+    assert response['Content-Range'] == 'bytes 10-19/100'
+    assert response['Content-Length'] == '10'
+    assert response['Content-Type'] == 'application/pdf'
+    assert b''.join(response.streaming_content) == CONTENT[10:20]
+
+
+def test_get_file_response_multiple_ranges():
+    """Test the :func:`biblary.responses.get_file_response` function with multiple ranges."""
+    response = get_response(range='bytes=0-4,-5')
+    assert response.status_code == 206
+
+    content_type, _, boundary = response['Content-Type'].partition('; boundary=')
+    assert content_type == 'multipart/byteranges'
+
+    content = b''.join(response.streaming_content)
+    assert int(response['Content-Length']) == len(content)
+    assert content == (
+        f'--{boundary}\r\nContent-Type: application/pdf\r\nContent-Range: bytes 0-4/100\r\n\r\n'.encode() +
+        CONTENT[:5] + b'\r\n' +
+        f'--{boundary}\r\nContent-Type: application/pdf\r\nContent-Range: bytes 95-99/100\r\n\r\n'.encode() +
+        CONTENT[95:] + b'\r\n' + f'--{boundary}--\r\n'.encode()
+    )
+
+
+def test_get_file_response_not_satisfiable():
+    """Test the :func:`biblary.responses.get_file_response` function with an unsatisfiable range."""
+    response = get_response(range='bytes=200-')
+    assert response.status_code == 416
+    assert response['Content-Range'] == 'bytes */100'
+
+
+def test_get_file_response_unranged():
+    """Test the :func:`biblary.responses.get_file_response` function with ``ranges=False``."""
+    request = RequestFactory().get('/', HTTP_RANGE='bytes=10-19')
+    response = get_file_response(request, io.BytesIO(CONTENT), 'file.pdf', 'application/pdf', ranges=False)
+    assert response.status_code == 200
+    assert response['Accept-Ranges'] == 'none'
+    assert not response.has_header('Content-Length')
+    assert response['Content-Disposition'] == 'attachment; filename="file.pdf"'
+    assert b''.join(response.streaming_content) == CONTENT
+
+
+def test_aiter_content():
+    """Test that :func:`biblary.responses._aiter_content` yields the requested parts of an asynchronous stream."""
+
+    async def run_sync(func, *args):
+        return func(*args)
+
+    async def collect(handle):
+        return [block async for block in _aiter_content(handle, [(b'header', 10, 19), (b'', 95, 99)], b'closing')]
+
+    handle = AsyncFile(io.BytesIO(CONTENT), run_sync)
+    blocks = asyncio.run(collect(handle))
+    assert b''.join(blocks) == b'header' + CONTENT[10:20] + b'\r\n' + CONTENT[95:] + b'\r\nclosing'
+    assert handle.raw.closed
@@ -2,10 +2,12 @@
 """Tests for the :mod:`biblary.templatetags` module."""
 import pytest
 
-from biblary.templatetags.authors import main_author_class
+from biblary.bibliography.entry import BibliographyEntry
+from biblary.templatetags.authors import author_key, get_main_author_matcher, main_author_class
+from biblary.templatetags.entries import entry_files
 
 
-@pytest.mark.parametrize('patterns', (('A. Einstein',), (r'.*Einstein',)))
+@pytest.mark.parametrize('patterns', (('A. Einstein',), (r'.*Einstein',), ('N. Bohr', r'(?i)a\. einstein')))
 def test_authors_main_author_class(get_bibliography, patterns):
     """Test the :class:`biblary.templatetags.authors:main_author_class` template tag."""
     with get_bibliography(bibliography_main_author_patterns=patterns):
@@ -21,6 +23,18 @@ def test_authors_main_author_class_raises(get_bibliography, patterns):
             main_author_class('A. Einstein')
 
 
+def test_authors_main_author_class_setting_changed(get_bibliography):
+    """Test the :class:`biblary.templatetags.authors:main_author_class` template tag when the settings change."""
+    with get_bibliography(bibliography_main_author_patterns=('A. Einstein',)):
+        assert main_author_class('A. Einstein') is not None
+        assert main_author_class('N. Bohr') is None
+
+    with get_bibliography(bibliography_main_author_patterns=('N. Bohr',), bibliography_main_author_class='custom'):
+        assert main_author_class('A. Einstein') is None
+        assert main_author_class('N. Bohr') == 'custom'
+        assert get_main_author_matcher() is get_main_author_matcher()
+
+
 def test_authors_main_author_class_custom_class(get_bibliography):
     """Test the :class:`biblary.templatetags.authors:main_author_class` template tag with custom class."""
     patterns = ('A. Einstein',)
@@ -28,3 +42,18 @@ def test_authors_main_author_class_custom_class(get_bibliography):
 
     with get_bibliography(bibliography_main_author_patterns=patterns, bibliography_main_author_class=custom_class):
         assert main_author_class('A. Einstein') == custom_class
+
+
+def test_authors_author_key():
+    """Test the :class:`biblary.templatetags.authors:author_key` template filter."""
+    assert author_key('Schrödinger, Erwin') == 'schrodinger-e'
+
+
+def test_entries_entry_files():
+    """Test the :class:`biblary.templatetags.entries:entry_files` template filter."""
+    entry = BibliographyEntry('article', 'Einstein_1905')
+    files = {'Einstein_1905': {'manuscript': True}}
+
+    assert entry_files(files, entry) == {'manuscript': True}
+    assert entry_files({}, entry) == {}
+    assert entry_files('', entry) == {}
@@ -4,6 +4,7 @@ from django.core.exceptions import ImproperlyConfigured
 import pytest
 
 from biblary.bibliography import Bibliography
+from biblary.bibliography.cache import bibliography_cache
 from biblary.bibliography.storage.file_system import FileSystemStorage
 from biblary.utils import BibliographyMixin
 
@@ -71,3 +72,47 @@ def test_bibliography_mixin_get_bibliography_storage_required(override_settings,
         else:
             bibliography = BibliographyMixin.get_bibliography(storage_required=storage_required)
             assert bibliography.storage is None
+
+
+def test_bibliography_mixin_get_bibliography_cached(override_settings, filepath_bibtex):
+    """Test the :meth:`biblary.views:BiblaryIndexView.get_bibliography` method caches the bibliography."""
+    with override_settings(bibliography_adapter_configuration={'filepath': filepath_bibtex}):
+        bibliography = BibliographyMixin.get_bibliography()
+        hits = bibliography_cache.hits
+        assert BibliographyMixin.get_bibliography() is bibliography
+        assert bibliography_cache.hits == hits + 1
+        uncached = BibliographyMixin.get_bibliography(cached=False)
+        assert uncached is not bibliography
+        assert uncached.adapter is bibliography.adapter
+        assert BibliographyMixin.get_bibliography() is bibliography
+
+        filepath_bibtex.write_text(filepath_bibtex.read_text() + '\n')
+        refreshed = BibliographyMixin.get_bibliography()
+        assert refreshed is not bibliography
+        assert refreshed.adapter is bibliography.adapter
+
+
+def test_bibliography_mixin_get_bibliography_cached_save(override_settings, filepath_bibtex, get_bibliography_entry):
+    """Test the cached bibliography of :meth:`biblary.utils.BibliographyMixin.get_bibliography` is reset by save."""
+    with override_settings(bibliography_adapter_configuration={'filepath': filepath_bibtex}):
+        bibliography = BibliographyMixin.get_bibliography()
+        clone = BibliographyMixin.get_bibliography(cached=False)
+        entry = clone.add_entry(get_bibliography_entry(identifier='Einstein_1906', author=['A. Einstein']))
+        clone.save()
+
+        refreshed = BibliographyMixin.get_bibliography()
+        assert refreshed is not bibliography
+        assert entry in refreshed
+
+
+def test_bibliography_mixin_get_adapter(override_settings, filepath_bibtex):
+    """Test the :meth:`biblary.utils.BibliographyMixin.get_adapter` method reuses the adapter of a stale cache."""
+    with override_settings(bibliography_adapter_configuration={'filepath': filepath_bibtex}):
+        adapter = BibliographyMixin.get_adapter()
+        assert adapter is BibliographyMixin.get_bibliography().adapter
+
+        filepath_bibtex.write_text(filepath_bibtex.read_text() + '\n')
+        assert BibliographyMixin.get_adapter() is adapter
+
+        with pytest.raises(ImproperlyConfigured):
+            BibliographyMixin.get_adapter(storage_required=True)
@@ -1,11 +1,18 @@
 # -*- coding: utf-8 -*-
 """Tests for the :mod:`biblary.views` module."""
+import asyncio
+import gzip
+import json
 import re
+import threading
 
+from django.http import HttpResponse
 from django.urls import reverse
 import pytest
 
+from biblary.bibliography.adapter.bibtex import BibtexBibliography
 from biblary.bibliography.storage import FileType
+from biblary.views import BiblaryBibtexView, BiblaryIndexView
 
 
 def test_biblary_index_get(get_bibliography, client):
@@ -29,6 +36,9 @@ def test_biblary_index_get_with_storage(get_bibliography, client):
         assert 'Biblary' in content
         assert 'biblary-entry-files' in content
 
+        # The existing files are determined per request and not set on the entries of the cached bibliography.
+        assert all('files' not in vars(entry) for entry in BiblaryIndexView.get_bibliography().values())
+
 
 def test_biblary_file_get(get_bibliography, client):
     """Test the :class:`biblary.views:BiblaryFileView` view ``GET`` method."""
@@ -47,11 +57,50 @@ def test_biblary_file_get(get_bibliography, client):
         url = reverse('file', kwargs=url_kwargs)
         response = client.get(url)
         assert response.status_code == 200
-        assert response.content == content
+        assert b''.join(response.streaming_content) == content
         assert response.headers['Content-Type'] == 'application/pdf'
         assert response.headers['Content-Disposition'] == f'attachment; filename="{file_type.value}.pdf"'
 
 
+def test_biblary_file_get_range(get_bibliography, client):
+    """Test the :class:`biblary.views:BiblaryFileView` view ``GET`` method with a ``Range`` header."""
+    with get_bibliography() as bibliography:
+        file_type = FileType.MANUSCRIPT
+        entry = list(bibliography.values())[0]
+        bibliography.storage.put_file(b'some-content', entry, file_type)
+
+        url = reverse('file', kwargs={'file_type': file_type.value, 'identifier': entry.identifier})
+        response = client.get(url, HTTP_RANGE='bytes=5-')
+        assert response.status_code == 206
+        assert response.headers['Content-Range'] == 'bytes 5-11/12'
+        assert b''.join(response.streaming_content) == b'content'
+
+
+@pytest.mark.parametrize(
+    'offload, header, expected', (
+        ('x-accel-redirect', 'X-Accel-Redirect', '/protected/{relative}'),
+        ('x-sendfile', 'X-Sendfile', '{absolute}'),
+    )
+)
+def test_biblary_file_get_offload(get_bibliography, client, override_settings, offload, header, expected):
+    """Test the :class:`biblary.views:BiblaryFileView` view ``GET`` method with file offload configured."""
+    with get_bibliography() as bibliography:
+        file_type = FileType.MANUSCRIPT
+        entry = list(bibliography.values())[0]
+        bibliography.storage.put_file(b'some-content', entry, file_type)
+        filepath = bibliography.storage.get_filepath(entry, file_type)
+        relative = filepath.relative_to(bibliography.storage.filepath).as_posix()
+        url = reverse('file', kwargs={'file_type': file_type.value, 'identifier': entry.identifier})
+
+        with override_settings(file_offload=offload):
+            response = client.get(url)
+
+        assert response.status_code == 200
+        assert response.content == b''
+        assert response.headers[header] == expected.format(relative=relative, absolute=filepath.resolve())
+        assert response.headers['Content-Disposition'] == f'attachment; filename="{file_type.value}.pdf"'
+
+
 @pytest.mark.parametrize(
     'identifier, file_type, status, match', (
         ('Einstein_1905', 'invalid', 400, r'The requested file type `.*` is invalid.'),
@@ -184,3 +233,390 @@ def test_biblary_bibtex(get_bibliography, client):
         assert response.headers['Content-Type'] == 'application/plain'
         assert response.headers['Content-Disposition'] == f'attachment; filename="{entry.identifier}.bib"'
         assert entry.identifier in response.content.decode('utf-8')
+
+
+def test_biblary_bibtex_non_existent(get_bibliography, client):
+    """Test the :class:`biblary.views:BiblaryBibtexView` view ``GET`` method for a non-existent entry."""
+    with get_bibliography():
+        response = client.get(reverse('bibtex', kwargs={'identifier': 'non-existent'}))
+        assert response.status_code == 404
+
+
+def test_biblary_bibtex_without_parse(get_bibliography, client, monkeypatch):
+    """Test the :class:`biblary.views:BiblaryBibtexView` view does not parse the bibliography when it changes."""
+    with get_bibliography() as bibliography:
+        entry = list(bibliography.values())[0]
+        filepath = bibliography.adapter.filepath
+        filepath.write_text(filepath.read_text().replace(entry.title, 'Updated title'))
+
+        def get_entries(*_, **__):
+            raise AssertionError('the bibliography should not have been parsed.')
+
+        monkeypatch.setattr(bibliography.adapter, 'get_entries', get_entries)
+
+        response = client.get(reverse('bibtex', kwargs={'identifier': entry.identifier}))
+        assert response.status_code == 200
+        assert 'Updated title' in response.content.decode('utf-8')
+
+
+def test_biblary_index_get_conditional(get_bibliography, client):
+    """Test the :class:`biblary.views:BiblaryIndexView` view ``GET`` method with ``If-None-Match`` header."""
+    with get_bibliography() as bibliography:
+        url = reverse('index')
+        etag = client.get(url).headers['ETag']
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response.headers['ETag'] == etag
+
+        entry = list(bibliography.values())[0]
+        bibliography.storage.put_file(b'content', entry, FileType.MANUSCRIPT)
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
+
+def test_biblary_bibtex_conditional(get_bibliography, client):
+    """Test the :class:`biblary.views:BiblaryBibtexView` view ``GET`` method with ``If-None-Match`` header."""
+    with get_bibliography() as bibliography:
+        entry = list(bibliography.values())[0]
+        url = reverse('bibtex', kwargs={'identifier': entry.identifier})
+        etag = client.get(url).headers['ETag']
+
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        filepath = bibliography.adapter.filepath
+        filepath.write_text(filepath.read_text() + '\n')
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+def test_biblary_file_get_conditional(get_bibliography, client):
+    """Test the :class:`biblary.views:BiblaryFileView` view ``GET`` method with conditional headers."""
+    with get_bibliography() as bibliography:
+        file_type = FileType.MANUSCRIPT
+        entry = list(bibliography.values())[0]
+        bibliography.storage.put_file(b'some-content', entry, file_type)
+
+        url = reverse('file', kwargs={'file_type': file_type.value, 'identifier': entry.identifier})
+        response = client.get(url)
+        etag = response.headers['ETag']
+        last_modified = response.headers['Last-Modified']
+
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+        assert client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code == 304
+        assert client.get(url, HTTP_RANGE='bytes=5-', HTTP_IF_RANGE=etag).status_code == 206
+        assert client.get(url, HTTP_RANGE='bytes=5-', HTTP_IF_RANGE='"other"').status_code == 200
+
+
+@pytest.mark.parametrize('compression', ('gzip', 'lzma'))
+def test_biblary_file_get_compressed(get_bibliography, client, compression, tmp_path):
+    """Test the :class:`biblary.views:BiblaryFileView` view ``GET`` method for a file stored compressed."""
+    storage_configuration = {'filepath': tmp_path, 'compression': {'manuscript': compression}}
+
+    with get_bibliography(bibliography_storage_configuration=storage_configuration) as bibliography:
+        content = b'some-content' * 10000
+        file_type = FileType.MANUSCRIPT
+        entry = list(bibliography.values())[0]
+        bibliography.storage.put_file(content, entry, file_type)
+        url = reverse('file', kwargs={'file_type': file_type.value, 'identifier': entry.identifier})
+
+        # The file is decompressed while it is streamed, so its length is not known and ranges are not supported.
+        response = client.get(url)
+        assert response.status_code == 200
+        assert b''.join(response.streaming_content) == content
+        assert 'Content-Encoding' not in response.headers
+        assert 'Content-Length' not in response.headers
+        assert response.headers['Accept-Ranges'] == 'none'
+        assert response.headers['Vary'] == 'Accept-Encoding'
+
+        response = client.get(url, HTTP_RANGE='bytes=0-3')
+        assert response.status_code == 200
+        assert b''.join(response.streaming_content) == content
+
+        response_encoded = client.get(url, HTTP_ACCEPT_ENCODING='gzip, deflate')
+        assert response_encoded.status_code == 200
+
+        if compression == 'gzip':
+            compressed = b''.join(response_encoded.streaming_content)
+            assert response_encoded.headers['Content-Encoding'] == 'gzip'
+            assert response_encoded.headers['ETag'] != response.headers['ETag']
+            assert response_encoded.headers['Content-Length'] == str(len(compressed))
+            assert response_encoded.headers['Accept-Ranges'] == 'bytes'
+            assert gzip.decompress(compressed) == content
+        else:
+            assert 'Content-Encoding' not in response_encoded.headers
+            assert 'Content-Length' not in response_encoded.headers
+            assert b''.join(response_encoded.streaming_content) == content
+
+        etag = response.headers['ETag']
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response.headers['Vary'] == 'Accept-Encoding'
+
+
+@pytest.mark.urls('biblary.urls_async')
+def test_async_views(get_bibliography, async_client):
+    """Test the asynchronous variants of the views.
+
+    Note that the headers of a request of the asynchronous client are specified without the ``HTTP_`` prefix.
+    """
+    with get_bibliography() as bibliography:
+        file_type = FileType.MANUSCRIPT
+        entry = list(bibliography.values())[0]
+        bibliography.storage.put_file(b'some-content', entry, file_type)
+
+        async def run():
+            response = await async_client.get(reverse('index'))
+            assert response.status_code == 200
+            assert 'biblary-entry-files' in response.content.decode(response.charset)
+
+            response = await async_client.get(reverse('bibtex', kwargs={'identifier': entry.identifier}))
+            assert response.status_code == 200
+            assert entry.identifier in response.content.decode(response.charset)
+
+            url = reverse('file', kwargs={'file_type': file_type.value, 'identifier': entry.identifier})
+            response = await async_client.get(url, RANGE='bytes=5-')
+            assert response.status_code == 206
+            assert b''.join(response.streaming_content) == b'content'
+
+            response = await async_client.get(url, IF_NONE_MATCH=response.headers['ETag'])
+            assert response.status_code == 304
+
+            url = reverse('file', kwargs={'file_type': 'preprint', 'identifier': entry.identifier})
+            assert (await async_client.get(url)).status_code == 404
+
+        asyncio.run(run())
+
+
+@pytest.mark.parametrize('index_cache', ('default', None))
+def test_biblary_index_get_cached(get_bibliography, client, override_settings, monkeypatch, index_cache):
+    """Test that the :class:`biblary.views:BiblaryIndexView` view caches the rendered index unless disabled."""
+    calls = []
+    get_context_data = BiblaryIndexView.get_context_data
+
+    def counting_get_context_data(self, **kwargs):
+        calls.append(None)
+        return get_context_data(self, **kwargs)
+
+    monkeypatch.setattr(BiblaryIndexView, 'get_context_data', counting_get_context_data)
+
+    with get_bibliography() as bibliography, override_settings(index_cache=index_cache):
+        url = reverse('index')
+        content = client.get(url).content
+        assert client.get(url).content == content
+        assert len(calls) == (1 if index_cache else 2)
+
+        entry = list(bibliography.values())[0]
+        bibliography.storage.put_file(b'content', entry, FileType.MANUSCRIPT)
+        response = client.get(url)
+        assert response.content != content
+        assert len(calls) == (2 if index_cache else 3)
+        assert client.get(url, HTTP_IF_NONE_MATCH=response.headers['ETag']).status_code == 304
+
+
+def test_biblary_index_get_cached_key(get_bibliography, client, override_settings, monkeypatch):
+    """Test that the :class:`biblary.views:BiblaryIndexView` only caches queries with known and valid parameters."""
+    keys = []
+    get_index_cache_key = BiblaryIndexView.get_index_cache_key
+
+    def recording_get_index_cache_key(self, etag, parameters):
+        keys.append(get_index_cache_key(self, etag, parameters))
+        return keys[-1]
+
+    monkeypatch.setattr(BiblaryIndexView, 'get_index_cache_key', recording_get_index_cache_key)
+
+    with get_bibliography(), override_settings(index_cache='default'):
+        url = reverse('index')
+
+        for query in ({'unknown': 'value'}, {'year_from': 1000}, {'entry_type': 'unknown'}, {'page': 'invalid'}):
+            assert client.get(url, query).status_code in (200, 404)
+
+        assert not keys
+
+        for query in ({}, {'page': '01'}, {'page': 1, 'year_from': ''}):
+            assert client.get(url, query).status_code == 200
+
+        assert len(keys) == 3
+        assert len(set(keys)) == 1
+        assert len(keys[0]) < 250
+
+
+@pytest.mark.parametrize(
+    'query, expected, status', (
+        ({}, ['B_1999', 'C_1999', 'Einstein_1905', 'A_1901'], 200),
+        (dict(year_from=1900, year_to=1905), ['Einstein_1905', 'A_1901'], 200),
+        (dict(year_from=1999, year_to=1999), ['B_1999', 'C_1999'], 200),
+        (dict(page_size=2), ['B_1999', 'C_1999'], 200),
+        (dict(page_size=2, page=2), ['Einstein_1905', 'A_1901'], 200),
+        (dict(page_size=1, page=2, year_to=1905), ['A_1901'], 200),
+        (dict(page_size=2, page=3), None, 404),
+        (dict(year_from='invalid'), None, 400),
+    )
+)
+def test_biblary_index_get_paginated(get_bibliography, client, filepath_bibtex, query, expected, status):
+    """Test the :class:`biblary.views:BiblaryIndexView` view ``GET`` method with a year range and pagination."""
+    with filepath_bibtex.open('a') as handle:
+        for identifier in ('B_1999', 'A_1901', 'C_1999'):
+            handle.write(f'\n@article{{{identifier},\n    year = {identifier[-4:]},\n    title = {{Title}}\n}}\n')
+
+    with get_bibliography():
+        response = client.get(reverse('index'), query)
+        assert response.status_code == status
+
+        if expected is not None:
+            content = response.content.decode(response.charset)
+            assert re.findall(r'href="/bibtex/([^"]*)"', content) == expected
+            assert 'year_from=1999&amp;year_to=1999"' in content
+            assert '>1999 <span class="biblary-years-count">(2)</span>' in content
+
+
+@pytest.mark.parametrize('query, expected', (('', []), ('einst', ['Einstein_1905']), ('bohr', [])))
+def test_biblary_search_get(get_bibliography, client, query, expected):
+    """Test the :class:`biblary.views:BiblarySearchView` view ``GET`` method."""
+    with get_bibliography():
+        response = client.get(reverse('search'), {'q': query})
+        content = response.content.decode(response.charset)
+        assert response.status_code == 200
+        assert re.findall(r'href="/bibtex/([^"]*)"', content) == expected
+        assert ('biblary-search-summary' in content) == bool(query)
+
+
+def test_biblary_index_get_facets(get_bibliography, client, filepath_bibtex):
+    """Test the :class:`biblary.views:BiblaryIndexView` view ``GET`` method filtered by facets."""
+    with filepath_bibtex.open('a') as handle:
+        handle.write('\n@book{B_1999,\n    year = 1999,\n    publisher = {Springer},\n    title = {Title}\n}\n')
+        handle.write('\n@article{C_1901,\n    year = 1901,\n    journal = {Nature},\n    title = {Title}\n}\n')
+
+    with get_bibliography():
+        response = client.get(reverse('index'), {'entry_type': 'article', 'year_to': 1950})
+        content = response.content.decode(response.charset)
+        assert response.status_code == 200
+        assert re.findall(r'href="/bibtex/([^"]*)"', content) == ['Einstein_1905', 'C_1901']
+        assert 'href="?year_to=1950">book <span class="biblary-facet-count">(0)' not in content
+        assert 'href="?year_to=1950">article <span class="biblary-facet-count">(2)</span>' in content
+        assert 'href="?entry_type=article&amp;year_from=1901&amp;year_to=1901">1901' in content
+        assert '>1999 <span class="biblary-years-count">' not in content
+
+        response = client.get(reverse('index'), {'entry_type': ['article', 'book'], 'venue': 'Springer'})
+        content = response.content.decode(response.charset)
+        assert re.findall(r'href="/bibtex/([^"]*)"', content) == ['B_1999']
+
+
+def test_biblary_author_get(get_bibliography, client):
+    """Test the :class:`biblary.views:BiblaryAuthorView` view ``GET`` method."""
+    with get_bibliography():
+        response = client.get(reverse('index'))
+        assert '<a href="/author/einstein-a">A. Einstein</a>' in response.content.decode(response.charset)
+
+        response = client.get(reverse('author', args=('einstein-a',)))
+        content = response.content.decode(response.charset)
+        assert response.status_code == 200
+        assert '<h1 class="biblary-header">A. Einstein</h1>' in content
+        assert re.findall(r'href="/bibtex/([^"]*)"', content) == ['Einstein_1905']
+
+        response = client.get(reverse('author', args=('einstein-a',)), HTTP_IF_NONE_MATCH=response['ETag'])
+        assert response.status_code == 304
+
+        response = client.get(reverse('author', args=('bohr-n',)))
+        assert response.status_code == 404
+
+
+def test_biblary_json_get(get_bibliography, client, filepath_bibtex):
+    """Test the :class:`biblary.views:BiblaryJsonView` view ``GET`` method."""
+    with filepath_bibtex.open('a') as handle:
+        handle.write('\n@book{B_1999,\n    year = 1999,\n    publisher = {Springer},\n    title = {Title}\n}\n')
+
+    with get_bibliography():
+        response = client.get(reverse('json'))
+        assert response.status_code == 200
+        assert response.streaming
+        assert response['Content-Type'] == 'application/json'
+        entries = json.loads(b''.join(response.streaming_content))
+        assert [entry['identifier'] for entry in entries] == ['B_1999', 'Einstein_1905']
+        assert entries[1]['author'] == ['A. Einstein']
+
+        response = client.get(reverse('json'), HTTP_IF_NONE_MATCH=response['ETag'])
+        assert response.status_code == 304
+
+        response = client.get(reverse('json'), {'entry_type': 'article', 'fields': 'title,year'})
+        assert json.loads(b''.join(response.streaming_content)) == [{
+            'identifier': 'Einstein_1905',
+            'title': 'Über einen die Erzeugung und Verwandlung des Lichtes betreffenden heuristischen Gesichtspunkt',
+            'year': '1905',
+        }]
+
+        response = client.get(reverse('json'), {'year_to': 1950, 'fields': ['doi']})
+        expected = {'identifier': 'Einstein_1905', 'doi': '10.1002/andp.19053220607'}
+        assert json.loads(b''.join(response.streaming_content)) == [expected]
+
+        response = client.get(reverse('json'), {'fields': 'title,invalid'})
+        assert response.status_code == 400
+
+
+def test_biblary_csl_json_get(get_bibliography, client):
+    """Test the :class:`biblary.views:BiblaryJsonView` view ``GET`` method for the CSL-JSON format."""
+    with get_bibliography():
+        response = client.get(reverse('csl-json'), {'fields': 'author,year,entry_type'})
+        assert response.status_code == 200
+        assert response['Content-Type'] == 'application/vnd.citationstyles.csl+json'
+        author = {'family': 'Einstein', 'given': 'A.'}
+        issued = {'date-parts': [[1905]]}
+        assert json.loads(b''.join(response.streaming_content)) == [{
+            'id': 'Einstein_1905',
+            'type': 'article-journal',
+            'author': [author],
+            'issued': issued,
+        }]
+
+
+def test_biblary_export_get(get_bibliography, client, filepath_bibtex):
+    """Test the :class:`biblary.views:BiblaryExportView` view ``GET`` method."""
+    with filepath_bibtex.open('a') as handle:
+        handle.write('\n@book{B_1999,\n    year = 1999,\n    publisher = {Springer},\n    title = {Title}\n}\n')
+
+    with get_bibliography() as bibliography:
+        response = client.get(reverse('export'))
+        content = b''.join(response.streaming_content).decode('utf-8')
+        assert response.status_code == 200
+        assert response.streaming
+        assert response['Content-Disposition'] == 'attachment; filename="bibliography.bib"'
+        assert not response.has_header('Content-Encoding')
+        assert response['Vary'] == 'Accept-Encoding'
+        assert re.findall(r'^@\w+{(\w+),', content, re.MULTILINE) == ['B_1999', 'Einstein_1905']
+        assert BibtexBibliography.parse_entry(content.split('\n\n')[1]) == bibliography['Einstein_1905']
+
+        response = client.get(reverse('export'), {'entry_type': 'article'}, HTTP_ACCEPT_ENCODING='gzip, deflate')
+        assert response['Content-Encoding'] == 'gzip'
+        assert response['ETag'].endswith('-gzip"')
+        content = gzip.decompress(b''.join(response.streaming_content)).decode('utf-8')
+        assert re.findall(r'^@\w+{(\w+),', content, re.MULTILINE) == ['Einstein_1905']
+
+        response = client.get(reverse('export'), HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=response['ETag'])
+        assert response.status_code == 304
+
+        response = client.get(reverse('export'), HTTP_IF_NONE_MATCH=response['ETag'])
+        assert response.status_code == 200
+
+
+@pytest.mark.urls('biblary.urls_async')
+def test_async_views_concurrent(get_bibliography, async_client, monkeypatch):
+    """Test that the asynchronous variants of the views handle concurrent requests concurrently.
+
+    The synchronous handler of each request waits for the other one, which only succeeds if they run in separate
+    threads.
+    """
+    barrier = threading.Barrier(2, timeout=5)
+
+    def get(self, request, *args, **kwargs):  # pylint: disable=unused-argument
+        barrier.wait()
+        return HttpResponse(b'content')
+
+    monkeypatch.setattr(BiblaryBibtexView, 'get', get)
+
+    with get_bibliography() as bibliography:
+        url = reverse('bibtex', kwargs={'identifier': list(bibliography)[0]})
+
+        async def run():
+            return await asyncio.gather(async_client.get(url), async_client.get(url))
+
+        assert [response.status_code for response in asyncio.run(run())] == [200, 200]